@@ -1,28 +1,193 @@
+from array import array
+
 from src.core.Board.move_generator import MoveGenerator
-from src.agent.evaluation import evaluate_board
-import random
-import time
+from src.core.Board.move import (
+    Move,
+    NULL_MOVE_VALUE,
+    PROMOTION_VALUE,
+    START_SQUARE_MASK,
+    TARGET_SQUARE_SHIFT,
+)
+from src.core.Board.piece import NONE, PAWN, QUEEN, KING, piece_type
+from src.agent.evaluation import evaluate_board, PIECE_VALUES
+from src.agent.transposition_table import TranspositionTable
+from src.agent.pawn_hash_table import PawnHashTable
+from src.agent.move_ordering import MoveOrderer
+from src.agent.time_manager import TimeManager
+import math
 import sys
 
+# Score of a checkmate at the root; mates further away score less
+MATE_SCORE = 1000000
+MATE_THRESHOLD = MATE_SCORE - 1000
+
+# Quiescence delta pruning: a capture is skipped if winning the captured
+# piece plus this margin still cannot raise the score to alpha
+DELTA_MARGIN = 2 * PIECE_VALUES[PAWN]
+
+# Principal variation search: moves after the first are searched with a
+# window this wide around alpha. Scores are fractional (a pawn is 10), so it
+# is narrower than any real evaluation difference. Whether a node is a PV
+# node is passed down explicitly (pv_node) rather than derived from the
+# window width, which float rounding makes unreliable.
+NULL_WINDOW = 0.01
+
+# Root aspiration windows: from ASPIRATION_MIN_DEPTH on, an iteration first
+# searches within ASPIRATION_WINDOW of the previous score. On a fail the
+# window grows by ASPIRATION_GROWTH, and opens fully past ASPIRATION_MAX_WINDOW.
+ASPIRATION_MIN_DEPTH = 3
+ASPIRATION_WINDOW = 5
+ASPIRATION_GROWTH = 4
+ASPIRATION_MAX_WINDOW = 100
+
+# Null-move pruning: give the opponent a free move and search with the depth
+# reduced by R (NULL_MOVE_REDUCTION, plus one from NULL_MOVE_ADAPTIVE_DEPTH).
+# If that still fails high, the node is cut. Skipped in check and when few
+# pieces remain (total_piece_count_without_pawns_and_kings below
+# NULL_MOVE_MIN_PIECES, or none for the side to move), where passing could
+# be an advantage (zugzwang).
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_ADAPTIVE_DEPTH = 6
+NULL_MOVE_MIN_PIECES = 2
+# From this depth a null-move cutoff is only taken after a verification
+# search (the reduced search without the null move) also fails high
+NULL_MOVE_VERIFICATION_DEPTH = 5
+
+# Late move reductions: quiet moves searched after the first
+# LMR_MIN_MOVE_INDEX moves of a node with depth >= LMR_MIN_DEPTH are first
+# searched with a null window at a depth reduced by
+# LMR_BASE + ln(depth) * ln(move index) / LMR_DIVISOR (one less in PV
+# nodes). A reduced search that beats alpha is repeated at full depth.
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVE_INDEX = 3
+LMR_BASE = 0.75
+LMR_DIVISOR = 2.25
+LMR_MAX_DEPTH = 64
+LMR_MAX_MOVES = 64
+
+# Futility pruning: at depth <= len(FUTILITY_MARGINS), once one move has
+# been searched, quiet moves that do not give check are skipped if the
+# static evaluation plus FUTILITY_MARGINS[depth - 1] cannot reach alpha
+FUTILITY_MARGINS = (20, 35, 50)
+
+# Reverse futility pruning: at depth <= REVERSE_FUTILITY_MAX_DEPTH in a
+# null-window node, return the static evaluation if it beats beta by
+# REVERSE_FUTILITY_MARGIN per ply of depth
+REVERSE_FUTILITY_MAX_DEPTH = 3
+REVERSE_FUTILITY_MARGIN = 12
+
+
+def _build_lmr_table():
+    table = []
+    for depth in range(LMR_MAX_DEPTH):
+        row = [0] * LMR_MAX_MOVES
+        for move_index in range(1, LMR_MAX_MOVES):
+            if depth > 0:
+                row[move_index] = int(
+                    LMR_BASE + math.log(depth) * math.log(move_index) / LMR_DIVISOR
+                )
+        table.append(row)
+    return table
+
+
+# LMR_TABLE[depth][move index]: reduction in plies
+LMR_TABLE = _build_lmr_table()
+
+# Deepest ply (from the root, including quiescence) with a reusable move buffer
+MAX_PLY = 128
+
 
 class AlphaBetaAgent:
     """
     Chess agent using Alpha-Beta Pruning + Negamax algorithm
     """
 
-    def __init__(self, max_depth=4, time_limit=None):
+    def __init__(
+        self,
+        max_depth=4,
+        time_limit=None,
+        tt_size_mb=16,
+        random_tie_break=True,
+        pseudo_legal=False,
+        use_pvs=True,
+        use_aspiration=True,
+        use_null_move=True,
+        null_move_verification_depth=NULL_MOVE_VERIFICATION_DEPTH,
+        use_lmr=True,
+        use_futility=True,
+        use_reverse_futility=True,
+        use_see=True,
+        progress_callback=None,
+        verbose=False,
+    ):
         """
         Initialize the Alpha-Beta agent
 
         Parameters:
         - max_depth: Maximum search depth
-        - time_limit: Maximum time in seconds to spend searching
+        - time_limit: Maximum time in seconds to spend searching per move
+          (see set_clock to allocate time from a game clock instead)
+        - tt_size_mb: Memory budget of the transposition table in megabytes
+        - random_tie_break: Search equally ranked moves in random order
+        - pseudo_legal: Below the root, generate pseudo-legal moves and test
+          legality after making each move, instead of generating legal moves
+        - use_pvs: Search moves after the first with a null window (PVS)
+        - use_aspiration: Start each root iteration with an aspiration window
+        - use_null_move: Enable null-move pruning
+        - null_move_verification_depth: Depth from which null-move cutoffs are
+          verified, or None to never verify
+        - use_lmr: Enable late move reductions
+        - use_futility: Enable futility pruning of quiet moves near the leaves
+        - use_reverse_futility: Enable reverse futility (static null move) pruning
+        - use_see: Order captures by static exchange evaluation and skip
+          losing captures in quiescence search
+        - progress_callback: Called after each completed iteration with
+          (depth, best move, score, nodes evaluated, elapsed seconds)
+        - verbose: Print each completed iteration and the search statistics
         """
         self.max_depth = max_depth
         self.time_limit = time_limit
-        self.start_time = 0
+        self.progress_callback = progress_callback
+        self.verbose = verbose
+        # Soft/hard time budgets, polled every few nodes during the search
+        self.time_manager = TimeManager()
+        self.time_manager.set_move_time(time_limit)
         self.nodes_evaluated = 0
-        self.transposition_table = {}  # Cache for positions already evaluated
+        # Static evaluations at interior nodes for the futility decisions,
+        # counted apart from nodes_evaluated so node counts stay comparable
+        self.static_evals = 0
+        self.root_ply = 0
+        # Repetition counts of the game up to and including the root, so the
+        # search can tell repeats on its own path from repeats of the game
+        self.game_repetition_counts = {}
+        # Repetition draws returned so far; a node whose subtree returned one
+        # has a score that depends on the path and is not stored in the TT
+        self.repetition_draws = 0
+        self.original_color = 1
+        self.pseudo_legal = pseudo_legal
+        self.use_pvs = use_pvs
+        self.use_aspiration = use_aspiration
+        self.use_null_move = use_null_move
+        self.null_move_verification_depth = null_move_verification_depth
+        self.use_lmr = use_lmr
+        self.use_futility = use_futility
+        self.use_reverse_futility = use_reverse_futility
+        # Set just before searching a node where a null move must not be
+        # tried (right after a null move, and for verification searches)
+        self.skip_null_move = False
+        # Nodes evaluated when each iteration of the last search completed
+        self.iteration_nodes = []
+        # Statistics of the last search (see choose_move)
+        self.stats = {}
+        # Cache for positions already evaluated, kept across moves of a game
+        self.transposition_table = TranspositionTable(tt_size_mb)
+        self.use_see = use_see
+        self.move_orderer = MoveOrderer(random_tie_break=random_tie_break, use_see=use_see)
+        # Pawn structure scores, keyed by the board's pawn key
+        self.pawn_hash_table = PawnHashTable()
+        # One packed move buffer per ply, reused by every node at that ply
+        self.move_buffers = [array("H") for _ in range(MAX_PLY)]
 
     def choose_move(self, board):
         """
@@ -34,27 +199,32 @@ class AlphaBetaAgent:
         Returns:
         - best_move: The best move found
         """
-        self.start_time = time.time()
+        time_manager = self.time_manager
+        time_manager.start()
         self.nodes_evaluated = 0
-        self.transposition_table = {}
+        self.static_evals = 0
+        self.root_ply = board.ply_count
+        self.game_repetition_counts = dict(board.repetition_counts)
+        self.transposition_table.new_search()
+        self.move_orderer.new_search()
+        self.pawn_hash_table.reset_stats()
+        self.skip_null_move = False
 
         move_generator = MoveGenerator(board)
 
-        legal_moves = move_generator.generate_legal_moves()
+        legal_moves = move_generator.generate_moves()
 
         if not legal_moves:
             return None
 
-        # For randomness in equal positions, shuffle moves before searching
-        random.shuffle(legal_moves)
+        # Order root moves, starting with the move remembered for this position
+        tt_move = self.transposition_table.get_move(self._get_position_key(board))
+        legal_moves = self.move_orderer.order_moves(board, legal_moves, tt_move, 0)
 
-        # Best move found and its score
+        # Best move and score of the last completed iteration
         best_move = None
         best_score = -sys.maxsize
-
-        # Alpha-beta bounds
-        alpha = -sys.maxsize
-        beta = sys.maxsize
+        self.iteration_nodes = []
 
         # Color factor (1 for white, -1 for black)
         color_factor = 1 if board.is_white_to_move else -1
@@ -62,50 +232,167 @@ class AlphaBetaAgent:
 
         # Iterative deepening
         for current_depth in range(1, self.max_depth + 1):
-            if self.time_limit and time.time() - self.start_time > self.time_limit:
-                break
+            # Aspiration window around the previous iteration's score
+            window = ASPIRATION_WINDOW
+            if (
+                self.use_aspiration
+                and current_depth >= ASPIRATION_MIN_DEPTH
+                and abs(best_score) < MATE_THRESHOLD
+            ):
+                alpha = best_score - window
+                beta = best_score + window
+            else:
+                alpha = -sys.maxsize
+                beta = sys.maxsize
 
-            # Search each move
-            for move in legal_moves:
-                # Try to make the move - if it returns False, skip it
-                move_result = board.make_move(move, in_search=True)
-                if move_result is False:
-                    # This move was rejected (likely a king capture) - skip it
-                    continue
+            while True:
+                score, move = self._search_root(
+                    board, legal_moves, current_depth, alpha, beta, color_factor
+                )
+                if time_manager.stopped:
+                    break
+                # Widen the side of the window the score fell outside of
+                # and search again; give up on the window once it is large
+                window *= ASPIRATION_GROWTH
+                if score <= alpha and alpha > -sys.maxsize:
+                    alpha = score - window if window <= ASPIRATION_MAX_WINDOW else -sys.maxsize
+                elif score >= beta and beta < sys.maxsize:
+                    beta = score + window if window <= ASPIRATION_MAX_WINDOW else sys.maxsize
+                else:
+                    break
+
+            # An unfinished iteration is discarded
+            if time_manager.stopped:
+                break
 
-                # Search from this position
-                score = -self._alpha_beta(
-                    board, current_depth - 1, -beta, -alpha, -color_factor
+            best_move = move
+            best_score = score
+            self.iteration_nodes.append(self.nodes_evaluated)
+            if self.verbose:
+                print(
+                    f"Depth {current_depth} completed. Best move: {Move.from_value(best_move)} with score: {best_score}"
+                )
+            if self.progress_callback:
+                self.progress_callback(
+                    current_depth,
+                    Move.from_value(best_move),
+                    best_score,
+                    self.nodes_evaluated,
+                    time_manager.elapsed(),
                 )
 
-                board.unmake_move(move, in_search=True)
+            # Search the best move first in the next iteration
+            legal_moves.remove(best_move)
+            legal_moves.insert(0, best_move)
 
-                # Check if time limit exceeded
-                if self.time_limit and time.time() - self.start_time > self.time_limit:
-                    break
+            # Past the soft limit (scaled by best move stability) the next
+            # iteration is unlikely to finish
+            if time_manager.iteration_completed(best_move):
+                break
 
-                # Update best move if found a better one
-                if score > best_score:
-                    best_score = score
-                    best_move = move
+        if best_move is None:
+            # Not even depth 1 finished in time: play the best ordered move
+            best_move = legal_moves[0]
+
+        self.stats = {
+            "depth": len(self.iteration_nodes),
+            "nodes_evaluated": self.nodes_evaluated,
+            "static_evals": self.static_evals,
+            "tt_hit_rate": self.transposition_table.hit_rate(),
+            "pawn_hash_hit_rate": self.pawn_hash_table.hit_rate(),
+            "time": time_manager.elapsed(),
+        }
+        if self.verbose:
+            print(f"Nodes evaluated: {self.nodes_evaluated}")
+            print(f"Interior static evaluations: {self.static_evals}")
+            print(f"TT hit rate: {self.stats['tt_hit_rate']:.1%}")
+            print(f"Pawn hash hit rate: {self.stats['pawn_hash_hit_rate']:.1%}")
+            print(f"Time spent: {self.stats['time']:.2f} seconds")
+
+        return Move.from_value(best_move)
+
+    def _search_root(self, board, moves, depth, alpha, beta, color_factor):
+        """
+        Search the root moves with principal variation search
+
+        Parameters:
+        - board: Current board state
+        - moves: Packed root moves, best candidate first
+        - depth: Search depth
+        - alpha, beta: Root window (an aspiration window or the full range)
+        - color_factor: 1 for white perspective, -1 for black perspective
 
-                # Update alpha
-                alpha = max(alpha, score)
+        Returns:
+        - (best_score, best_move): fails high at the first move scoring
+          beta or more; on a fail low every move scored alpha or less
+        """
+        best_score = -sys.maxsize
+        best_move = moves[0]
 
-            print(
-                f"Depth {current_depth} completed. Best move: {best_move} with score: {best_score}"
+        for index, move in enumerate(moves):
+            board.make_move(move, in_search=True)
+            score = self._search_child(
+                board, depth - 1, alpha, beta, color_factor, index, True
             )
+            board.unmake_move(move, in_search=True)
+
+            if self.time_manager.stopped:
+                break
 
-            # Time limit exceeded
-            if self.time_limit and time.time() - self.start_time > self.time_limit:
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
                 break
 
-        print(f"Nodes evaluated: {self.nodes_evaluated}")
-        print(f"Time spent: {time.time() - self.start_time:.2f} seconds")
+        return best_score, best_move
 
-        return best_move
+    def _search_child(self, board, depth, alpha, beta, color_factor, move_index, pv_node):
+        """
+        Score of the move just made, from the mover's side. With PVS the
+        first move gets the full window and later moves a null window that
+        only proves they are no better than alpha; in a PV node, a move that
+        fails high on the null window is searched again with the full window.
+        Only children searched with the full window of a PV node are PV nodes.
+        """
+        if move_index == 0 or not self.use_pvs:
+            return -self._alpha_beta(board, depth, -beta, -alpha, -color_factor, pv_node)
+        score = -self._alpha_beta(
+            board, depth, -alpha - NULL_WINDOW, -alpha, -color_factor, False
+        )
+        if pv_node and alpha < score < beta:
+            score = -self._alpha_beta(board, depth, -beta, -alpha, -color_factor, True)
+        return score
+
+    def _search_reduced(self, board, depth, alpha, beta, color_factor, move_index, pv_node):
+        """
+        Late move reduction: search the quiet move just made with a null
+        window at reduced depth, and at full depth only if it beats alpha
+        """
+        reduction = LMR_TABLE[min(depth, LMR_MAX_DEPTH - 1)][
+            min(move_index, LMR_MAX_MOVES - 1)
+        ]
+        if pv_node:
+            reduction -= 1
+        # Always leave at least one ply before quiescence
+        reduction = min(reduction, depth - 2)
+        if reduction > 0:
+            score = -self._alpha_beta(
+                board,
+                depth - 1 - reduction,
+                -alpha - NULL_WINDOW,
+                -alpha,
+                -color_factor,
+                False,
+            )
+            if score <= alpha:
+                return score
+        return self._search_child(
+            board, depth - 1, alpha, beta, color_factor, move_index, pv_node
+        )
 
-    def _alpha_beta(self, board, depth, alpha, beta, color_factor):
+    def _alpha_beta(self, board, depth, alpha, beta, color_factor, pv_node=True):
         """
         Alpha-Beta pruning search algorithm
 
@@ -115,73 +402,339 @@ class AlphaBetaAgent:
         - alpha: Alpha value for pruning
         - beta: Beta value for pruning
         - color_factor: 1 for white perspective, -1 for black perspective
+        - pv_node: False for nodes searched with a null window
 
         Returns:
         - score: The best score found from this position
         """
-        # Check if time limit exceeded
-        if self.time_limit and time.time() - self.start_time > self.time_limit:
+        # Poll the clock; once the hard limit is reached every node returns
+        # at once and callers discard the score
+        if self.time_manager.tick():
             return 0
 
+        allow_null_move = not self.skip_null_move
+        self.skip_null_move = False
+
+        # A position that repeats one after the root on the search path, or
+        # occurs for the third time counting the game, is a draw: the side
+        # that wants more can deviate, and otherwise the same moves lead back
+        # to it. Checked before the TT probe, so that a score stored for the
+        # position from another path cannot hide the draw.
+        repetitions = board.repetition_count()
+        if repetitions > 1 and (
+            repetitions >= 3
+            or repetitions - self.game_repetition_counts.get(board.zobrist_key, 0) >= 2
+        ):
+            self.repetition_draws += 1
+            return 0
+        repetition_draws = self.repetition_draws
+
         # Generate a hash key for the board position
         position_key = self._get_position_key(board)
+        ply = board.ply_count - self.root_ply
+        original_alpha = alpha
 
         # Check transposition table
-        if (
-            position_key in self.transposition_table
-            and self.transposition_table[position_key]["depth"] >= depth
-        ):
-            return self.transposition_table[position_key]["score"]
-
-        # Leaf node (terminal position or max depth reached)
+        entry = self.transposition_table.probe(position_key)
+        tt_move = NULL_MOVE_VALUE
+        if entry is not None:
+            entry_depth, entry_bound, entry_score, tt_move = entry
+            if entry_depth >= depth:
+                entry_score = self._score_from_tt(entry_score, ply)
+                if entry_bound == TranspositionTable.EXACT:
+                    return entry_score
+                if entry_bound == TranspositionTable.LOWER_BOUND and entry_score >= beta:
+                    return entry_score
+                if entry_bound == TranspositionTable.UPPER_BOUND and entry_score <= alpha:
+                    return entry_score
+
+        # Leaf node (max depth reached): resolve captures before evaluating
         if depth == 0:
-            self.nodes_evaluated += 1
-            evaluate_score = color_factor * (evaluate_board(board) - self.original_color*board.fifty_move_counter*5)
-            return evaluate_score
+            return self._quiescence(board, alpha, beta, color_factor)
 
-        move_generator = MoveGenerator(board)
-        legal_moves = move_generator.generate_legal_moves()
+        in_check = board.is_in_check()
+        # Pruning near the leaves, driven by the static evaluation. Not used
+        # in check or when mate scores are involved.
+        futile = False
+        if (
+            not in_check
+            and abs(alpha) < MATE_THRESHOLD
+            and abs(beta) < MATE_THRESHOLD
+        ):
+            static_eval = None
+            if (
+                self.use_reverse_futility
+                and not pv_node
+                and depth <= REVERSE_FUTILITY_MAX_DEPTH
+            ):
+                static_eval = self._interior_eval(board, color_factor)
+                if static_eval - REVERSE_FUTILITY_MARGIN * depth >= beta:
+                    return static_eval
+            if self.use_futility and depth <= len(FUTILITY_MARGINS):
+                if static_eval is None:
+                    static_eval = self._interior_eval(board, color_factor)
+                # Quiet moves are not expected to raise the score to alpha
+                futile = static_eval + FUTILITY_MARGINS[depth - 1] <= alpha
 
-        # No legal moves - check for checkmate or stalemate
-        if not legal_moves:
-            if board.is_in_check():
-                # Checkmate (worst possible score, adjusted for search depth for quicker mates)
-                return -1000000 + (self.max_depth - depth)
-            else:
-                # Stalemate (draw)
-                return 0
+        if (
+            allow_null_move
+            and self.use_null_move
+            and depth >= NULL_MOVE_MIN_DEPTH
+            and beta < MATE_THRESHOLD
+            and self._null_move_allowed(board)
+        ):
+            null_score = self._null_move_search(board, depth, beta, color_factor)
+            if null_score is not None:
+                return null_score
+
+        # Moves are generated lazily in stages (TT move, captures, killers,
+        # quiets), so a cutoff skips generating the remaining stages
+        pseudo_legal = self.pseudo_legal
+        moves = self.move_orderer.staged_moves(
+            board,
+            MoveGenerator(board),
+            self._move_buffer(ply),
+            tt_move,
+            ply,
+            pseudo_legal,
+        )
 
         # Initialize best score
         best_score = -sys.maxsize
+        best_move = NULL_MOVE_VALUE
+        searched_moves = 0
+        use_lmr = self.use_lmr and depth >= LMR_MIN_DEPTH and not in_check
+        killers = self.move_orderer.killers[ply] if ply < self.move_orderer.max_ply else ()
 
         # Search all moves
-        for move in legal_moves:
-            # Try to make the move - if it returns False, skip it
-            move_result = board.make_move(move, in_search=True)
-            if move_result is False:
-                # This move was rejected (likely a king capture) - skip it
+        for move in moves:
+            # Only quiet moves are reduced or pruned
+            quiet = (futile or use_lmr) and MoveOrderer.is_quiet(board, move)
+
+            board.make_move(move, in_search=True)
+            # Pseudo-legal moves are only tested once they are made
+            if pseudo_legal and board.is_mover_in_check():
+                board.unmake_move(move, in_search=True)
+                continue
+
+            quiet = quiet and not board.is_in_check()
+            if futile and quiet and searched_moves > 0:
+                board.unmake_move(move, in_search=True)
                 continue
 
-            # Recursively search
-            score = -self._alpha_beta(board, depth - 1, -beta, -alpha, -color_factor)
+            if (
+                use_lmr
+                and quiet
+                and searched_moves >= LMR_MIN_MOVE_INDEX
+                and move not in killers
+            ):
+                score = self._search_reduced(
+                    board, depth, alpha, beta, color_factor, searched_moves, pv_node
+                )
+            else:
+                # Recursively search (principal variation search)
+                score = self._search_child(
+                    board, depth - 1, alpha, beta, color_factor, searched_moves, pv_node
+                )
+            searched_moves += 1
 
             board.unmake_move(move, in_search=True)
 
-            # Check if time limit exceeded
-            if self.time_limit and time.time() - self.start_time > self.time_limit:
+            # The search was aborted: the score is not real
+            if self.time_manager.stopped:
                 return 0
 
-            best_score = max(best_score, score)
+            if score > best_score:
+                best_score = score
+                best_move = move
 
             # Alpha-beta pruning
             alpha = max(alpha, score)
             if alpha >= beta:
+                self.move_orderer.record_cutoff(board, move, depth, ply)
                 break
 
-        self.transposition_table[position_key] = {"score": best_score, "depth": depth}
+        # No legal moves - check for checkmate or stalemate
+        if searched_moves == 0:
+            if board.is_in_check():
+                # Checkmate (worst possible score, adjusted by distance from the root for quicker mates)
+                return -MATE_SCORE + ply
+            else:
+                # Stalemate (draw)
+                return 0
+
+        # A repetition draw below this node depends on how it was reached
+        if self.repetition_draws == repetition_draws:
+            if best_score <= original_alpha:
+                bound = TranspositionTable.UPPER_BOUND
+            elif best_score >= beta:
+                bound = TranspositionTable.LOWER_BOUND
+            else:
+                bound = TranspositionTable.EXACT
+            self.transposition_table.store(
+                position_key, depth, bound, self._score_to_tt(best_score, ply), best_move
+            )
+
+        return best_score
+
+    def _null_move_allowed(self, board):
+        """Null-move guards: not in check, and not a likely zugzwang position"""
+        if board.total_piece_count_without_pawns_and_kings < NULL_MOVE_MIN_PIECES:
+            return False
+        us = board.move_colour_index
+        colour = board.move_colour
+        pieces = board.piece_bitboards
+        if not board.colour_bitboards[us] & ~(pieces[PAWN | colour] | pieces[KING | colour]):
+            return False
+        return not board.is_in_check()
+
+    def _null_move_search(self, board, depth, beta, color_factor):
+        """
+        Pass the move and search the opponent's reply with reduced depth.
+        Returns a score to cut the node with, or None to search it normally.
+        """
+        reduction = NULL_MOVE_REDUCTION + (depth >= NULL_MOVE_ADAPTIVE_DEPTH)
+        reduced_depth = max(0, depth - 1 - reduction)
+
+        board.make_null_move()
+        self.skip_null_move = True
+        score = -self._alpha_beta(
+            board, reduced_depth, -beta, -beta + NULL_WINDOW, -color_factor, False
+        )
+        board.unmake_null_move()
+
+        if score < beta or self.time_manager.stopped:
+            return None
+        # Mates found after passing are not real
+        if score >= MATE_THRESHOLD:
+            score = beta
+
+        verification_depth = self.null_move_verification_depth
+        if verification_depth is not None and depth >= verification_depth:
+            self.skip_null_move = True
+            verified = self._alpha_beta(
+                board, depth - reduction, beta - NULL_WINDOW, beta, color_factor, False
+            )
+            if verified < beta:
+                return None
+        return score
+
+    def _evaluate(self, board, color_factor):
+        """Static evaluation of a leaf from the perspective of the side to move"""
+        self.nodes_evaluated += 1
+        return self._static_eval(board, color_factor)
+
+    def _interior_eval(self, board, color_factor):
+        """Static evaluation of an interior node, for the pruning decisions"""
+        self.static_evals += 1
+        return self._static_eval(board, color_factor)
+
+    def _static_eval(self, board, color_factor):
+        """Static evaluation from the perspective of the side to move"""
+        return color_factor * (evaluate_board(board, self.pawn_hash_table) - self.original_color*board.fifty_move_counter*5)
+
+    def _quiescence(self, board, alpha, beta, color_factor):
+        """
+        Quiescence search: extend leaf nodes through captures and promotions
+        so the static evaluation is only taken in quiet positions
+
+        Parameters:
+        - board: Current board state
+        - alpha: Alpha value for pruning
+        - beta: Beta value for pruning
+        - color_factor: 1 for white perspective, -1 for black perspective
+
+        Returns:
+        - score: The best score found from this position
+        """
+        if self.time_manager.tick():
+            return 0
+
+        move_generator = MoveGenerator(board)
+        in_check = board.is_in_check()
+        ply = board.ply_count - self.root_ply
+        move_buffer = self._move_buffer(ply)
+
+        if in_check:
+            # No stand-pat when in check: every evasion has to be searched
+            moves = move_generator.generate_moves(move_buffer)
+            if not moves:
+                return -MATE_SCORE + ply
+            best_score = -sys.maxsize
+        else:
+            # Stand pat: the side to move can usually do at least as well as
+            # the static evaluation by not capturing
+            best_score = self._evaluate(board, color_factor)
+            if best_score >= beta:
+                return best_score
+
+            # Big delta: not even winning a queen would reach alpha
+            if best_score + PIECE_VALUES[QUEEN] + DELTA_MARGIN < alpha:
+                return best_score
+
+            alpha = max(alpha, best_score)
+            moves = move_generator.generate_moves(
+                move_buffer, captures_only=True, pseudo_legal=self.pseudo_legal
+            )
+
+        if in_check:
+            moves = self.move_orderer.order_moves(board, moves)
+        else:
+            # Captures that lose material by SEE are not searched
+            moves, _ = self.move_orderer.order_captures(board, moves)
+
+        for move in moves:
+            # Delta pruning for captures that cannot raise the score to alpha
+            if not in_check and move < PROMOTION_VALUE:
+                victim = board.square[(move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK]
+                victim_value = (
+                    PIECE_VALUES[piece_type(victim)] if victim != NONE else PIECE_VALUES[PAWN]
+                )
+                if best_score + victim_value + DELTA_MARGIN <= alpha:
+                    continue
+
+            board.make_move(move, in_search=True)
+            if self.pseudo_legal and board.is_mover_in_check():
+                board.unmake_move(move, in_search=True)
+                continue
+            score = -self._quiescence(board, -beta, -alpha, -color_factor)
+            board.unmake_move(move, in_search=True)
+            if self.time_manager.stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
 
         return best_score
 
+    def _move_buffer(self, ply):
+        """Reusable move buffer for 'ply', or a fresh one beyond MAX_PLY"""
+        if 0 <= ply < MAX_PLY:
+            return self.move_buffers[ply]
+        return array("H")
+
+    @staticmethod
+    def _score_to_tt(score, ply):
+        """Store mate scores relative to this node rather than to the root"""
+        if score >= MATE_THRESHOLD:
+            return score + ply
+        if score <= -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    @staticmethod
+    def _score_from_tt(score, ply):
+        """Convert a stored mate score back to be relative to the root"""
+        if score >= MATE_THRESHOLD:
+            return score - ply
+        if score <= -MATE_THRESHOLD:
+            return score + ply
+        return score
+
     def _get_position_key(self, board):
         """Generate a unique key for the board position for transposition table"""
         if hasattr(board, "zobrist_key"):
@@ -190,6 +743,12 @@ class AlphaBetaAgent:
             # Fallback to a simpler hash if zobrist not available
             return hash(tuple(board.square) + (board.is_white_to_move,))
 
+    def new_game(self):
+        """Forget everything learned in the previous game (TT, killers, history)"""
+        self.transposition_table.clear()
+        self.move_orderer.clear()
+        self.pawn_hash_table.clear()
+
     def set_depth(self, depth):
         """Set the maximum search depth"""
         if 1 <= depth <= 10:
@@ -198,3 +757,16 @@ class AlphaBetaAgent:
     def set_time_limit(self, seconds):
         """Set the maximum time limit for search in seconds"""
         self.time_limit = seconds
+        self.time_manager.set_move_time(seconds)
+
+    def set_clock(self, remaining, increment=0, moves_to_go=None):
+        """
+        Allocate the time of the next search from the game clock
+
+        Parameters:
+        - remaining: Time left on the clock in seconds
+        - increment: Seconds added to the clock per move
+        - moves_to_go: Moves until the next time control, or None
+        """
+        self.time_limit = None
+        self.time_manager.set_clock(remaining, increment, moves_to_go)
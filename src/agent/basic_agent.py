@@ -57,6 +57,13 @@ class BasicAI:
         return self.skill_level
 
     # These methods are added for compatibility with ChessAI interface
+    def new_game(self):
+        """
+        Dummy method for compatibility with ChessAI
+        BasicAI keeps no state between games, but this allows uniform interface
+        """
+        pass
+
     def set_depth(self, depth):
         """
         Dummy method for compatibility with ChessAI
@@ -70,3 +77,10 @@ class BasicAI:
         BasicAI doesn't use time limits, but this allows uniform interface
         """
         pass
+
+    def set_clock(self, remaining, increment=0, moves_to_go=None):
+        """
+        Dummy method for compatibility with ChessAI
+        BasicAI doesn't use time limits, but this allows uniform interface
+        """
+        pass
@@ -1,116 +1,66 @@
 from src.core.Board.piece import *
+from src.core.Board.board import Board
 from src.core.Board.move_generator import MoveGenerator
-
-# Piece values in centipawns (1 pawn = 100 centipawns)
-PIECE_VALUES = {
-    PAWN: 10,
-    KNIGHT: 30,
-    BISHOP: 30,
-    ROOK: 50,
-    QUEEN: 90,
-    KING: 900,  # High value to ensure king's safety
-}
-
-# Piece-square tables for positional evaluation
-# Adapted from simplified chess programming theory
-# Each table is from white's perspective, will be flipped for black
-PAWN_TABLE = [
-    0, 0, 0, 0, 0, 0, 0, 0,
-    5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0,
-    1.0, 1.0, 2.0, 3.0, 3.0, 2.0, 1.0, 1.0,
-    0.5, 0.5, 1.0, 2.5, 2.5, 1.0, 0.5, 0.5,
-    0.0, 0.0, 0.0, 2.0, 2.0, 0.0, 0.0, 0.0,
-    0.5, -0.5, -1.0, 0.0, 0.0, -1.0, -0.5, 0.5,
-    0.5, 1.0, 1.0, -2.0, -2.0, 1.0, 1.0, 0.5,
-    0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
-]
-
-KNIGHT_TABLE = [
-    -5.0, -4.0, -3.0, -3.0, -3.0, -3.0, -4.0, -5.0,
-    -4.0, -2.0, 0.0, 0.0, 0.0, 0.0, -2.0, -4.0,
-    -3.0, 0.0, 1.0, 1.5, 1.5, 1.0, 0.0, -3.0,
-    -3.0, 0.5, 1.5, 2.0, 2.0, 1.5, 0.5, -3.0,
-    -3.0, 0.0, 1.5, 2.0, 2.0, 1.5, 0.0, -3.0,
-    -3.0, 0.5, 1.0, 1.5, 1.5, 1.0, 0.5, -3.0,
-    -4.0, -2.0, 0.0, 0.5, 0.5, 0.0, -2.0, -4.0,
-    -5.0, -4.0, -3.0, -3.0, -3.0, -3.0, -4.0, -5.0
-]
-
-BISHOP_TABLE = [
-    -2.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -2.0,
-    -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0,
-    -1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 0.0, -1.0,
-    -1.0, 0.5, 0.5, 1.0, 1.0, 0.5, 0.5, -1.0,
-    -1.0, 0.0, 0.5, 1.0, 1.0, 0.5, 0.0, -1.0,
-    -1.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, -1.0,
-    -1.0, 0.0, 0.5, 0.0, 0.0, 0.5, 0.0, -1.0,
-    -2.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -2.0
-]
-
-ROOK_TABLE = [
-    0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
-    0.5, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5,
-    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
-    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
-    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
-    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
-    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
-    0.0, 0.0, 0.0, 0.5, 0.5, 0.0, 0.0, 0.0
-]
-
-QUEEN_TABLE = [
-    -2.0, -1.0, -1.0, -0.5, -0.5, -1.0, -1.0, -2.0,
-    -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0,
-    -1.0, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -1.0,
-    -0.5, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -0.5,
-    0.0, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -0.5,
-    -1.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.0, -1.0,
-    -1.0, 0.0, 0.5, 0.0, 0.0, 0.0, 0.0, -1.0,
-    -2.0, -1.0, -1.0, -0.5, -0.5, -1.0, -1.0, -2.0
-]
-
-KING_MIDDLE_GAME_TABLE = [
-    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
-    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
-    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
-    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
-    -2.0, -3.0, -3.0, -4.0, -4.0, -3.0, -3.0, -2.0,
-    -1.0, -2.0, -2.0, -2.0, -2.0, -2.0, -2.0, -1.0,
-    2.0, 2.0, 0.0, 0.0, 0.0, 0.0, 2.0, 2.0,
-    2.0, 3.0, 1.0, 0.0, 0.0, 1.0, 3.0, 2.0
-]
-
-KING_END_GAME_TABLE = [
-    -5.0, -4.0, -3.0, -2.0, -2.0, -3.0, -4.0, -5.0,
-    -3.0, -2.0, -1.0, 0.0, 0.0, -1.0, -2.0, -3.0,
-    -3.0, -1.0, 2.0, 3.0, 3.0, 2.0, -1.0, -3.0,
-    -3.0, -1.0, 3.0, 4.0, 4.0, 3.0, -1.0, -3.0,
-    -3.0, -1.0, 3.0, 4.0, 4.0, 3.0, -1.0, -3.0,
-    -3.0, -1.0, 2.0, 3.0, 3.0, 2.0, -1.0, -3.0,
-    -3.0, -3.0, 0.0, 0.0, 0.0, 0.0, -3.0, -3.0,
-    -5.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -5.0
-]
-
-
-# Dictionary to map pieces to their position tables
+from src.core.Board.bitboard_utility import (
+    KNIGHT_ATTACKS,
+    KING_MOVES,
+    FULL_BOARD,
+    FILE_MASKS,
+    ADJACENT_FILE_MASKS,
+    WHITE_PAWN_ATTACKS,
+    BLACK_PAWN_ATTACKS,
+    WHITE_PASSED_PAWN_MASKS,
+    BLACK_PASSED_PAWN_MASKS,
+    WHITE_PAWN_SUPPORT_MASKS,
+    BLACK_PAWN_SUPPORT_MASKS,
+    pop_count,
+)
+from src.core.Board.magic import get_rook_attacks, get_bishop_attacks
+
+from src.core.Board.piece_square_tables import (
+    PIECE_VALUES,
+    PAWN_TABLE,
+    KNIGHT_TABLE,
+    BISHOP_TABLE,
+    ROOK_TABLE,
+    QUEEN_TABLE,
+    KING_MIDDLE_GAME_TABLE,
+    KING_END_GAME_TABLE,
+    PSQT_SCALE,
+    MAX_GAME_PHASE,
+)
+
+# Dictionary to map pieces to their position tables. These are read-only:
+# the king table is chosen per call, so evaluation keeps no shared state and
+# can run from several threads at once.
 POSITION_TABLES = {
     PAWN: PAWN_TABLE,
     KNIGHT: KNIGHT_TABLE,
     BISHOP: BISHOP_TABLE,
     ROOK: ROOK_TABLE,
     QUEEN: QUEEN_TABLE,
-    KING: KING_MIDDLE_GAME_TABLE,  # Default to middle game
+    KING: KING_MIDDLE_GAME_TABLE,
 }
 
+# Pawn structure terms (a pawn is worth 10)
+DOUBLED_PAWN_PENALTY = 10
+ISOLATED_PAWN_PENALTY = 1.5
+BACKWARD_PAWN_PENALTY = 1
+# Passed pawn bonus by rank, counted from the pawn's own side
+PASSED_PAWN_BONUS = [0, 0.5, 1, 2, 3.5, 6, 10, 0]
 
-def get_piece_position_score(piece, square):
+
+def get_piece_position_score(piece, square, endgame=False):
     """Get positional score for a piece at a square."""
     piece_type_val = piece_type(piece)
     if piece_type_val == NONE:
         return 0
 
     # Get the position table for this piece type
-    position_table = POSITION_TABLES.get(piece_type_val, [0] * 64)
+    if piece_type_val == KING and endgame:
+        position_table = KING_END_GAME_TABLE
+    else:
+        position_table = POSITION_TABLES.get(piece_type_val, [0] * 64)
 
     # Get the score based on piece color (flipped for black)
     if is_white(piece):
@@ -121,12 +71,15 @@ def get_piece_position_score(piece, square):
         return position_table[mirror_square]
 
 
-def evaluate_board(board):
+def evaluate_board(board, pawn_hash_table=None):
     """
     Evaluate the current board position.
     Returns a score from white's perspective:
     - Positive score means white is winning
     - Negative score means black is winning
+
+    Pawn structure scores are cached in 'pawn_hash_table' (a PawnHashTable
+    owned by the caller), or computed every time if none is given.
     """
     score = 0
 
@@ -137,49 +90,39 @@ def evaluate_board(board):
     # if black_king_captured:
     #     return 700  # White wins
     
-    # Position evaluation
-    position_score = 0
-
-    # Determine if we're in endgame
-    is_endgame = is_endgame_position(board)
-    if is_endgame:
-        POSITION_TABLES[KING] = KING_END_GAME_TABLE
-    else:
-        POSITION_TABLES[KING] = KING_MIDDLE_GAME_TABLE
-
-    # Evaluate each square
-    for square in range(64):
-        piece = board.square[square]
-        if piece == NONE:
-            continue
-
-        piece_value = PIECE_VALUES.get(piece_type(piece), 0)
-        piece_position_score = get_piece_position_score(piece, square)
-
-        # Add to the appropriate score based on piece color
-        if is_white(piece):
-            position_score += piece_value + piece_position_score
-        else:
-            position_score -= piece_value + piece_position_score
+    # Position evaluation: material + piece-square scores for both game
+    # stages are kept up to date by the board. Blend them by the game phase
+    # (MAX_GAME_PHASE with all pieces on, 0 with only kings and pawns left)
+    # so the king's role changes gradually instead of at a single threshold
+    phase = min(board.game_phase, MAX_GAME_PHASE)
+    middle_game = (
+        board.psqt_middle_game[Board.WHITE_INDEX]
+        - board.psqt_middle_game[Board.BLACK_INDEX]
+    )
+    end_game = (
+        board.psqt_end_game[Board.WHITE_INDEX] - board.psqt_end_game[Board.BLACK_INDEX]
+    )
+    position_score = (middle_game * phase + end_game * (MAX_GAME_PHASE - phase)) / (
+        MAX_GAME_PHASE * PSQT_SCALE
+    )
 
     # Check for specific board features
+    # (stalemate and checkmate are detected by the search, which already
+    # knows whether the side to move has any legal moves)
     mobility_score = evaluate_mobility(board)
-    pawn_structure_score = evaluate_pawn_structure(board)
+    pawn_structure_score = evaluate_pawn_structure(board, pawn_hash_table)
     # fifty_move_rule_score = evaluate_fifty_move_rule(board)
-    stalemate_score = evaluate_stalemate(board)
-    
+
     # show all scores
     # print(f"Position Score: {position_score}")
     # print(f"Mobility Score: {mobility_score}")
     # print(f"Pawn Structure Score: {pawn_structure_score}")
-    # print(f"Stalemate Score: {stalemate_score}")
     # Combine all scoring factors
     score = (
         position_score
         + mobility_score
         + pawn_structure_score
         # + fifty_move_rule_score
-        + stalemate_score
     )
 
     return score
@@ -210,55 +153,118 @@ def count_major_pieces(board, is_white):
 
 
 def evaluate_mobility(board):
-    """Evaluate piece mobility (simplified)."""
-    # Save current game state
-    original_is_white_to_move = board.is_white_to_move
-
-    # Evaluate white mobility
-    board.is_white_to_move = True
-    white_move_gen = MoveGenerator(board)
-    white_mobility = len(white_move_gen.generate_legal_moves())
-
-    # Evaluate black mobility
-    board.is_white_to_move = False
-    black_move_gen = MoveGenerator(board)
-    black_mobility = len(black_move_gen.generate_legal_moves())
-
-    # Restore original game state
-    board.is_white_to_move = original_is_white_to_move
-
-    # Return mobility difference (with a scaling factor)
-    # return (white_mobility - black_mobility) * 100
-    if original_is_white_to_move:
-        return (- black_mobility)
-    else:
-        return (white_mobility)
+    """
+    Evaluate piece mobility as the difference in the number of squares
+    white and black pieces attack that are not occupied by their own pieces.
+    Uses the attack bitboards directly, so no moves are generated and the
+    board is not modified.
+    """
+    occupied = board.all_pieces_bitboard
+    white_mobility = count_mobility(board, WHITE, occupied)
+    black_mobility = count_mobility(board, BLACK, occupied)
+    return white_mobility - black_mobility
+
+
+def count_mobility(board, colour, occupied):
+    """Count the attacked non-friendly squares of the knights, sliders and king of a colour."""
+    pieces = board.piece_bitboards
+    colour_index = 0 if colour == WHITE else 1
+    not_own = FULL_BOARD ^ board.colour_bitboards[colour_index]
+    mobility = 0
+
+    knights = pieces[KNIGHT | colour]
+    while knights:
+        lsb = knights & -knights
+        knights ^= lsb
+        mobility += pop_count(KNIGHT_ATTACKS[lsb.bit_length() - 1] & not_own)
+
+    queens = pieces[QUEEN | colour]
+    diagonal = pieces[BISHOP | colour] | queens
+    while diagonal:
+        lsb = diagonal & -diagonal
+        diagonal ^= lsb
+        mobility += pop_count(get_bishop_attacks(lsb.bit_length() - 1, occupied) & not_own)
+
+    orthogonal = pieces[ROOK | colour] | queens
+    while orthogonal:
+        lsb = orthogonal & -orthogonal
+        orthogonal ^= lsb
+        mobility += pop_count(get_rook_attacks(lsb.bit_length() - 1, occupied) & not_own)
+
+    king = pieces[KING | colour]
+    if king:
+        mobility += pop_count(KING_MOVES[king.bit_length() - 1] & not_own)
+
+    return mobility
+
+
+def evaluate_pawn_structure(board, pawn_hash_table=None):
+    """
+    Evaluate pawn structure: doubled, isolated, backward and passed pawns.
+    The score depends on the pawns alone, so with a 'pawn_hash_table' it is
+    looked up by the board's pawn key and only computed on a cache miss.
+    """
+    if pawn_hash_table is None:
+        return calculate_pawn_structure(
+            board.piece_bitboards[WHITE_PAWN], board.piece_bitboards[BLACK_PAWN]
+        )
+
+    pawn_key = board.pawn_key
+    score = pawn_hash_table.probe(pawn_key)
+    if score is None:
+        score = calculate_pawn_structure(
+            board.piece_bitboards[WHITE_PAWN], board.piece_bitboards[BLACK_PAWN]
+        )
+        pawn_hash_table.store(pawn_key, score)
+    return score
 
 
-def evaluate_pawn_structure(board):
-    """Evaluate pawn structure (simplified)."""
-    score = 0
+def calculate_pawn_structure(white_pawns, black_pawns):
+    """Score the pawn structure from white's perspective, from the pawn bitboards"""
+    return pawn_structure_for_side(
+        white_pawns, black_pawns, True
+    ) - pawn_structure_for_side(black_pawns, white_pawns, False)
 
-    # Doubled pawns penalty
-    white_pawn_files = [0] * 8
-    black_pawn_files = [0] * 8
 
-    # Count pawns on each file
-    for square in range(64):
-        piece = board.square[square]
-        if piece_type(piece) == PAWN:
-            file_index = square % 8
-            if is_white(piece):
-                white_pawn_files[file_index] += 1
-            else:
-                black_pawn_files[file_index] += 1
+def pawn_structure_for_side(own_pawns, enemy_pawns, white):
+    """Pawn structure score for the side owning 'own_pawns'"""
+    score = 0
 
     # Penalize doubled pawns
-    for i in range(8):
-        if white_pawn_files[i] > 1:
-            score -= 10 * (white_pawn_files[i] - 1)
-        if black_pawn_files[i] > 1:
-            score += 10 * (black_pawn_files[i] - 1)
+    for file_mask in FILE_MASKS:
+        pawns_on_file = pop_count(own_pawns & file_mask)
+        if pawns_on_file > 1:
+            score -= DOUBLED_PAWN_PENALTY * (pawns_on_file - 1)
+
+    if white:
+        passed_masks = WHITE_PASSED_PAWN_MASKS
+        support_masks = WHITE_PAWN_SUPPORT_MASKS
+        stop_attacks = WHITE_PAWN_ATTACKS
+        push = 8
+    else:
+        passed_masks = BLACK_PASSED_PAWN_MASKS
+        support_masks = BLACK_PAWN_SUPPORT_MASKS
+        stop_attacks = BLACK_PAWN_ATTACKS
+        push = -8
+
+    pawns = own_pawns
+    while pawns:
+        lsb = pawns & -pawns
+        pawns ^= lsb
+        square = lsb.bit_length() - 1
+
+        if not passed_masks[square] & enemy_pawns:
+            rank = square // 8
+            score += PASSED_PAWN_BONUS[rank if white else 7 - rank]
+
+        if not own_pawns & ADJACENT_FILE_MASKS[square % 8]:
+            score -= ISOLATED_PAWN_PENALTY
+        elif not own_pawns & support_masks[square] and (
+            stop_attacks[square + push] & enemy_pawns
+        ):
+            # No neighbour can come to its defence and the square in front
+            # is controlled by an enemy pawn
+            score -= BACKWARD_PAWN_PENALTY
 
     return score
 
@@ -291,26 +297,5 @@ def is_stalemate(board):
     - True if stalemate, False otherwise
     """
     
-    move_gen = MoveGenerator(board)
-    legal_moves = move_gen.generate_legal_moves()
-    
     # Stalemate occurs when there are no legal moves and the king is not in check
-    return not legal_moves and not board.is_in_check()
-
-def evaluate_stalemate(board):
-    """
-    Evaluate stalemate position with a penalty.
-    Returns a negative score to be added to total evaluation.
-    
-    Parameters:
-    - board: Current board state
-    
-    Returns:
-    - Penalty score for stalemate (-100)
-    """
-    if is_stalemate(board):
-        if board.is_white_to_move:
-            return 10000
-        else:
-            return -10000
-    return 0
\ No newline at end of file
+    return not board.is_in_check() and not MoveGenerator(board).has_legal_move()
@@ -0,0 +1,244 @@
+"""
+Move ordering for the search agents.
+
+Alpha-beta prunes most when the best move is searched first. Moves are
+ranked as:
+1. The transposition table / principal variation move
+2. Captures by MVV-LVA (most valuable victim, least valuable attacker)
+   and promotions
+3. Killer moves: quiet moves that caused a beta cutoff at the same ply
+4. Captures that lose material by static exchange evaluation (see.py)
+5. Remaining quiet moves by the history heuristic
+
+order_moves sorts a complete move list. staged_moves produces the same
+order lazily for the main search, so a node that cuts off early does not
+pay for generating and sorting moves it never searches.
+
+Moves are packed 16-bit integers (see src/core/Board/move.py).
+"""
+
+import random
+
+from src.core.Board.move import (
+    Move,
+    START_SQUARE_MASK,
+    TARGET_SQUARE_SHIFT,
+    FLAG_SHIFT,
+    PROMOTION_VALUE,
+    NULL_MOVE_VALUE,
+)
+from src.core.Board.piece import *
+from src.core.Board.piece_square_tables import PIECE_VALUES
+from src.agent.see import see
+
+# Score bands, far enough apart that a lower band never overtakes a higher one
+TT_MOVE_SCORE = 10000000
+CAPTURE_SCORE = 1000000
+PROMOTION_SCORE = 900000
+KILLER_SCORES = (800000, 700000)
+LOSING_CAPTURE_SCORE = 600000
+HISTORY_MAX = 500000
+
+# Piece ranks for MVV-LVA (the king is never a victim)
+MVV_LVA_VALUES = {PAWN: 1, KNIGHT: 2, BISHOP: 3, ROOK: 4, QUEEN: 5, KING: 6}
+
+EN_PASSANT_FLAG = Move.EN_PASSANT_CAPTURE_FLAG
+QUEEN_PROMOTION_FLAG = Move.PROMOTE_TO_QUEEN_FLAG
+
+
+class MoveOrderer:
+    """
+    Ranks moves at each search node using the TT move, MVV-LVA, killer moves
+    and a history table that persists across iterations
+    """
+
+    def __init__(self, max_ply=128, random_tie_break=False, use_see=True):
+        """
+        Initialize the move orderer
+
+        Parameters:
+        - max_ply: Number of plies killer moves are tracked for
+        - random_tie_break: Break ties between equally ranked moves at random
+        - use_see: Order captures that lose material by SEE after the killers
+        """
+        self.max_ply = max_ply
+        self.random_tie_break = random_tie_break
+        self.use_see = use_see
+        self.killers = [[NULL_MOVE_VALUE, NULL_MOVE_VALUE] for _ in range(max_ply)]
+        # History scores indexed by [piece][target square]
+        self.history = [[0] * 64 for _ in range(MAX_PIECE_INDEX + 1)]
+
+    def clear(self):
+        """Forget all killers and history, e.g. at the start of a new game"""
+        self.killers = [[NULL_MOVE_VALUE, NULL_MOVE_VALUE] for _ in range(self.max_ply)]
+        self.history = [[0] * 64 for _ in range(MAX_PIECE_INDEX + 1)]
+
+    def new_search(self):
+        """Reset killers and age the history table before a new search"""
+        self.killers = [[NULL_MOVE_VALUE, NULL_MOVE_VALUE] for _ in range(self.max_ply)]
+        for piece_history in self.history:
+            for square in range(64):
+                piece_history[square] >>= 1
+
+    @staticmethod
+    def is_capture(board, move):
+        return (
+            board.square[(move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK] != NONE
+            or move >> FLAG_SHIFT == EN_PASSANT_FLAG
+        )
+
+    @staticmethod
+    def is_quiet(board, move):
+        return move < PROMOTION_VALUE and not MoveOrderer.is_capture(board, move)
+
+    def score_move(self, board, move, tt_move=NULL_MOVE_VALUE, ply=0):
+        """Return the ordering score of a move (higher is searched first)"""
+        if move == tt_move:
+            return TT_MOVE_SCORE
+
+        square = board.square
+        target_square = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+        flag = move >> FLAG_SHIFT
+        attacker = square[move & START_SQUARE_MASK]
+        victim = square[target_square]
+        if victim != NONE or flag == EN_PASSANT_FLAG:
+            victim_type = piece_type(victim) if victim != NONE else PAWN
+            attacker_type = piece_type(attacker)
+            # Taking a piece worth at least the attacker never loses material,
+            # so SEE is only needed when the attacker is worth more
+            if (
+                self.use_see
+                and PIECE_VALUES[attacker_type] > PIECE_VALUES[victim_type]
+                and see(board, move) < 0
+            ):
+                score = LOSING_CAPTURE_SCORE
+            else:
+                score = CAPTURE_SCORE
+            score += MVV_LVA_VALUES[victim_type] * 10 - MVV_LVA_VALUES[attacker_type]
+            if flag == QUEEN_PROMOTION_FLAG:
+                score += 100
+            return score
+
+        if move >= PROMOTION_VALUE:
+            return PROMOTION_SCORE + (100 if flag == QUEEN_PROMOTION_FLAG else 0)
+
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if move == killers[0]:
+                return KILLER_SCORES[0]
+            if move == killers[1]:
+                return KILLER_SCORES[1]
+
+        return self.history[attacker][target_square]
+
+    def order_moves(self, board, moves, tt_move=NULL_MOVE_VALUE, ply=0):
+        """
+        Return the packed moves in 'moves' (any iterable, e.g. a per-ply
+        array buffer) as a new list, best candidates first
+        """
+        moves = list(moves)
+        score_move = self.score_move
+        if self.random_tie_break:
+            # Shuffle first: the sort is stable, so equal moves keep a random order
+            random.shuffle(moves)
+        moves.sort(key=lambda move: score_move(board, move, tt_move, ply), reverse=True)
+        return moves
+
+    def order_captures(self, board, moves):
+        """
+        Order captures and promotions like order_moves, split into
+        (captures that do not lose material, captures that do by SEE)
+        """
+        moves = list(moves)
+        if self.random_tie_break:
+            random.shuffle(moves)
+        score_move = self.score_move
+        scores = {move: score_move(board, move) for move in moves}
+        moves.sort(key=scores.__getitem__, reverse=True)
+        for index, move in enumerate(moves):
+            if scores[move] < KILLER_SCORES[1]:
+                return moves[:index], moves[index:]
+        return moves, []
+
+    def staged_moves(
+        self,
+        board,
+        move_generator,
+        move_buffer,
+        tt_move=NULL_MOVE_VALUE,
+        ply=0,
+        pseudo_legal=False,
+    ):
+        """
+        Yield the legal moves of a search node in stages, generating each
+        stage only when the previous one is exhausted:
+        1. The TT move, if it is legal here (checked without generating moves)
+        2. Captures and promotions, sorted by MVV-LVA, except losing captures
+        3. Killer moves that are legal quiet moves here
+        4. Captures that lose material by SEE
+        5. The remaining quiet moves, sorted by history
+
+        'move_buffer' is the per-ply buffer, reused by both generation stages.
+        The board must be restored before the next move is requested.
+        With pseudo_legal=True the generated stages may contain illegal
+        moves, which the caller rejects after making them.
+        """
+        if tt_move != NULL_MOVE_VALUE and move_generator.is_legal_move(tt_move):
+            yield tt_move
+        else:
+            tt_move = NULL_MOVE_VALUE
+
+        captures = move_generator.generate_moves(
+            move_buffer, captures_only=True, pseudo_legal=pseudo_legal
+        )
+        captures, losing_captures = self.order_captures(board, captures)
+        for move in captures:
+            if move != tt_move:
+                yield move
+
+        searched_killers = []
+        if ply < self.max_ply:
+            for killer in tuple(self.killers[ply]):
+                if (
+                    killer != NULL_MOVE_VALUE
+                    and killer != tt_move
+                    and self.is_quiet(board, killer)
+                    and move_generator.is_legal_move(killer)
+                ):
+                    searched_killers.append(killer)
+                    yield killer
+
+        for move in losing_captures:
+            if move != tt_move:
+                yield move
+
+        quiets = move_generator.generate_moves(
+            move_buffer, quiets_only=True, pseudo_legal=pseudo_legal
+        )
+        quiets = self.order_moves(board, quiets)
+        for move in quiets:
+            if move != tt_move and move not in searched_killers:
+                yield move
+
+    def record_cutoff(self, board, move, depth, ply):
+        """
+        Update killers and history for a quiet move that caused a beta cutoff.
+        Must be called before the move is made (or after it is unmade).
+        """
+        if not self.is_quiet(board, move):
+            return
+
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if move != killers[0]:
+                killers[1] = killers[0]
+                killers[0] = move
+
+        target_square = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+        piece_history = self.history[board.square[move & START_SQUARE_MASK]]
+        piece_history[target_square] += depth * depth
+        if piece_history[target_square] > HISTORY_MAX:
+            # Keep history below the killer band by halving the whole table
+            for history_row in self.history:
+                for square in range(64):
+                    history_row[square] >>= 1
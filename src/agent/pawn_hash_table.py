@@ -0,0 +1,56 @@
+"""
+Pawn hash table for the evaluation.
+
+Pawn structure changes on only a small fraction of moves, so its score is
+cached by the board's pawn-only Zobrist key. The table has a fixed number of
+slots indexed by the low bits of the key; each slot holds a (key, score)
+tuple and is simply overwritten on collision.
+
+A table belongs to its caller (each AlphaBetaAgent owns one); evaluation
+keeps no table of its own. The probe/hit counters are not synchronised, so
+a table should not be shared between threads running searches.
+"""
+
+
+class PawnHashTable:
+    """
+    Fixed-size, always-replace cache of pawn structure scores
+    """
+
+    def __init__(self, num_entries=16384):
+        """
+        Initialize the table
+
+        Parameters:
+        - num_entries: Number of slots, rounded down to a power of two
+        """
+        self.num_entries = 1 << (max(1, num_entries).bit_length() - 1)
+        self.index_mask = self.num_entries - 1
+        self.entries = [None] * self.num_entries
+        self.probes = 0
+        self.hits = 0
+
+    def clear(self):
+        """Empty the table"""
+        self.entries = [None] * self.num_entries
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+
+    def probe(self, key):
+        """Cached score for a pawn key, or None"""
+        self.probes += 1
+        entry = self.entries[key & self.index_mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        return None
+
+    def store(self, key, score):
+        self.entries[key & self.index_mask] = (key, score)
+
+    def hit_rate(self):
+        """Fraction of probes since the last reset that found their key"""
+        return self.hits / self.probes if self.probes else 0.0
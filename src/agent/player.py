@@ -44,6 +44,10 @@ class ChessAI:
         """
         return self.agent.choose_move(board)
 
+    def new_game(self):
+        """Clear the search tables before a new game"""
+        self.agent.new_game()
+
     def set_depth(self, depth):
         """Set the maximum search depth"""
         self.agent.set_depth(depth)
@@ -64,6 +68,10 @@ class ChessAI:
         """Set the maximum time limit for search in seconds"""
         self.agent.set_time_limit(seconds)
 
+    def set_clock(self, remaining, increment=0, moves_to_go=None):
+        """Allocate the time of the next move from the game clock (seconds)"""
+        self.agent.set_clock(remaining, increment, moves_to_go)
+
     def set_skill_level(self, level):
         """
         Set the skill level directly
@@ -0,0 +1,148 @@
+"""
+Static exchange evaluation (SEE).
+
+Resolves the sequence of captures on the target square of a move, each side
+recapturing with its least valuable attacker, and returns the material
+balance for the side making the move when both sides stop capturing as soon
+as continuing would lose material. Attackers are found with the magic slider
+lookups on the current occupancy; every piece that captures is removed from
+the occupancy, so sliders behind it (x-rays) join the exchange. Pins and
+checks are ignored.
+
+Values are the evaluation's PIECE_VALUES (a pawn is 10).
+"""
+
+from src.core.Board.bitboard_utility import (
+    KNIGHT_ATTACKS,
+    KING_MOVES,
+    WHITE_PAWN_ATTACKS,
+    BLACK_PAWN_ATTACKS,
+)
+from src.core.Board.magic import get_rook_attacks, get_bishop_attacks
+from src.core.Board.move import (
+    Move,
+    START_SQUARE_MASK,
+    TARGET_SQUARE_SHIFT,
+    FLAG_SHIFT,
+    PROMOTION_VALUE,
+)
+from src.core.Board.piece import *
+from src.core.Board.piece_square_tables import PIECE_VALUES
+
+EN_PASSANT_FLAG = Move.EN_PASSANT_CAPTURE_FLAG
+
+# Piece types in the order they are tried as recapturing pieces
+ATTACKER_ORDER = (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
+
+PROMOTION_PIECES = {
+    Move.PROMOTE_TO_QUEEN_FLAG: QUEEN,
+    Move.PROMOTE_TO_KNIGHT_FLAG: KNIGHT,
+    Move.PROMOTE_TO_ROOK_FLAG: ROOK,
+    Move.PROMOTE_TO_BISHOP_FLAG: BISHOP,
+}
+
+
+def attackers_to(board, square, occupied):
+    """
+    Bitboard of the pieces of both colours that attack 'square' when the
+    occupied squares are 'occupied'. Pieces not in 'occupied' are left out.
+    """
+    pieces = board.piece_bitboards
+    diagonal = (
+        pieces[BISHOP | WHITE] | pieces[BISHOP | BLACK]
+        | pieces[QUEEN | WHITE] | pieces[QUEEN | BLACK]
+    )
+    orthogonal = (
+        pieces[ROOK | WHITE] | pieces[ROOK | BLACK]
+        | pieces[QUEEN | WHITE] | pieces[QUEEN | BLACK]
+    )
+    attackers = (
+        (get_bishop_attacks(square, occupied) & diagonal)
+        | (get_rook_attacks(square, occupied) & orthogonal)
+        | (KNIGHT_ATTACKS[square] & (pieces[KNIGHT | WHITE] | pieces[KNIGHT | BLACK]))
+        | (KING_MOVES[square] & (pieces[KING | WHITE] | pieces[KING | BLACK]))
+        # A white pawn attacks 'square' from where a black pawn on 'square'
+        # would attack, and vice versa
+        | (BLACK_PAWN_ATTACKS[square] & pieces[PAWN | WHITE])
+        | (WHITE_PAWN_ATTACKS[square] & pieces[PAWN | BLACK])
+    )
+    return attackers & occupied
+
+
+def see(board, move):
+    """
+    Static exchange evaluation of a move
+
+    Parameters:
+    - board: Board with 'move' not yet made
+    - move: Packed move (normally a capture or promotion)
+
+    Returns:
+    - The expected material gain for the side making the move: positive
+      wins material, negative loses it
+    """
+    start_square = move & START_SQUARE_MASK
+    target_square = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+    flag = move >> FLAG_SHIFT
+    square = board.square
+    pieces = board.piece_bitboards
+
+    occupied = board.all_pieces_bitboard ^ (1 << start_square)
+    if flag == EN_PASSANT_FLAG:
+        # The captured pawn is behind the target square, on its file
+        occupied ^= 1 << (target_square - 8 if board.is_white_to_move else target_square + 8)
+        gain = PIECE_VALUES[PAWN]
+    else:
+        victim = square[target_square]
+        gain = PIECE_VALUES[piece_type(victim)] if victim != NONE else 0
+
+    # Value of the piece standing on the target square after the move
+    if move >= PROMOTION_VALUE:
+        promotion_value = PIECE_VALUES[PROMOTION_PIECES[flag]]
+        gain += promotion_value - PIECE_VALUES[PAWN]
+        on_square_value = promotion_value
+    else:
+        on_square_value = PIECE_VALUES[piece_type(square[start_square])]
+
+    diagonal = (
+        pieces[BISHOP | WHITE] | pieces[BISHOP | BLACK]
+        | pieces[QUEEN | WHITE] | pieces[QUEEN | BLACK]
+    )
+    orthogonal = (
+        pieces[ROOK | WHITE] | pieces[ROOK | BLACK]
+        | pieces[QUEEN | WHITE] | pieces[QUEEN | BLACK]
+    )
+    attackers = attackers_to(board, target_square, occupied)
+
+    # gains[i]: material balance for the side making capture i if the
+    # exchange stopped right after it
+    gains = [gain]
+    colour = board.opponent_colour
+    while True:
+        side_attackers = attackers & board.colour_bitboards[colour >> 3]
+        if not side_attackers:
+            break
+        for attacker_type in ATTACKER_ORDER:
+            attacker_bitboard = side_attackers & pieces[attacker_type | colour]
+            if attacker_bitboard:
+                break
+        # The king can only recapture if nothing else attacks the square
+        if attacker_type == KING and attackers & ~side_attackers:
+            break
+
+        gains.append(on_square_value - gains[-1])
+        on_square_value = PIECE_VALUES[attacker_type]
+
+        # Remove the capturing piece and add the sliders it uncovers
+        occupied ^= attacker_bitboard & -attacker_bitboard
+        if attacker_type == PAWN or attacker_type == BISHOP or attacker_type == QUEEN:
+            attackers |= get_bishop_attacks(target_square, occupied) & diagonal
+        if attacker_type == ROOK or attacker_type == QUEEN:
+            attackers |= get_rook_attacks(target_square, occupied) & orthogonal
+        attackers &= occupied
+        colour ^= BLACK
+
+    # Each side may stop capturing when continuing would lose material
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
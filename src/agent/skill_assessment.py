@@ -16,7 +16,7 @@ The assessment is based on multiple factors:
 
 import random
 from src.core.Board.board import Board
-from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.game_result import IN_PROGRESS, CHECKMATE
 from src.agent.skill_level import SkillLevel
 from src.agent.evaluation import evaluate_board
 
@@ -173,9 +173,14 @@ class SkillAssessor:
         Returns:
         - 1 if white wins, -1 if black wins, 0 for draw
         """
-        board = Board()
+        board = Board.create_board()
         move_count = 0
 
+        # The agents are reused across test games: start each one fresh
+        for agent in (white_agent, black_agent):
+            if hasattr(agent, "new_game"):
+                agent.new_game()
+
         while move_count < max_moves:
             current_agent = white_agent if board.is_white_to_move else black_agent
 
@@ -188,26 +193,19 @@ class SkillAssessor:
 
             # If no legal moves, game is over
             if move is None:
-                move_gen = MoveGenerator(board)
-                legal_moves = move_gen.generate_legal_moves()
-
-                if not legal_moves:
-                    if board.is_in_check():
-                        # Checkmate
-                        return -1 if board.is_white_to_move else 1
-                    else:
-                        # Stalemate
-                        return 0
-                else:
+                result = board.game_result()
+                if result == IN_PROGRESS:
                     # Agent failed to find a move despite legal moves existing
                     return -1 if board.is_white_to_move else 1
+                return self._result_score(board, result)
 
             board.make_move(move)
             move_count += 1
 
-            # Check for insufficient material (simplified)
-            if self._has_insufficient_material(board):
-                return 0
+            # Checkmate, stalemate or a draw by rule
+            result = board.game_result()
+            if result != IN_PROGRESS:
+                return self._result_score(board, result)
 
         # If max moves reached, evaluate position to determine result
         score = evaluate_board(board)
@@ -215,37 +213,19 @@ class SkillAssessor:
             return 0  # Draw
         return 1 if score > 0 else -1
 
-    def _has_insufficient_material(self, board):
+    @staticmethod
+    def _result_score(board, result):
         """
-        Check if the position has insufficient material for checkmate
+        Score of a finished game from white's point of view
 
         Parameters:
-        - board: Current board state
+        - board: Board in the final position
+        - result: board.game_result() of that position
 
         Returns:
-        - True if insufficient material, False otherwise
+        - 1 if white wins, -1 if black wins, 0 for draw
         """
-        # Count total pieces
-        total_pieces = 0
-        for square in range(64):
-            if board.square[square] != 0:  # 0 is empty square
-                total_pieces += 1
-
-        # Only kings left
-        if total_pieces <= 2:
-            return True
-
-        # King and knight or king and bishop vs king is insufficient
-        if (
-            total_pieces <= 3
-            and (
-                board.all_piece_lists[2].count
-                + board.all_piece_lists[8].count  # Knights
-                + board.all_piece_lists[3].count
-                + board.all_piece_lists[9].count  # Bishops
-            )
-            <= 1
-        ):
-            return True
-
-        return False
+        if result == CHECKMATE:
+            # The side to move is checkmated
+            return -1 if board.is_white_to_move else 1
+        return 0
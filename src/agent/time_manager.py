@@ -0,0 +1,187 @@
+"""
+Time management for the search.
+
+A search gets two budgets:
+- soft limit: no new iterative-deepening iteration is started past it. It is
+  scaled by how stable the best move has been: a best move that has not
+  changed for several iterations stops the search early, one that just
+  changed gets extra time.
+- hard limit: the running iteration is aborted. The search unwinds without
+  using the aborted scores, and the best move of the last completed
+  iteration is played.
+
+The budgets come either from a fixed time per move (set_move_time) or from
+the game clock (set_clock: remaining time, increment and moves to go).
+The monotonic clock is only read every 'check_interval' nodes.
+
+GameClock keeps the remaining time of both sides of a game, so a game loop
+can pass each side's remaining time to set_clock before every move.
+"""
+
+import time
+
+# Nodes between two reads of the clock
+CHECK_INTERVAL = 256
+
+# Clock allocation: remaining / moves to go + a share of the increment is
+# the soft limit; the hard limit is a multiple of it, capped by a share of
+# the remaining time (MAX_REMAINING_SHARE, or 1 / moves to go if larger)
+DEFAULT_MOVES_TO_GO = 30
+INCREMENT_SHARE = 0.75
+HARD_LIMIT_FACTOR = 4
+MAX_REMAINING_SHARE = 0.25
+# Reserved per move for the work around the search (GUI, move making)
+MOVE_OVERHEAD = 0.05
+MIN_MOVE_TIME = 0.01
+
+# With a fixed time per move, an iteration started after this share of the
+# time would rarely finish, so none is started
+FIXED_SOFT_SHARE = 0.5
+
+# Soft limit scale by the number of consecutive completed iterations that
+# kept the same best move (the last entry applies from then on)
+STABILITY_SCALES = (1.25, 1.0, 0.8, 0.6, 0.5)
+
+
+class TimeManager:
+    """
+    Soft and hard time budgets of one search, polled by node count
+    """
+
+    def __init__(self, check_interval=CHECK_INTERVAL):
+        """
+        Initialize the time manager with no time limit
+
+        Parameters:
+        - check_interval: Number of nodes between two reads of the clock
+        """
+        self.check_interval = check_interval
+        self.move_time = None
+        self.remaining = None
+        self.increment = 0
+        self.moves_to_go = None
+
+        self.start_time = 0
+        self.soft_limit = None
+        self.hard_limit = None
+        self.stopped = False
+        self.countdown = check_interval
+        self.stable_iterations = 0
+        self.last_best_move = None
+
+    def set_move_time(self, seconds):
+        """Use a fixed time per move (None or 0 for no limit)"""
+        self.move_time = seconds or None
+        self.remaining = None
+
+    def set_clock(self, remaining, increment=0, moves_to_go=None):
+        """
+        Allocate time from the game clock; call before each search
+
+        Parameters:
+        - remaining: Time left on the clock in seconds
+        - increment: Seconds added to the clock per move
+        - moves_to_go: Moves until the next time control, or None for the
+          rest of the game
+        """
+        self.remaining = remaining
+        self.increment = increment
+        self.moves_to_go = moves_to_go
+        self.move_time = None
+
+    def start(self):
+        """Start the clock of a new search and compute its budgets"""
+        self.start_time = time.monotonic()
+        self.stopped = False
+        self.countdown = self.check_interval
+        self.stable_iterations = 0
+        self.last_best_move = None
+
+        if self.move_time is not None:
+            self.hard_limit = self.move_time
+            self.soft_limit = self.move_time * FIXED_SOFT_SHARE
+        elif self.remaining is not None:
+            available = max(MIN_MOVE_TIME, self.remaining - MOVE_OVERHEAD)
+            moves_to_go = max(1, self.moves_to_go or DEFAULT_MOVES_TO_GO)
+            soft_limit = available / moves_to_go + self.increment * INCREMENT_SHARE
+            # Close to the time control the whole share of the remaining
+            # moves may be used
+            max_share = max(MAX_REMAINING_SHARE, 1 / moves_to_go)
+            self.hard_limit = max(
+                MIN_MOVE_TIME,
+                min(soft_limit * HARD_LIMIT_FACTOR, available * max_share),
+            )
+            self.soft_limit = min(soft_limit, self.hard_limit)
+        else:
+            self.soft_limit = None
+            self.hard_limit = None
+
+    def elapsed(self):
+        """Seconds since the search started"""
+        return time.monotonic() - self.start_time
+
+    def tick(self):
+        """
+        Count a node, reading the clock every 'check_interval' nodes.
+        Returns True once the hard limit is reached; the search must then
+        return without using the scores of the aborted subtrees.
+        """
+        self.countdown -= 1
+        if self.countdown > 0 or self.hard_limit is None:
+            return self.stopped
+        self.countdown = self.check_interval
+        if time.monotonic() - self.start_time >= self.hard_limit:
+            self.stopped = True
+        return self.stopped
+
+    def iteration_completed(self, best_move):
+        """
+        Record the best move of a completed iteration.
+        Returns True if no further iteration should be started.
+        """
+        if best_move == self.last_best_move:
+            self.stable_iterations += 1
+        else:
+            self.stable_iterations = 0
+            self.last_best_move = best_move
+
+        if self.soft_limit is None:
+            return False
+        scale = STABILITY_SCALES[min(self.stable_iterations, len(STABILITY_SCALES) - 1)]
+        soft_limit = min(self.soft_limit * scale, self.hard_limit)
+        return self.elapsed() >= soft_limit
+
+
+class GameClock:
+    """
+    Remaining time of both sides of a game with a per-move increment
+    """
+
+    def __init__(self, seconds, increment=0):
+        """
+        Start both clocks
+
+        Parameters:
+        - seconds: Time each side has for the game
+        - increment: Seconds added to a side's clock after each of its moves
+        """
+        self.increment = increment
+        self.remaining = [seconds, seconds]  # [white, black]
+
+    def time_left(self, white):
+        """Seconds left on the clock of white (True) or black (False)"""
+        return self.remaining[0 if white else 1]
+
+    def record_move(self, white, elapsed):
+        """
+        Charge 'elapsed' seconds to the side that moved and add the increment.
+        Returns False if the side ran out of time during the move (no
+        increment is added then).
+        """
+        index = 0 if white else 1
+        self.remaining[index] -= elapsed
+        if self.remaining[index] <= 0:
+            self.remaining[index] = 0
+            return False
+        self.remaining[index] += self.increment
+        return True
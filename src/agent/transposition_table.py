@@ -0,0 +1,149 @@
+"""
+Transposition table for the search agents.
+
+A fixed-size hash table backed by preallocated flat arrays, indexed by the
+low bits of the Zobrist key. Each slot stores the full key for verification,
+the search depth, the bound type, the score, the packed best move and the
+age of the search that wrote it. Memory use is fixed at construction time
+and the table persists across moves within a game.
+"""
+
+from array import array
+
+from src.core.Board.move import NULL_MOVE_VALUE
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table with a depth-preferred/age replacement scheme
+    """
+
+    # Bound types
+    EXACT = 0
+    LOWER_BOUND = 1  # Fail-high: the real score is at least the stored score
+    UPPER_BOUND = 2  # Fail-low: the real score is at most the stored score
+
+    # Bytes per entry: key (8) + score (8) + move (2) + depth (1) + flags (1)
+    ENTRY_SIZE = 20
+
+    NO_MOVE = NULL_MOVE_VALUE
+    EMPTY_DEPTH = -1
+    AGE_MASK = 0x3F
+
+    def __init__(self, size_mb=16):
+        """
+        Initialize the table
+
+        Parameters:
+        - size_mb: Approximate memory budget in megabytes. The number of
+          entries is rounded down to a power of two.
+        """
+        self.size_mb = size_mb
+        max_entries = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_SIZE)
+        self.num_entries = 1 << (max_entries.bit_length() - 1)
+        self.index_mask = self.num_entries - 1
+
+        self.keys = array("Q", bytes(8 * self.num_entries))
+        self.scores = array("d", bytes(8 * self.num_entries))
+        self.moves = array("H", bytes(2 * self.num_entries))
+        self.depths = array("b", [self.EMPTY_DEPTH]) * self.num_entries
+        self.flags = array("B", bytes(self.num_entries))  # bound | age << 2
+
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self):
+        """Empty the table, e.g. at the start of a new game"""
+        self.depths[:] = array("b", [self.EMPTY_DEPTH]) * self.num_entries
+        self.age = 0
+        self.reset_stats()
+
+    def new_search(self):
+        """Advance the age so entries from earlier searches are replaced first"""
+        self.age = (self.age + 1) & self.AGE_MASK
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key):
+        """
+        Look up a position
+
+        Returns:
+        - (depth, bound, score, best_move) if the position is stored, else None.
+          best_move is a packed move, NO_MOVE if none was stored.
+        """
+        self.probes += 1
+        index = key & self.index_mask
+        if self.depths[index] == self.EMPTY_DEPTH or self.keys[index] != key:
+            return None
+
+        self.hits += 1
+        return (
+            self.depths[index],
+            self.flags[index] & 0b11,
+            self.scores[index],
+            self.moves[index],
+        )
+
+    def get_move(self, key):
+        """Best move (packed) stored for a position, or NO_MOVE"""
+        index = key & self.index_mask
+        if self.depths[index] == self.EMPTY_DEPTH or self.keys[index] != key:
+            return self.NO_MOVE
+        return self.moves[index]
+
+    def store(self, key, depth, bound, score, best_move=NULL_MOVE_VALUE):
+        """
+        Store a search result
+
+        An occupied slot written by the current search and searched more
+        deeply is kept. For the same position it is still replaced by an
+        exact score when it only holds a bound.
+        """
+        index = key & self.index_mask
+        stored_depth = self.depths[index]
+        same_position = self.keys[index] == key
+
+        if (
+            stored_depth != self.EMPTY_DEPTH
+            and (self.flags[index] >> 2) == self.age
+            and stored_depth > depth
+            and not (
+                same_position
+                and bound == self.EXACT
+                and self.flags[index] & 0b11 != self.EXACT
+            )
+        ):
+            return
+
+        move_value = best_move
+        if move_value == self.NO_MOVE and same_position:
+            # Keep the best move of an earlier search of this position
+            move_value = self.moves[index]
+
+        self.keys[index] = key
+        self.scores[index] = score
+        self.moves[index] = move_value
+        self.depths[index] = min(depth, 127)
+        self.flags[index] = bound | (self.age << 2)
+        self.stores += 1
+
+    def hit_rate(self):
+        """Fraction of probes since the last new_search that found their position"""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def hashfull(self):
+        """Permille of the first 1000 slots written by the current search"""
+        sample = min(1000, self.num_entries)
+        used = sum(
+            1
+            for i in range(sample)
+            if self.depths[i] != self.EMPTY_DEPTH and (self.flags[i] >> 2) == self.age
+        )
+        return used * 1000 // sample
@@ -0,0 +1,221 @@
+# Batched attack generation with NumPy
+#
+# For offline analysis over many positions at once. A batch is an (N, 12)
+# uint64 array of piece bitboards, one row per position, with the columns in
+# PIECE_INDICES order (white pawn .. white king, black pawn .. black king).
+# Sliding attacks use Kogge-Stone occluded fills: every direction is filled
+# with three shift-and-mask steps, so the work per direction is the same
+# for all rows and vectorises over the whole batch. Leaper and pawn attacks
+# are plain shifts. Nothing here touches the magic tables or MoveGenerator.
+import numpy as np
+
+from src.core.Board.bitboard_utility import FULL_BOARD, NOT_FILE_A, NOT_FILE_H
+from src.core.Board.piece import PIECE_INDICES
+from src.core.helper.fen_utility import position_from_fen
+
+NUM_PIECE_COLUMNS = len(PIECE_INDICES)
+
+# Column of each piece type within one colour's half of a row
+PAWN_COLUMN = 0
+KNIGHT_COLUMN = 1
+BISHOP_COLUMN = 2
+ROOK_COLUMN = 3
+QUEEN_COLUMN = 4
+KING_COLUMN = 5
+COLUMNS_PER_COLOUR = 6
+
+_FULL = np.uint64(FULL_BOARD)
+_NOT_A = np.uint64(NOT_FILE_A)
+_NOT_H = np.uint64(NOT_FILE_H)
+_NOT_AB = np.uint64(NOT_FILE_A & (NOT_FILE_A << 1))
+_NOT_GH = np.uint64(NOT_FILE_H & (NOT_FILE_H >> 1))
+
+# (shift, wrap mask) per direction; positive shifts go towards higher squares.
+# The mask clears squares that a shift wrapped around the board edge onto.
+ORTHOGONAL_SHIFTS = ((8, _FULL), (-8, _FULL), (1, _NOT_A), (-1, _NOT_H))
+DIAGONAL_SHIFTS = ((9, _NOT_A), (-9, _NOT_H), (7, _NOT_H), (-7, _NOT_A))
+KNIGHT_SHIFTS = (
+    (17, _NOT_A), (15, _NOT_H), (10, _NOT_AB), (6, _NOT_GH),
+    (-17, _NOT_H), (-15, _NOT_A), (-10, _NOT_GH), (-6, _NOT_AB),
+)
+KING_SHIFTS = ORTHOGONAL_SHIFTS + DIAGONAL_SHIFTS
+
+
+def _shift(bitboards, amount):
+    if amount > 0:
+        return bitboards << np.uint64(amount)
+    return bitboards >> np.uint64(-amount)
+
+
+if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+
+    def pop_count(bitboards):
+        """Number of set bits of each element"""
+        return np.bitwise_count(bitboards).astype(np.int64)
+
+else:
+    _M1 = np.uint64(0x5555555555555555)
+    _M2 = np.uint64(0x3333333333333333)
+    _M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    _H01 = np.uint64(0x0101010101010101)
+
+    def pop_count(bitboards):
+        """Number of set bits of each element"""
+        x = bitboards - ((bitboards >> np.uint64(1)) & _M1)
+        x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+        x = (x + (x >> np.uint64(4))) & _M4
+        return ((x * _H01) >> np.uint64(56)).astype(np.int64)
+
+
+def positions_to_bitboards(positions):
+    """
+    Convert Boards and/or FEN strings into an (N, 12) uint64 batch.
+
+    Parameters:
+    positions: iterable of Board objects or FEN strings
+
+    Returns:
+    numpy array of shape (N, 12), columns in PIECE_INDICES order
+    """
+    rows = []
+    for position in positions:
+        if isinstance(position, str):
+            squares = position_from_fen(position).squares
+            bitboards = dict.fromkeys(PIECE_INDICES, 0)
+            for square, piece in enumerate(squares):
+                if piece:
+                    bitboards[piece] |= 1 << square
+            rows.append([bitboards[piece] for piece in PIECE_INDICES])
+        else:
+            rows.append([position.piece_bitboards[piece] for piece in PIECE_INDICES])
+    return np.array(rows, dtype=np.uint64).reshape(-1, NUM_PIECE_COLUMNS)
+
+
+def _as_batch(bitboards):
+    bitboards = np.asarray(bitboards, dtype=np.uint64)
+    if bitboards.ndim != 2 or bitboards.shape[1] != NUM_PIECE_COLUMNS:
+        raise ValueError(
+            f"Expected an (N, {NUM_PIECE_COLUMNS}) array of piece bitboards, "
+            f"got shape {bitboards.shape}"
+        )
+    return bitboards
+
+
+def _colour_columns(bitboards, colour_index):
+    start = colour_index * COLUMNS_PER_COLOUR
+    return bitboards[:, start : start + COLUMNS_PER_COLOUR]
+
+
+def _sliding_attacks(sliders, empty, shifts):
+    """Kogge-Stone occluded fill of 'sliders' through 'empty' in each direction"""
+    attacks = np.zeros_like(sliders)
+    for amount, mask in shifts:
+        generator = sliders
+        propagator = empty & mask
+        generator = generator | (propagator & _shift(generator, amount))
+        propagator = propagator & _shift(propagator, amount)
+        generator = generator | (propagator & _shift(generator, 2 * amount))
+        propagator = propagator & _shift(propagator, 2 * amount)
+        generator = generator | (propagator & _shift(generator, 4 * amount))
+        attacks |= _shift(generator, amount) & mask
+    return attacks
+
+
+def _step_attacks(pieces, shifts):
+    """Union of single shifts (knight and king moves)"""
+    attacks = np.zeros_like(pieces)
+    for amount, mask in shifts:
+        attacks |= _shift(pieces, amount) & mask
+    return attacks
+
+
+def _pawn_attacks(pawns, white):
+    if white:
+        return ((pawns << np.uint64(9)) & _NOT_A) | ((pawns << np.uint64(7)) & _NOT_H)
+    return ((pawns >> np.uint64(7)) & _NOT_A) | ((pawns >> np.uint64(9)) & _NOT_H)
+
+
+def _side_attacks(pieces, empty, white):
+    """Attack map of one side, given its (N, 6) piece columns"""
+    queens = pieces[:, QUEEN_COLUMN]
+    return (
+        _pawn_attacks(pieces[:, PAWN_COLUMN], white)
+        | _step_attacks(pieces[:, KNIGHT_COLUMN], KNIGHT_SHIFTS)
+        | _sliding_attacks(pieces[:, BISHOP_COLUMN] | queens, empty, DIAGONAL_SHIFTS)
+        | _sliding_attacks(pieces[:, ROOK_COLUMN] | queens, empty, ORTHOGONAL_SHIFTS)
+        | _step_attacks(pieces[:, KING_COLUMN], KING_SHIFTS)
+    )
+
+
+def attack_maps(bitboards):
+    """
+    Squares attacked by each side.
+
+    Parameters:
+    bitboards: (N, 12) uint64 piece bitboards
+
+    Returns:
+    (N, 2) uint64 array: [white attacks, black attacks] per position
+    """
+    bitboards = _as_batch(bitboards)
+    empty = ~np.bitwise_or.reduce(bitboards, axis=1)
+    attacks = np.empty((len(bitboards), 2), dtype=np.uint64)
+    attacks[:, 0] = _side_attacks(_colour_columns(bitboards, 0), empty, True)
+    attacks[:, 1] = _side_attacks(_colour_columns(bitboards, 1), empty, False)
+    return attacks
+
+
+def in_check(bitboards):
+    """
+    Whether each side's king is attacked.
+
+    Parameters:
+    bitboards: (N, 12) uint64 piece bitboards
+
+    Returns:
+    (N, 2) bool array: [white in check, black in check] per position
+    """
+    bitboards = _as_batch(bitboards)
+    attacks = attack_maps(bitboards)
+    white_king = bitboards[:, KING_COLUMN]
+    black_king = bitboards[:, COLUMNS_PER_COLOUR + KING_COLUMN]
+    return np.stack(
+        ((white_king & attacks[:, 1]) != 0, (black_king & attacks[:, 0]) != 0), axis=1
+    )
+
+
+def mobility(bitboards):
+    """
+    Mobility of each side: the number of squares each knight, bishop, rook
+    and queen attacks that are not occupied by a friendly piece, summed over
+    the pieces. Pins and checks are ignored (pseudo-legal mobility).
+
+    Parameters:
+    bitboards: (N, 12) uint64 piece bitboards
+
+    Returns:
+    (N, 2) int64 array: [white mobility, black mobility] per position
+    """
+    bitboards = _as_batch(bitboards)
+    empty = ~np.bitwise_or.reduce(bitboards, axis=1)
+    counts = np.zeros((len(bitboards), 2), dtype=np.int64)
+
+    for colour_index in (0, 1):
+        pieces = _colour_columns(bitboards, colour_index)
+        not_own = ~np.bitwise_or.reduce(pieces, axis=1)
+        for column, attack_function in (
+            (KNIGHT_COLUMN, lambda p: _step_attacks(p, KNIGHT_SHIFTS)),
+            (BISHOP_COLUMN, lambda p: _sliding_attacks(p, empty, DIAGONAL_SHIFTS)),
+            (ROOK_COLUMN, lambda p: _sliding_attacks(p, empty, ORTHOGONAL_SHIFTS)),
+            (QUEEN_COLUMN, lambda p: _sliding_attacks(p, empty, KING_SHIFTS)),
+        ):
+            # Fill one piece per row at a time so overlapping attacks of two
+            # pieces are both counted; loops as often as the most pieces of
+            # this type in any row
+            remaining = pieces[:, column].copy()
+            while remaining.any():
+                lowest = remaining & (~remaining + np.uint64(1))
+                counts[:, colour_index] += pop_count(attack_function(lowest) & not_own)
+                remaining ^= lowest
+
+    return counts
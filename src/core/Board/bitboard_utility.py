@@ -78,3 +78,104 @@ KNIGHT_ATTACKS = [knight_attacks(sq) for sq in range(64)]
 KING_MOVES = [king_attacks(sq) for sq in range(64)]
 WHITE_PAWN_ATTACKS = [white_pawn_attacks(sq) for sq in range(64)]
 BLACK_PAWN_ATTACKS = [black_pawn_attacks(sq) for sq in range(64)]
+
+# Ray tables: squares reached from a square in each direction up to the
+# board edge (the start square excluded)
+# (opposite directions differ only in the lowest bit)
+NORTH, SOUTH, EAST, WEST, NORTH_EAST, SOUTH_WEST, NORTH_WEST, SOUTH_EAST = range(8)
+DIRECTION_DELTAS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1)]
+ORTHOGONAL_DIRECTIONS = (NORTH, SOUTH, EAST, WEST)
+DIAGONAL_DIRECTIONS = (NORTH_EAST, SOUTH_WEST, NORTH_WEST, SOUTH_EAST)
+
+def ray_attacks(square, direction):
+    attacks = 0
+    dr, df = DIRECTION_DELTAS[direction]
+    r, f = square // 8 + dr, square % 8 + df
+    while 0 <= r < 8 and 0 <= f < 8:
+        attacks |= 1 << (r * 8 + f)
+        r, f = r + dr, f + df
+    return attacks
+
+def opposite_direction(direction):
+    return direction ^ 1
+
+RAYS = [[ray_attacks(sq, d) for sq in range(64)] for d in range(8)]
+
+def build_line_tables():
+    """
+    BETWEEN[a][b]: squares strictly between a and b.
+    LINE[a][b]: the whole line (rank, file or diagonal) through a and b,
+    both included.
+    Both are 0 when the squares do not share a line.
+    """
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        for direction in range(8):
+            ray = RAYS[direction][a]
+            back_ray = RAYS[opposite_direction(direction)][a]
+            targets = ray
+            while targets:
+                lsb = targets & -targets
+                targets ^= lsb
+                b = lsb.bit_length() - 1
+                between[a][b] = ray & RAYS[opposite_direction(direction)][b]
+                line[a][b] = ray | back_ray | (1 << a)
+    return between, line
+
+BETWEEN, LINE = build_line_tables()
+
+# File, rank and board masks
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+FILE_A = 0x0101010101010101
+FILE_H = 0x8080808080808080
+NOT_FILE_A = FULL_BOARD ^ FILE_A
+NOT_FILE_H = FULL_BOARD ^ FILE_H
+RANK_1 = 0x00000000000000FF
+RANK_2 = 0x000000000000FF00
+RANK_3 = 0x0000000000FF0000
+RANK_6 = 0x0000FF0000000000
+RANK_7 = 0x00FF000000000000
+RANK_8 = 0xFF00000000000000
+DARK_SQUARES = 0xAA55AA55AA55AA55
+LIGHT_SQUARES = FULL_BOARD ^ DARK_SQUARES
+
+FILE_MASKS = [FILE_A << file for file in range(8)]
+ADJACENT_FILE_MASKS = [
+    (FILE_MASKS[file - 1] if file > 0 else 0) | (FILE_MASKS[file + 1] if file < 7 else 0)
+    for file in range(8)
+]
+
+# Pawn structure masks, indexed by square
+def ranks_above(rank):
+    """Squares on the ranks strictly above 'rank'"""
+    return (FULL_BOARD << (8 * (rank + 1))) & FULL_BOARD
+
+def ranks_below(rank):
+    """Squares on the ranks strictly below 'rank'"""
+    return (1 << (8 * rank)) - 1
+
+# Squares that must be free of enemy pawns for a pawn to be passed
+WHITE_PASSED_PAWN_MASKS = [
+    (FILE_MASKS[sq % 8] | ADJACENT_FILE_MASKS[sq % 8]) & ranks_above(sq // 8)
+    for sq in range(64)
+]
+BLACK_PASSED_PAWN_MASKS = [
+    (FILE_MASKS[sq % 8] | ADJACENT_FILE_MASKS[sq % 8]) & ranks_below(sq // 8)
+    for sq in range(64)
+]
+# Squares on adjacent files, level with or behind a pawn, from which a
+# friendly pawn could defend it now or by advancing
+WHITE_PAWN_SUPPORT_MASKS = [
+    ADJACENT_FILE_MASKS[sq % 8] & ranks_below(sq // 8 + 1) for sq in range(64)
+]
+BLACK_PAWN_SUPPORT_MASKS = [
+    ADJACENT_FILE_MASKS[sq % 8] & ranks_above(sq // 8 - 1) for sq in range(64)
+]
+
+# Population count (number of set bits)
+if hasattr(int, "bit_count"):  # Python 3.10+
+    pop_count = int.bit_count
+else:
+    def pop_count(bitboard):
+        return bin(bitboard).count("1")
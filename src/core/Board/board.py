@@ -1,20 +1,93 @@
-from collections import deque
+from array import array
 from src.core.Board.piece import *
 from src.core.Board.piece_list import PieceList
-from src.core.Board.move import Move
+from src.core.Board.move import (
+    Move,
+    START_SQUARE_MASK,
+    TARGET_SQUARE_SHIFT,
+    FLAG_SHIFT,
+    PROMOTION_VALUE,
+)
 from src.core.Board.bitboard_utility import *
 from src.core.Board.magic import *
-from src.core.Board.game_state import GameState
+from src.core.Board.game_state import (
+    GameState,
+    pack_game_state,
+    CAPTURED_PIECE_MASK,
+    EN_PASSANT_SHIFT,
+    EN_PASSANT_MASK,
+    CASTLING_SHIFT,
+    CASTLING_MASK,
+    FIFTY_MOVE_SHIFT,
+)
 from src.core.Board.zobrist import Zobrist
+from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.game_result import (
+    IN_PROGRESS,
+    CHECKMATE,
+    STALEMATE,
+    FIFTY_MOVE_RULE,
+    THREEFOLD_REPETITION,
+    INSUFFICIENT_MATERIAL,
+)
+from src.core.Board.piece_square_tables import (
+    PSQT_MIDDLE_GAME,
+    PSQT_END_GAME,
+    PHASE_WEIGHTS,
+)
 from src.core.helper.board_helper import *
 from src.core.helper.move_utility import *
 from src.core.helper.fen_utility import *
 
 
+# Initial number of plies the game state stacks hold (they grow on demand)
+STATE_STACK_SIZE = 64
+
+
 class Board:
     WHITE_INDEX = 0
     BLACK_INDEX = 1
 
+    __slots__ = (
+        "square",
+        "king_square",
+        "piece_bitboards",
+        "colour_bitboards",
+        "all_pieces_bitboard",
+        "friendly_orthogonal_sliders",
+        "friendly_diagonal_sliders",
+        "enemy_orthogonal_sliders",
+        "enemy_diagonal_sliders",
+        "total_piece_count_without_pawns_and_kings",
+        "game_phase",
+        "psqt_middle_game",
+        "psqt_end_game",
+        "rooks",
+        "bishops",
+        "queens",
+        "knights",
+        "pawns",
+        "all_piece_lists",
+        "is_white_to_move",
+        "ply_count",
+        "all_game_moves",
+        "en_passant_file",
+        "castling_rights",
+        "fifty_move_counter",
+        "zobrist_key",
+        "pawn_key",
+        "state_index",
+        "state_stack",
+        "zobrist_key_stack",
+        "pawn_key_stack",
+        "repetition_counts",
+        "repetition_counts_stack",
+        "cached_in_check_value",
+        "has_cached_in_check_value",
+        "debug_zobrist",
+        "debug_psqt",
+    )
+
     def __init__(self):
         # Chess board data structure
         self.square = [
@@ -35,6 +108,11 @@ class Board:
 
         # Piece statistics
         self.total_piece_count_without_pawns_and_kings = 0
+        self.game_phase = 0  # Sum of PHASE_WEIGHTS over all pieces on the board
+
+        # Running material + piece-square scores [white, black]
+        self.psqt_middle_game = [0, 0]
+        self.psqt_end_game = [0, 0]
 
         # List of pieces by type
         self.rooks = [PieceList(10), PieceList(10)]
@@ -49,18 +127,37 @@ class Board:
         self.is_white_to_move = True  # Whether it's white's turn or not
         self.ply_count = 0  # Number of moves
         self.all_game_moves = []  # Move history
-        self.current_game_state = None  # Current game state
+
+        # Irreversible state of the current position
+        self.en_passant_file = 0  # File (1-8) of a pawn that just moved two squares, 0 if none
+        self.castling_rights = 0  # 1 white kingside, 2 white queenside, 4 black kingside, 8 black queenside
+        self.fifty_move_counter = 0  # Plies since the last capture or pawn move
+        self.zobrist_key = 0  # Zobrist key of the position
+        self.pawn_key = 0  # Zobrist key of the pawns only, for the pawn hash table
+
+        # Game state history for undoing moves: one packed entry per ply
+        # (see game_state.py), preallocated and indexed by state_index
+        self.state_index = 0
+        self.state_stack = array("Q", bytes(8 * STATE_STACK_SIZE))
+        self.zobrist_key_stack = array("Q", bytes(8 * STATE_STACK_SIZE))
+        self.pawn_key_stack = array("Q", bytes(8 * STATE_STACK_SIZE))
 
         # History and cache
-        self.repetition_position_history = deque(
-            maxlen=64
-        )  # Position history for repetition checking
-        self.game_state_history = deque(
-            maxlen=64
-        )  # Game state history for undoing moves
+        # Occurrences of each Zobrist key since the last irreversible move, so
+        # the number of repetitions of a position is a single lookup. Positions
+        # before the last capture, pawn move or castling-right change can never
+        # occur again: such a move (and a null move, which no real game
+        # contains) starts a new dict, and the dict of the previous span is
+        # kept on repetition_counts_stack until the move is unmade.
+        self.repetition_counts = {}
+        self.repetition_counts_stack = []
         self.cached_in_check_value = False  # Cached check value
         self.has_cached_in_check_value = False  # Whether there is a cached value or not
 
+        # Debugging
+        self.debug_zobrist = False  # Verify the incremental Zobrist and pawn keys after every move
+        self.debug_psqt = False  # Verify the running piece-square scores and game phase after every move
+
     def _init_piece_lists(self):
         """Initialize the piece lists"""
         self.all_piece_lists[WHITE_PAWN] = self.pawns[self.WHITE_INDEX]
@@ -104,74 +201,64 @@ class Board:
         return self.BLACK_INDEX if self.is_white_to_move else self.WHITE_INDEX
 
     @property
-    def fifty_move_counter(self):
-        """50-move rule counter"""
-        return (
-            self.current_game_state.fifty_move_counter if self.current_game_state else 0
+    def current_game_state(self):
+        """Snapshot of the irreversible state of the current position"""
+        return GameState.from_packed(
+            self.state_stack[self.state_index], self.zobrist_key, self.pawn_key
         )
 
-    @property
-    def zobrist_key(self):
-        """Zobrist key of the current state"""
-        return self.current_game_state.zobrist_key if self.current_game_state else 0
+    def _push_game_state(self, packed_state):
+        """Store the state of a new ply on top of the stacks"""
+        index = self.state_index + 1
+        if index == len(self.state_stack):
+            self.state_stack.extend(self.state_stack)
+            self.zobrist_key_stack.extend(self.zobrist_key_stack)
+            self.pawn_key_stack.extend(self.pawn_key_stack)
+        self.state_stack[index] = packed_state
+        self.zobrist_key_stack[index] = self.zobrist_key
+        self.pawn_key_stack[index] = self.pawn_key
+        self.state_index = index
+
+    def _pop_game_state(self):
+        """Drop the state of the current ply and restore the previous one"""
+        index = self.state_index - 1
+        packed_state = self.state_stack[index]
+        self.en_passant_file = (packed_state >> EN_PASSANT_SHIFT) & EN_PASSANT_MASK
+        self.castling_rights = (packed_state >> CASTLING_SHIFT) & CASTLING_MASK
+        self.fifty_move_counter = packed_state >> FIFTY_MOVE_SHIFT
+        self.zobrist_key = self.zobrist_key_stack[index]
+        self.pawn_key = self.pawn_key_stack[index]
+        self.state_index = index
 
     def make_move(self, move, in_search=False):
-        """Make a move"""
-        from src.core.Board.piece import piece_type, KING
-        
+        """
+        Make a move, given either as a Move or as a packed 16-bit integer
+        """
+        if move.__class__ is not int:
+            move = move.value
+
         # Get basic move information
-        start_square = move.start_square
-        target_square = move.target_square
-        move_flag = move.move_flag
-        is_promotion = move.is_promotion
+        start_square = move & START_SQUARE_MASK
+        target_square = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+        move_flag = move >> FLAG_SHIFT
+        is_promotion = move >= PROMOTION_VALUE
         is_en_passant = move_flag == Move.EN_PASSANT_CAPTURE_FLAG
-        
-        # Check if the target square has a king - prevent king captures
-        target_piece = self.square[target_square]
-        if piece_type(target_piece) == KING:
-            # This move would capture a king, which is illegal in chess
-            # In normal chess, this situation should never occur as it would be an invalid move
-            return False
 
-        # Get piece information
-        moved_piece = self.square[start_square]
-        moved_piece_type = piece_type(moved_piece)
-        target_piece_type = piece_type(target_piece)
-        
-        # Save previous state before making move
-        new_en_passant_file = 0
-        captured_piece_type = piece_type(target_piece)
-        prev_castle_state = (
-            0 if not self.current_game_state else self.current_game_state.castling_rights
-        )
-        new_castling_rights = prev_castle_state
+        target_piece = self.square[target_square]
 
-        # Save history
-        if not in_search:
-            if self.current_game_state:
-                self.game_state_history.append(self.current_game_state)
-                self.repetition_position_history.append(
-                    self.current_game_state.zobrist_key
-                )
-            self.all_game_moves.append(move)
-        
         # Related pieces
         moved_piece = self.square[start_square]
         moved_piece_type = piece_type(moved_piece)
         captured_piece = (
-            self.square[target_square]
-            if not is_en_passant
-            else make_piece(PAWN, self.opponent_colour)
+            target_piece if not is_en_passant else make_piece(PAWN, self.opponent_colour)
         )
         captured_piece_type = piece_type(captured_piece)
 
         # Game state
-        prev_castle_state = (
-            self.current_game_state.castling_rights if self.current_game_state else 0
-        )
-        new_zobrist_key = (
-            self.current_game_state.zobrist_key if self.current_game_state else 0
-        )
+        prev_castle_state = self.castling_rights
+        prev_en_passant_file = self.en_passant_file
+        new_zobrist_key = self.zobrist_key
+        new_pawn_key = self.pawn_key
         new_castling_rights = prev_castle_state
         new_en_passant_file = 0
 
@@ -180,14 +267,9 @@ class Board:
             capture_square = target_square
             if is_en_passant:
                 capture_square = target_square + (-8 if self.is_white_to_move else 8)
-                
-            # Get the piece_list for the captured piece
-            piece_list = self.all_piece_lists[captured_piece]
-            
-            # Check if the piece_list exists and if the square is in the map
-            if piece_list is not None and piece_list.map[capture_square] is not None:
-                piece_list.remove_piece_at_square(capture_square)
-                
+
+            self.all_piece_lists[captured_piece].remove_piece_at_square(capture_square)
+
             self.piece_bitboards[captured_piece] = clear_square(
                 self.piece_bitboards[captured_piece], capture_square
             )
@@ -195,17 +277,33 @@ class Board:
                 self.colour_bitboards[self.opponent_colour_index], capture_square
             )
             self.square[capture_square] = NONE
+            new_zobrist_key ^= Zobrist.pieces_array[captured_piece][capture_square]
+            if captured_piece_type == PAWN:
+                new_pawn_key ^= Zobrist.pieces_array[captured_piece][capture_square]
+            self.psqt_middle_game[captured_piece >> 3] -= PSQT_MIDDLE_GAME[captured_piece][capture_square]
+            self.psqt_end_game[captured_piece >> 3] -= PSQT_END_GAME[captured_piece][capture_square]
+            self.game_phase -= PHASE_WEIGHTS[captured_piece_type]
+            if captured_piece_type != PAWN:
+                self.total_piece_count_without_pawns_and_kings -= 1
 
         # Move the piece
         self.move_piece(moved_piece, start_square, target_square)
+        new_zobrist_key ^= Zobrist.pieces_array[moved_piece][start_square]
+        new_zobrist_key ^= Zobrist.pieces_array[moved_piece][target_square]
+        if moved_piece_type == PAWN:
+            new_pawn_key ^= Zobrist.pieces_array[moved_piece][start_square]
+            if not is_promotion:
+                new_pawn_key ^= Zobrist.pieces_array[moved_piece][target_square]
 
         # Handle king movement and castling
         if moved_piece_type == KING:
             self.king_square[self.move_colour_index] = target_square
             new_castling_rights &= (
                 GameState.CLEAR_WHITE_KINGSIDE_MASK
+                & GameState.CLEAR_WHITE_QUEENSIDE_MASK
                 if self.is_white_to_move
                 else GameState.CLEAR_BLACK_KINGSIDE_MASK
+                & GameState.CLEAR_BLACK_QUEENSIDE_MASK
             )
             if move_flag == Move.CASTLE_FLAG:
                 kingside = target_square in [62, 6]
@@ -215,6 +313,8 @@ class Board:
                 castling_rook_to = target_square - 1 if kingside else target_square + 1
                 rook_piece = make_piece(ROOK, self.move_colour)
                 self.move_piece(rook_piece, castling_rook_from, castling_rook_to)
+                new_zobrist_key ^= Zobrist.pieces_array[rook_piece][castling_rook_from]
+                new_zobrist_key ^= Zobrist.pieces_array[rook_piece][castling_rook_to]
 
         # Handle pawn promotion
         if is_promotion:
@@ -234,6 +334,19 @@ class Board:
                 self.piece_bitboards[promotion_piece], target_square
             )
             self.square[target_square] = promotion_piece
+            new_zobrist_key ^= Zobrist.pieces_array[moved_piece][target_square]
+            new_zobrist_key ^= Zobrist.pieces_array[promotion_piece][target_square]
+            colour_index = moved_piece >> 3
+            self.psqt_middle_game[colour_index] += (
+                PSQT_MIDDLE_GAME[promotion_piece][target_square]
+                - PSQT_MIDDLE_GAME[moved_piece][target_square]
+            )
+            self.psqt_end_game[colour_index] += (
+                PSQT_END_GAME[promotion_piece][target_square]
+                - PSQT_END_GAME[moved_piece][target_square]
+            )
+            self.game_phase += PHASE_WEIGHTS[promotion_piece_type]
+            self.total_piece_count_without_pawns_and_kings += 1
 
         # Handle pawn moving two squares
         if move_flag == Move.PAWN_TWO_UP_FLAG:
@@ -260,20 +373,23 @@ class Board:
                         new_castling_rights
                     )
 
+        # Hash castling rights, en passant file and side to move
+        if new_castling_rights != prev_castle_state:
+            new_zobrist_key ^= Zobrist.castling_rights[prev_castle_state]
+            new_zobrist_key ^= Zobrist.castling_rights[new_castling_rights]
+        if new_en_passant_file != prev_en_passant_file:
+            new_zobrist_key ^= Zobrist.en_passant_file[prev_en_passant_file]
+            new_zobrist_key ^= Zobrist.en_passant_file[new_en_passant_file]
+        new_zobrist_key ^= Zobrist.side_to_move
+
         # Update turn and counters
         self.is_white_to_move = not self.is_white_to_move
         self.ply_count += 1
-        new_fifty_move_counter = (
-            (self.current_game_state.fifty_move_counter + 1)
-            if self.current_game_state
-            else 0
-        )
+        new_fifty_move_counter = self.fifty_move_counter + 1
 
         # Reset 50-move counter if moving a pawn or capturing a piece
         if moved_piece_type == PAWN or captured_piece_type != NONE:
             new_fifty_move_counter = 0
-            if not in_search:
-                self.repetition_position_history.clear()
 
         # Update bitboards and state
         self.all_pieces_bitboard = (
@@ -281,35 +397,51 @@ class Board:
             | self.colour_bitboards[self.BLACK_INDEX]
         )
         self.update_slider_bitboards()
-        new_zobrist_key ^= Zobrist.side_to_move
 
         # Update board state
-        new_state = GameState(
-            captured_piece_type,
-            new_en_passant_file,
-            new_castling_rights,
-            new_fifty_move_counter,
-            new_zobrist_key,
+        self.en_passant_file = new_en_passant_file
+        self.castling_rights = new_castling_rights
+        self.fifty_move_counter = new_fifty_move_counter
+        self.zobrist_key = new_zobrist_key
+        self.pawn_key = new_pawn_key
+        self._push_game_state(
+            pack_game_state(
+                captured_piece_type,
+                new_en_passant_file,
+                new_castling_rights,
+                new_fifty_move_counter,
+            )
         )
-        self.game_state_history.append(new_state)
-        self.current_game_state = new_state
         self.has_cached_in_check_value = False
 
-        # Cập nhật lịch sử
+        # Update history (search moves count too, so the search sees repetitions)
+        if new_fifty_move_counter == 0 or new_castling_rights != prev_castle_state:
+            self.repetition_counts_stack.append(self.repetition_counts)
+            self.repetition_counts = {new_zobrist_key: 1}
+        else:
+            repetition_counts = self.repetition_counts
+            repetition_counts[new_zobrist_key] = repetition_counts.get(new_zobrist_key, 0) + 1
         if not in_search:
-            self.repetition_position_history.append(new_state.zobrist_key)
-            self.all_game_moves.append(move)
+            self.all_game_moves.append(Move.from_value(move))
+
+        if self.debug_zobrist:
+            self.verify_zobrist_key()
+        if self.debug_psqt:
+            self.verify_psqt_scores()
 
     def unmake_move(self, move, in_search=False):
-        """Undo a move"""
+        """Undo a move, given either as a Move or as a packed 16-bit integer"""
+        if move.__class__ is not int:
+            move = move.value
+
         # Switch turn
         self.is_white_to_move = not self.is_white_to_move
 
         # Move information
-        moved_from = move.start_square
-        moved_to = move.target_square
-        move_flag = move.move_flag
-        is_promotion = move.is_promotion
+        moved_from = move & START_SQUARE_MASK
+        moved_to = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+        move_flag = move >> FLAG_SHIFT
+        is_promotion = move >= PROMOTION_VALUE
 
         # Pieces
         moved_piece = (
@@ -318,14 +450,7 @@ class Board:
             else make_piece(PAWN, self.move_colour)
         )
         moved_piece_type = piece_type(moved_piece)
-        
-        # Handle case where the move was rejected during make_move
-        # This might happen if the move was attempting to capture a king
-        if not self.current_game_state:
-            # This move was never actually applied, nothing to undo
-            return
-            
-        captured_piece_type = self.current_game_state.captured_piece_type
+        captured_piece_type = self.state_stack[self.state_index] & CAPTURED_PIECE_MASK
 
         # Move type
         undoing_en_passant = move_flag == Move.EN_PASSANT_CAPTURE_FLAG
@@ -343,6 +468,17 @@ class Board:
             self.piece_bitboards[pawn_piece] = set_square(
                 self.piece_bitboards[pawn_piece], moved_to
             )
+            colour_index = pawn_piece >> 3
+            self.psqt_middle_game[colour_index] += (
+                PSQT_MIDDLE_GAME[pawn_piece][moved_to]
+                - PSQT_MIDDLE_GAME[promoted_piece][moved_to]
+            )
+            self.psqt_end_game[colour_index] += (
+                PSQT_END_GAME[pawn_piece][moved_to]
+                - PSQT_END_GAME[promoted_piece][moved_to]
+            )
+            self.game_phase -= PHASE_WEIGHTS[piece_type(promoted_piece)]
+            self.total_piece_count_without_pawns_and_kings -= 1
 
         # Move piece back to original position
         self.move_piece(moved_piece, moved_to, moved_from)
@@ -360,12 +496,13 @@ class Board:
                 self.colour_bitboards[self.opponent_colour_index], capture_square
             )
             
-            # Safely add the piece back to its list
-            piece_list = self.all_piece_lists[captured_piece]
-            if piece_list is not None:
-                piece_list.add_piece_at_square(capture_square)
-                
+            self.all_piece_lists[captured_piece].add_piece_at_square(capture_square)
             self.square[capture_square] = captured_piece
+            self.psqt_middle_game[captured_piece >> 3] += PSQT_MIDDLE_GAME[captured_piece][capture_square]
+            self.psqt_end_game[captured_piece >> 3] += PSQT_END_GAME[captured_piece][capture_square]
+            self.game_phase += PHASE_WEIGHTS[captured_piece_type]
+            if captured_piece_type != PAWN:
+                self.total_piece_count_without_pawns_and_kings += 1
 
         # Handle castling
         if moved_piece_type == KING and move_flag == Move.CASTLE_FLAG:
@@ -386,55 +523,119 @@ class Board:
         )
         self.update_slider_bitboards()
 
-        # Update history
-        if not in_search and self.repetition_position_history:
-            self.repetition_position_history.pop()
-            if self.all_game_moves:
-                self.all_game_moves.pop()
+        # Update history: the first position of a span is only removed by
+        # unmaking the move that started the span
+        repetition_counts = self.repetition_counts
+        count = repetition_counts[self.zobrist_key] - 1
+        if count:
+            repetition_counts[self.zobrist_key] = count
+        else:
+            del repetition_counts[self.zobrist_key]
+            if not repetition_counts:
+                self.repetition_counts = self.repetition_counts_stack.pop()
+        if not in_search and self.all_game_moves:
+            self.all_game_moves.pop()
 
         # Restore board state
-        if self.game_state_history:
-            self.game_state_history.pop()
-            if self.game_state_history:
-                self.current_game_state = self.game_state_history[-1]
+        self._pop_game_state()
 
         self.ply_count -= 1
         self.has_cached_in_check_value = False
 
+        if self.debug_zobrist:
+            self.verify_zobrist_key()
+        if self.debug_psqt:
+            self.verify_psqt_scores()
+
     def make_null_move(self):
         """Make a null move (just switching turns without changing the board)"""
         self.is_white_to_move = not self.is_white_to_move
         self.ply_count += 1
-        new_zobrist_key = (
-            self.current_game_state.zobrist_key
-            ^ Zobrist.side_to_move
-            ^ Zobrist.en_passant_file[self.current_game_state.en_passant_file]
+        self.zobrist_key ^= (
+            Zobrist.side_to_move ^ Zobrist.en_passant_file[self.en_passant_file]
         )
-        new_state = GameState(
-            NONE,
-            0,
-            self.current_game_state.castling_rights,
-            self.current_game_state.fifty_move_counter + 1,
-            new_zobrist_key,
+        self.en_passant_file = 0
+        self.fifty_move_counter += 1
+        self._push_game_state(
+            pack_game_state(NONE, 0, self.castling_rights, self.fifty_move_counter)
         )
-        self.current_game_state = new_state
-        self.game_state_history.append(new_state)
         self.update_slider_bitboards()
         self.has_cached_in_check_value = True
         self.cached_in_check_value = False
+        # Positions before a null move do not repeat across it
+        self.repetition_counts_stack.append(self.repetition_counts)
+        self.repetition_counts = {self.zobrist_key: 1}
+
+        if self.debug_zobrist:
+            self.verify_zobrist_key()
 
     def unmake_null_move(self):
         """Undo a null move"""
         self.is_white_to_move = not self.is_white_to_move
         self.ply_count -= 1
-        if self.game_state_history:
-            self.game_state_history.pop()
-            if self.game_state_history:
-                self.current_game_state = self.game_state_history[-1]
+        self.repetition_counts = self.repetition_counts_stack.pop()
+        self._pop_game_state()
         self.update_slider_bitboards()
         self.has_cached_in_check_value = True
         self.cached_in_check_value = False
 
+    def verify_zobrist_key(self):
+        """Check the incremental Zobrist and pawn keys against a full recomputation"""
+        expected_key = Zobrist.calculate_zobrist_key(self)
+        if self.zobrist_key != expected_key:
+            raise AssertionError(
+                f"Zobrist key mismatch at ply {self.ply_count}: "
+                f"incremental {self.zobrist_key:#018x}, expected {expected_key:#018x}"
+            )
+        expected_pawn_key = Zobrist.calculate_pawn_key(self)
+        if self.pawn_key != expected_pawn_key:
+            raise AssertionError(
+                f"Pawn key mismatch at ply {self.ply_count}: "
+                f"incremental {self.pawn_key:#018x}, expected {expected_pawn_key:#018x}"
+            )
+
+    def calculate_psqt_scores(self):
+        """
+        Recompute the material + piece-square scores from scratch.
+        Returns ([white, black] middlegame, [white, black] endgame).
+        """
+        middle_game = [0, 0]
+        end_game = [0, 0]
+        for square_index, piece in enumerate(self.square):
+            if piece != NONE:
+                middle_game[piece >> 3] += PSQT_MIDDLE_GAME[piece][square_index]
+                end_game[piece >> 3] += PSQT_END_GAME[piece][square_index]
+        return middle_game, end_game
+
+    def calculate_game_phase(self):
+        """Recompute the game phase from scratch"""
+        return sum(PHASE_WEIGHTS[piece_type(piece)] for piece in self.square)
+
+    def verify_psqt_scores(self):
+        """Check the running piece-square scores and game phase against a full recomputation"""
+        middle_game, end_game = self.calculate_psqt_scores()
+        if middle_game != self.psqt_middle_game or end_game != self.psqt_end_game:
+            raise AssertionError(
+                f"Piece-square score mismatch at ply {self.ply_count}: "
+                f"incremental {self.psqt_middle_game}/{self.psqt_end_game}, "
+                f"expected {middle_game}/{end_game}"
+            )
+        game_phase = self.calculate_game_phase()
+        if game_phase != self.game_phase:
+            raise AssertionError(
+                f"Game phase mismatch at ply {self.ply_count}: "
+                f"incremental {self.game_phase}, expected {game_phase}"
+            )
+        piece_count = sum(
+            1 for piece in self.square if piece_type(piece) not in (NONE, PAWN, KING)
+        )
+        if piece_count != self.total_piece_count_without_pawns_and_kings:
+            raise AssertionError(
+                f"Piece count mismatch at ply {self.ply_count}: "
+                f"incremental {self.total_piece_count_without_pawns_and_kings}, "
+                f"expected {piece_count}"
+            )
+
     def is_in_check(self):
         """Check if the king is in check"""
         if self.has_cached_in_check_value:
@@ -445,37 +646,99 @@ class Board:
 
     def calculate_in_check_state(self):
         """Calculate the check state"""
-        king_square = self.king_square[self.move_colour_index]
-        blockers = self.all_pieces_bitboard
+        return self.is_square_attacked(
+            self.king_square[self.move_colour_index], self.opponent_colour
+        )
 
-        # Check for checks from rooks and queen
-        if self.enemy_orthogonal_sliders != 0:
-            rook_attacks = get_rook_attacks(king_square, blockers)
-            if rook_attacks & self.enemy_orthogonal_sliders:
-                return True
-
-        # Check for checks from bishops and queen
-        if self.enemy_diagonal_sliders != 0:
-            bishop_attacks = get_bishop_attacks(king_square, blockers)
-            if bishop_attacks & self.enemy_diagonal_sliders:
-                return True
-
-        # Check for checks from knights
-        enemy_knights = self.piece_bitboards[make_piece(KNIGHT, self.opponent_colour)]
-        if KNIGHT_ATTACKS[king_square] & enemy_knights:
+    def game_result(self):
+        """
+        Terminal state of the current position (see game_result.py):
+        checkmate or stalemate if the side to move has no legal move,
+        otherwise a draw by the fifty-move rule, threefold repetition or
+        insufficient material, or IN_PROGRESS
+        """
+        if not MoveGenerator(self).has_legal_move():
+            return CHECKMATE if self.is_in_check() else STALEMATE
+        if self.fifty_move_counter >= 100:
+            return FIFTY_MOVE_RULE
+        if self.repetition_count() >= 3:
+            return THREEFOLD_REPETITION
+        if self.has_insufficient_material():
+            return INSUFFICIENT_MATERIAL
+        return IN_PROGRESS
+
+    def repetition_count(self):
+        """
+        Number of times the current position has occurred in the game since
+        the last irreversible move, including moves made by the search and
+        the current occurrence
+        """
+        return self.repetition_counts.get(self.zobrist_key, 0)
+
+    def has_insufficient_material(self):
+        """
+        Check if neither side can possibly checkmate: bare kings, a single
+        minor piece, or only bishops that all stand on squares of one colour
+        """
+        pieces = self.piece_bitboards
+        if (
+            pieces[WHITE_PAWN]
+            | pieces[BLACK_PAWN]
+            | pieces[WHITE_ROOK]
+            | pieces[BLACK_ROOK]
+            | pieces[WHITE_QUEEN]
+            | pieces[BLACK_QUEEN]
+        ):
+            return False
+        knights = pieces[WHITE_KNIGHT] | pieces[BLACK_KNIGHT]
+        bishops = pieces[WHITE_BISHOP] | pieces[BLACK_BISHOP]
+        if pop_count(knights | bishops) <= 1:
             return True
+        return not knights and (
+            not bishops & DARK_SQUARES or not bishops & LIGHT_SQUARES
+        )
 
-        # Check for checks from pawns
-        enemy_pawns = self.piece_bitboards[make_piece(PAWN, self.opponent_colour)]
-        pawn_attack_mask = (
-            WHITE_PAWN_ATTACKS[king_square]
-            if self.is_white_to_move
-            else BLACK_PAWN_ATTACKS[king_square]
+    def is_mover_in_check(self):
+        """
+        Check, right after make_move, whether the side that just moved left
+        its own king attacked, i.e. whether a pseudo-legal move was illegal
+        """
+        return self.is_square_attacked(
+            self.king_square[self.opponent_colour_index], self.move_colour
         )
-        if pawn_attack_mask & enemy_pawns:
+
+    def is_square_attacked(self, square, by_colour):
+        """
+        Check if any piece of 'by_colour' (WHITE or BLACK) attacks 'square'.
+        Looks outward from the square with the magic slider lookups and the
+        precomputed leaper tables instead of building a full attack map.
+        """
+        pieces = self.piece_bitboards
+        blockers = self.all_pieces_bitboard
+        queens = pieces[QUEEN | by_colour]
+
+        # Rooks and queens
+        orthogonal = pieces[ROOK | by_colour] | queens
+        if orthogonal and get_rook_attacks(square, blockers) & orthogonal:
             return True
 
-        return False
+        # Bishops and queens
+        diagonal = pieces[BISHOP | by_colour] | queens
+        if diagonal and get_bishop_attacks(square, blockers) & diagonal:
+            return True
+
+        # Knights and king
+        if KNIGHT_ATTACKS[square] & pieces[KNIGHT | by_colour]:
+            return True
+        if KING_MOVES[square] & pieces[KING | by_colour]:
+            return True
+
+        # Pawns: a white pawn attacks 'square' from where a black pawn on
+        # 'square' would attack, and vice versa
+        pawn_attack_mask = (
+            BLACK_PAWN_ATTACKS[square] if by_colour == WHITE else WHITE_PAWN_ATTACKS[square]
+        )
+        return (pawn_attack_mask & pieces[PAWN | by_colour]) != 0
 
     def load_start_position(self):
         """Load the standard starting position"""
@@ -540,19 +803,24 @@ class Board:
             0 if self.is_white_to_move else 1
         )
 
-        # Create Zobrist key and board state
-        zobrist_key = Zobrist.calculate_zobrist_key(self)
-        self.current_game_state = GameState(
-            NONE,
-            getattr(pos_info, "ep_file", 0),
-            castling_rights,
-            getattr(pos_info, "fifty_move_ply_count", 0),
-            zobrist_key,
-        )
+        # Set up board state, then its Zobrist key (which hashes the en passant
+        # file and castling rights)
+        self.en_passant_file = getattr(pos_info, "ep_file", 0)
+        self.castling_rights = castling_rights
+        self.fifty_move_counter = getattr(pos_info, "fifty_move_ply_count", 0)
+        self.zobrist_key = Zobrist.calculate_zobrist_key(self)
+        self.pawn_key = Zobrist.calculate_pawn_key(self)
+        self.psqt_middle_game, self.psqt_end_game = self.calculate_psqt_scores()
+        self.game_phase = self.calculate_game_phase()
 
         # Update history
-        self.repetition_position_history.append(zobrist_key)
-        self.game_state_history.append(self.current_game_state)
+        self.repetition_counts = {self.zobrist_key: 1}
+        self.repetition_counts_stack = []
+        self.state_stack[0] = pack_game_state(
+            NONE, self.en_passant_file, self.castling_rights, self.fifty_move_counter
+        )
+        self.zobrist_key_stack[0] = self.zobrist_key
+        self.pawn_key_stack[0] = self.pawn_key
 
     def __str__(self):
         """Create string representation of the board"""
@@ -592,7 +860,7 @@ class Board:
         # Update piece list
         piece_list = self.all_piece_lists[piece]
         if piece_list is not None:
-            if piece_list.map[start_square] is not None:
+            if piece_list.contains_square(start_square):
                 piece_list.move_piece(start_square, target_square)
             else:
                 piece_list.add_piece_at_square(target_square)
@@ -601,6 +869,15 @@ class Board:
         self.square[start_square] = NONE
         self.square[target_square] = piece
 
+        # Update piece-square scores
+        colour_index = piece >> 3
+        self.psqt_middle_game[colour_index] += (
+            PSQT_MIDDLE_GAME[piece][target_square] - PSQT_MIDDLE_GAME[piece][start_square]
+        )
+        self.psqt_end_game[colour_index] += (
+            PSQT_END_GAME[piece][target_square] - PSQT_END_GAME[piece][start_square]
+        )
+
     def update_slider_bitboards(self):
         """Update slider piece bitboards"""
         # Sliding pieces of the active side
@@ -631,9 +908,14 @@ class Board:
         self.all_game_moves = []
         self.king_square = [None, None]
         self.square = [NONE] * 64
-        self.repetition_position_history = deque(maxlen=64)
-        self.game_state_history = deque(maxlen=64)
-        self.current_game_state = GameState(0, 0, 0, 0, 0)
+        self.repetition_counts = {}
+        self.repetition_counts_stack = []
+        self.en_passant_file = 0
+        self.castling_rights = 0
+        self.fifty_move_counter = 0
+        self.zobrist_key = 0
+        self.pawn_key = 0
+        self.state_index = 0
         self.ply_count = 0
 
         # Initialize piece lists
@@ -646,6 +928,9 @@ class Board:
 
         # Initialize counters and bitboards
         self.total_piece_count_without_pawns_and_kings = 0
+        self.game_phase = 0
+        self.psqt_middle_game = [0, 0]
+        self.psqt_end_game = [0, 0]
         self.piece_bitboards = [0] * (MAX_PIECE_INDEX + 1)
         self.colour_bitboards = [0, 0]
         self.all_pieces_bitboard = 0
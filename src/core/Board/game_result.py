@@ -0,0 +1,23 @@
+# Terminal state of a position, as returned by Board.game_result()
+#
+# CHECKMATE means the side to move has been checkmated; every other
+# non-zero result is a draw.
+
+IN_PROGRESS = 0
+CHECKMATE = 1
+STALEMATE = 2
+FIFTY_MOVE_RULE = 3
+THREEFOLD_REPETITION = 4
+INSUFFICIENT_MATERIAL = 5
+
+# Human-readable reason for each drawn result ("Draw by ...")
+DRAW_REASONS = {
+    STALEMATE: "stalemate",
+    FIFTY_MOVE_RULE: "fifty-move rule",
+    THREEFOLD_REPETITION: "threefold repetition",
+    INSUFFICIENT_MATERIAL: "insufficient material",
+}
+
+
+def is_draw(result):
+    return result in DRAW_REASONS
@@ -1,9 +1,50 @@
+# Irreversible board state (what unmake_move cannot recompute from the move)
+#
+# The board keeps one entry per ply on a preallocated stack instead of
+# allocating an object per move. The small fields are packed into one int:
+#   bits 0-2   captured piece type
+#   bits 3-6   en passant file (1-8, 0 = none)
+#   bits 7-10  castling rights
+#   bits 11+   fifty-move counter
+# The Zobrist and pawn keys are kept in parallel 64-bit stacks.
+
+CAPTURED_PIECE_MASK = 0b111
+EN_PASSANT_SHIFT = 3
+EN_PASSANT_MASK = 0b1111
+CASTLING_SHIFT = 7
+CASTLING_MASK = 0b1111
+FIFTY_MOVE_SHIFT = 11
+
+
+def pack_game_state(captured_piece_type, en_passant_file, castling_rights, fifty_move_counter):
+    return (
+        captured_piece_type
+        | (en_passant_file << EN_PASSANT_SHIFT)
+        | (castling_rights << CASTLING_SHIFT)
+        | (fifty_move_counter << FIFTY_MOVE_SHIFT)
+    )
+
+
 class GameState:
+    """
+    Read-only snapshot of the irreversible state of a position, built on
+    request (Board.current_game_state) for code outside the move loop
+    """
+
     CLEAR_WHITE_KINGSIDE_MASK = 0b1110
     CLEAR_WHITE_QUEENSIDE_MASK = 0b1101
     CLEAR_BLACK_KINGSIDE_MASK = 0b1011
     CLEAR_BLACK_QUEENSIDE_MASK = 0b0111
 
+    __slots__ = (
+        "captured_piece_type",
+        "en_passant_file",
+        "castling_rights",
+        "fifty_move_counter",
+        "zobrist_key",
+        "pawn_key",
+    )
+
     def __init__(
         self,
         captured_piece_type,
@@ -11,6 +52,7 @@ class GameState:
         castling_rights,
         fifty_move_counter,
         zobrist_key,
+        pawn_key=0,
     ):
         self.captured_piece_type = (
             captured_piece_type  # Stores the type of captured piece in the game
@@ -21,6 +63,27 @@ class GameState:
         self.zobrist_key = (
             zobrist_key  # Stores the Zobrist key value of the current game position
         )
+        self.pawn_key = pawn_key  # Zobrist key of the pawns only, for the pawn hash table
+
+    @staticmethod
+    def from_packed(packed_state, zobrist_key, pawn_key):
+        return GameState(
+            packed_state & CAPTURED_PIECE_MASK,
+            (packed_state >> EN_PASSANT_SHIFT) & EN_PASSANT_MASK,
+            (packed_state >> CASTLING_SHIFT) & CASTLING_MASK,
+            packed_state >> FIFTY_MOVE_SHIFT,
+            zobrist_key,
+            pawn_key,
+        )
+
+    @property
+    def packed(self):
+        return pack_game_state(
+            self.captured_piece_type,
+            self.en_passant_file,
+            self.castling_rights,
+            self.fifty_move_counter,
+        )
 
     def has_kingside_castle_right(self, white):
         mask = 1 if white else 4
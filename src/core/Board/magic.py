@@ -1,5 +1,22 @@
 # Magic bitboard helpers for chess engine
-import numpy as np
+#
+# "Fancy" magic layout: the attack sets of every square, rook tables first
+# and then bishop tables, live in one flat ATTACK_TABLE. Each square has its
+# own index size (ROOK_INDEX_BITS/BISHOP_INDEX_BITS) and its own offset into
+# the table, so a lookup is one multiply, one shift and one flat index.
+# Magic numbers are found with src/tools/magic_search.py.
+#
+# The table takes most of a second to build in pure Python, so it is built
+# once and cached on disk as raw little-endian uint64 values. Later imports
+# read the file in one go into an array('Q') and turn it into the list the
+# lookups index (list indexing is faster than array indexing, which boxes a
+# new int on every lookup). The file name carries MAGIC_CACHE_VERSION and a
+# digest of the magic numbers and index sizes, so a stale cache is never used.
+import hashlib
+import os
+import sys
+import tempfile
+from array import array
 
 # Magic numbers for rooks and bishops
 # These are random 64-bit numbers that when multiplied by certain positions 
@@ -24,7 +41,7 @@ ROOK_MAGICS = [
 ]
 
 BISHOP_MAGICS = [
-    0x40040844404084, 0x2004208a004208, 0x10190041080202, 0x108050020b0410,
+    0x40040844404084, 0x2004208a004208, 0x10190041080202, 0x40c0080000081,
     0x581104180800210, 0x2112080446200010, 0x1080820820060210, 0x3c0808410220200,
     0x4050404440404, 0x21001420088, 0x24d0080801082102, 0x1020a0a020400,
     0x40308200402, 0x4011002100800, 0x401484104104005, 0x801010402020200,
@@ -42,8 +59,8 @@ BISHOP_MAGICS = [
     0x28000010020204, 0x6000020202d0240, 0x8918844842082200, 0x4010011029020020
 ]
 
-# Shifts for indexing (bits to shift right after multiplication)
-ROOK_SHIFTS = [
+# Number of index bits per square (the table for a square has 2^bits entries)
+ROOK_INDEX_BITS = [
     12, 11, 11, 11, 11, 11, 11, 12,
     11, 10, 10, 10, 10, 10, 10, 11,
     11, 10, 10, 10, 10, 10, 10, 11,
@@ -54,7 +71,7 @@ ROOK_SHIFTS = [
     12, 11, 11, 11, 11, 11, 11, 12
 ]
 
-BISHOP_SHIFTS = [
+BISHOP_INDEX_BITS = [
     6, 5, 5, 5, 5, 5, 5, 6,
     5, 5, 5, 5, 5, 5, 5, 5,
     5, 5, 7, 7, 7, 7, 5, 5,
@@ -65,47 +82,140 @@ BISHOP_SHIFTS = [
     6, 5, 5, 5, 5, 5, 5, 6
 ]
 
+# Right shift that leaves the index bits of the 64-bit product
+ROOK_SHIFTS = [64 - bits for bits in ROOK_INDEX_BITS]
+BISHOP_SHIFTS = [64 - bits for bits in BISHOP_INDEX_BITS]
+
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+
 # Attack lookup tables
-ROOK_ATTACKS = []
-BISHOP_ATTACKS = []
+ATTACK_TABLE = []
+ROOK_OFFSETS = []
+BISHOP_OFFSETS = []
 ROOK_MASKS = []
 BISHOP_MASKS = []
 
-def init_magics():
-    """Initialize all the magic bitboard tables"""
-    global ROOK_ATTACKS, BISHOP_ATTACKS, ROOK_MASKS, BISHOP_MASKS
-    
+# Bump when the layout of the cache file changes
+MAGIC_CACHE_VERSION = 2
+# Directory of the cache file; defaults to this package's __pycache__
+MAGIC_CACHE_DIR_ENV = "CHESS_MAGIC_CACHE_DIR"
+
+def init_magics(use_cache=True):
+    """
+    Initialize all the magic bitboard tables, loading the attack tables from
+    the cache file if there is a valid one and writing it otherwise
+    """
+    global ATTACK_TABLE, ROOK_OFFSETS, BISHOP_OFFSETS, ROOK_MASKS, BISHOP_MASKS
+
     # Initialize masks
-    for square in range(64):
-        ROOK_MASKS.append(create_rook_mask(square))
-        BISHOP_MASKS.append(create_bishop_mask(square))
-    
-    # Initialize attack tables
-    ROOK_ATTACKS = [None] * 64
-    BISHOP_ATTACKS = [None] * 64
-    
-    for square in range(64):
-        rook_bits = count_bits(ROOK_MASKS[square])
-        bishop_bits = count_bits(BISHOP_MASKS[square])
-        
-        rook_size = 1 << rook_bits
-        bishop_size = 1 << bishop_bits
-        
-        ROOK_ATTACKS[square] = [0] * rook_size
-        BISHOP_ATTACKS[square] = [0] * bishop_size
-        
-        # Generate all possible blocker configurations
-        rook_blockers = generate_blockers(ROOK_MASKS[square])
-        bishop_blockers = generate_blockers(BISHOP_MASKS[square])
-        
-        # Fill in the attack tables
-        for blockers in rook_blockers:
-            magic_index = ((blockers * ROOK_MAGICS[square]) >> (64 - rook_bits)) & ((1 << rook_bits) - 1)
-            ROOK_ATTACKS[square][magic_index] = compute_rook_attacks(square, blockers)
-        
-        for blockers in bishop_blockers:
-            magic_index = ((blockers * BISHOP_MAGICS[square]) >> (64 - bishop_bits)) & ((1 << bishop_bits) - 1)
-            BISHOP_ATTACKS[square][magic_index] = compute_bishop_attacks(square, blockers)
+    ROOK_MASKS = [create_rook_mask(square) for square in range(64)]
+    BISHOP_MASKS = [create_bishop_mask(square) for square in range(64)]
+
+    # Offsets of each square's table inside the flat table
+    ROOK_OFFSETS, offset = table_offsets(ROOK_INDEX_BITS, 0)
+    BISHOP_OFFSETS, table_size = table_offsets(BISHOP_INDEX_BITS, offset)
+
+    cache_path = magic_cache_path() if use_cache else None
+    attack_table = load_attack_table(cache_path, table_size) if cache_path else None
+    if attack_table is None:
+        attack_table = build_attack_table()
+        if cache_path:
+            save_attack_table(cache_path, attack_table)
+
+    # Many squares and blocker sets share the same attack set: keep a single
+    # int object for each distinct value
+    distinct_values = {}
+    ATTACK_TABLE = [distinct_values.setdefault(value, value) for value in attack_table]
+
+def table_offsets(index_bits, start):
+    """Offsets of consecutive per-square tables, and the offset after the last one"""
+    offsets = []
+    offset = start
+    for bits in index_bits:
+        offsets.append(offset)
+        offset += 1 << bits
+    return offsets, offset
+
+def magic_index(blockers, magic, shift):
+    """Table index of a (masked) blocker set"""
+    return ((blockers * magic) & FULL_BOARD) >> shift
+
+def build_attack_table():
+    """
+    Compute every rook and bishop attack set by walking rays for all blocker
+    configurations. Returns the flat table as a list of ints.
+    Raises ValueError if a magic maps two different attack sets to one index.
+    """
+    attack_table = []
+    for masks, magics, index_bits, compute_attacks in (
+        (ROOK_MASKS, ROOK_MAGICS, ROOK_INDEX_BITS, compute_rook_attacks),
+        (BISHOP_MASKS, BISHOP_MAGICS, BISHOP_INDEX_BITS, compute_bishop_attacks),
+    ):
+        for square in range(64):
+            bits = index_bits[square]
+            attacks = [None] * (1 << bits)
+
+            # Fill in the table for all possible blocker configurations
+            for blockers in generate_blockers(masks[square]):
+                index = magic_index(blockers, magics[square], 64 - bits)
+                square_attacks = compute_attacks(square, blockers)
+                if attacks[index] is not None and attacks[index] != square_attacks:
+                    raise ValueError(f"Magic number for square {square} has a collision")
+                attacks[index] = square_attacks
+
+            # Indices no blocker set maps to are never looked up
+            attack_table.extend(0 if value is None else value for value in attacks)
+    return attack_table
+
+def magic_cache_path():
+    """Path of the attack table cache file for the current magics"""
+    digest = hashlib.sha1(
+        repr((ROOK_MAGICS, BISHOP_MAGICS, ROOK_INDEX_BITS, BISHOP_INDEX_BITS)).encode()
+    ).hexdigest()[:12]
+    cache_dir = os.environ.get(MAGIC_CACHE_DIR_ENV) or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "__pycache__"
+    )
+    return os.path.join(cache_dir, f"magic_attacks_v{MAGIC_CACHE_VERSION}_{digest}.bin")
+
+def load_attack_table(path, table_size):
+    """Load the flat attack table, or return None if the cache is missing or invalid"""
+    table = array("Q")
+    if table.itemsize != 8:
+        return None
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    if len(data) != table_size * table.itemsize:
+        return None
+    table.frombytes(data)
+    if sys.byteorder != "little":
+        table.byteswap()
+    return table.tolist()
+
+def save_attack_table(path, attack_table):
+    """
+    Write the cache file atomically (other processes may be loading it).
+    A cache that cannot be written is not an error: the tables are simply
+    rebuilt by the next process.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        table = array("Q", attack_table)
+        if sys.byteorder != "little":
+            table.byteswap()
+        with os.fdopen(fd, "wb") as file:
+            table.tofile(file)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
 def count_bits(bitboard):
     """Count the number of set bits in a bitboard.
@@ -327,21 +437,17 @@ init_magics()
 
 def get_rook_attacks(square, blockers):
     """Get rook attacks using magic bitboard lookup"""
-    mask = ROOK_MASKS[square]
-    blockers_mask = blockers & mask
-    magic = ROOK_MAGICS[square]
-    shift = ROOK_SHIFTS[square]
-    index = ((blockers_mask * magic) >> (64 - shift)) & ((1 << shift) - 1)
-    return ROOK_ATTACKS[square][index]
+    return ATTACK_TABLE[
+        ROOK_OFFSETS[square]
+        + (((blockers & ROOK_MASKS[square]) * ROOK_MAGICS[square] & FULL_BOARD) >> ROOK_SHIFTS[square])
+    ]
 
 def get_bishop_attacks(square, blockers):
     """Get bishop attacks using magic bitboard lookup"""
-    mask = BISHOP_MASKS[square]
-    blockers_mask = blockers & mask
-    magic = BISHOP_MAGICS[square]
-    shift = BISHOP_SHIFTS[square]
-    index = ((blockers_mask * magic) >> (64 - shift)) & ((1 << shift) - 1)
-    return BISHOP_ATTACKS[square][index]
+    return ATTACK_TABLE[
+        BISHOP_OFFSETS[square]
+        + (((blockers & BISHOP_MASKS[square]) * BISHOP_MAGICS[square] & FULL_BOARD) >> BISHOP_SHIFTS[square])
+    ]
 
 def get_slider_attacks(square, blockers, ortho):
     if ortho:
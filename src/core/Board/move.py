@@ -1,4 +1,34 @@
 # Move representation and flags for chess engine
+#
+# A move is packed into a 16-bit integer:
+#   bits 0-5   start square
+#   bits 6-11  target square
+#   bits 12-15 move flag
+# The move generator, make/unmake and the search work on these integers
+# directly; Move is a thin view over one of them for the GUIs.
+
+START_SQUARE_MASK = 0x3F
+TARGET_SQUARE_SHIFT = 6
+FLAG_SHIFT = 12
+NULL_MOVE_VALUE = 0  # a1 to a1, never a legal move
+
+
+def pack_move(start_square, target_square, move_flag=0):
+    return start_square | (target_square << TARGET_SQUARE_SHIFT) | (move_flag << FLAG_SHIFT)
+
+
+def move_start_square(move_value):
+    return move_value & START_SQUARE_MASK
+
+
+def move_target_square(move_value):
+    return (move_value >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+
+
+def move_flag(move_value):
+    return move_value >> FLAG_SHIFT
+
+
 class Move:
     NO_FLAG = 0b0000
     EN_PASSANT_CAPTURE_FLAG = 0b0001
@@ -9,25 +39,49 @@ class Move:
     PROMOTE_TO_ROOK_FLAG = 0b0110
     PROMOTE_TO_BISHOP_FLAG = 0b0111
 
+    __slots__ = ("value",)
+
     def __init__(self, start_square, target_square, move_flag=0):
-        self.start_square = start_square
-        self.target_square = target_square
-        self.move_flag = move_flag
+        self.value = pack_move(start_square, target_square, move_flag)
+
+    @property
+    def start_square(self):
+        return self.value & START_SQUARE_MASK
+
+    @property
+    def target_square(self):
+        return (self.value >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+
+    @property
+    def move_flag(self):
+        return self.value >> FLAG_SHIFT
 
     @property
     def is_promotion(self):
-        return self.move_flag >= Move.PROMOTE_TO_QUEEN_FLAG
+        return self.value >= PROMOTION_VALUE
+
+    @staticmethod
+    def from_value(value):
+        """Wrap a packed move"""
+        move = Move.__new__(Move)
+        move.value = value
+        return move
 
     @staticmethod
     def null_move():
         return Move(0, 0, Move.NO_FLAG)
 
     def __eq__(self, other):
-        return (
-            self.start_square == other.start_square and
-            self.target_square == other.target_square and
-            self.move_flag == other.move_flag
-        )
+        if not isinstance(other, Move):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self):
+        return self.value
 
     def __repr__(self):
-        return f"Move({self.start_square}, {self.target_square}, flag={self.move_flag})"
\ No newline at end of file
+        return f"Move({self.start_square}, {self.target_square}, flag={self.move_flag})"
+
+
+# Packed moves at or above this value are promotions
+PROMOTION_VALUE = Move.PROMOTE_TO_QUEEN_FLAG << FLAG_SHIFT
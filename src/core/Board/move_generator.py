@@ -1,12 +1,42 @@
+from array import array
+
 from src.core.Board.piece import *
-from src.core.Board.move import Move
+from src.core.Board.move import (
+    Move,
+    START_SQUARE_MASK,
+    TARGET_SQUARE_SHIFT,
+    FLAG_SHIFT,
+)
 from src.core.Board.bitboard_utility import (
     KNIGHT_ATTACKS,
     KING_MOVES,
     WHITE_PAWN_ATTACKS,
     BLACK_PAWN_ATTACKS,
-    contains_square,
+    FULL_BOARD,
+    NOT_FILE_A,
+    NOT_FILE_H,
+    RANK_1,
+    RANK_2,
+    RANK_3,
+    RANK_6,
+    RANK_7,
+    RANK_8,
+    BETWEEN,
+    LINE,
 )
+from src.core.Board.magic import get_rook_attacks, get_bishop_attacks
+
+PROMOTION_FLAGS = (
+    Move.PROMOTE_TO_QUEEN_FLAG,
+    Move.PROMOTE_TO_ROOK_FLAG,
+    Move.PROMOTE_TO_BISHOP_FLAG,
+    Move.PROMOTE_TO_KNIGHT_FLAG,
+)
+# Flags already shifted into place for packed moves
+PACKED_PROMOTION_FLAGS = tuple(flag << FLAG_SHIFT for flag in PROMOTION_FLAGS)
+PACKED_EN_PASSANT = Move.EN_PASSANT_CAPTURE_FLAG << FLAG_SHIFT
+PACKED_CASTLE = Move.CASTLE_FLAG << FLAG_SHIFT
+PACKED_PAWN_TWO_UP = Move.PAWN_TWO_UP_FLAG << FLAG_SHIFT
 
 
 class MoveGenerator:
@@ -16,283 +46,697 @@ class MoveGenerator:
         """
         self.board = board
 
-    def generate_legal_moves(self):
+    def generate_legal_moves(self, captures_only=False):
         """
         Generate all legal moves for the active side based on the current state of the board.
         Returns a list of Move objects that don't leave the king in check.
+
+        Used by the GUIs and other callers that want Move objects; the search
+        and perft use generate_moves, which produces packed moves.
         """
-        pseudo_legal_moves = []
-        for square in range(64):
-            piece = self.board.square[square]
-            if piece == NONE:
-                continue
+        moves = []
+        self._generate(moves.append, captures_only)
+        return [Move.from_value(value) for value in moves]
 
-            # Check if the piece belongs to the active side
-            if (self.board.is_white_to_move and not is_white(piece)) or (
-                not self.board.is_white_to_move and is_white(piece)
-            ):
-                continue
+    def generate_moves(
+        self, moves=None, captures_only=False, quiets_only=False, pseudo_legal=False
+    ):
+        """
+        Generate all legal moves as packed 16-bit integers (see move.py).
+
+        'moves' is an array('H') that is cleared and refilled, so a caller
+        can keep one buffer per ply and reuse it instead of allocating new
+        lists at every node. A new buffer is created if none is given.
+        Returns the buffer.
+
+        captures_only and quiets_only split the moves into two disjoint
+        sets for staged move picking: captures and promotions, and all
+        other moves (including castling).
+
+        With pseudo_legal=True checks and pins are ignored (castling is
+        still fully checked), so some moves may leave the king in check.
+        The caller makes each move and rejects it with
+        Board.is_mover_in_check, paying for legality only for moves it
+        actually searches.
+        """
+        if moves is None:
+            moves = array("H")
+        else:
+            del moves[:]
+        if pseudo_legal:
+            self._generate_pseudo_legal(moves.append, captures_only, quiets_only)
+        else:
+            self._generate(moves.append, captures_only, quiets_only)
+        return moves
 
-            piece_type_val = piece_type(piece)
-            if piece_type_val == PAWN:
-                pseudo_legal_moves.extend(self._pawn_moves(square, piece))
-            elif piece_type_val == KNIGHT:
-                pseudo_legal_moves.extend(self._knight_moves(square, piece))
-            elif piece_type_val == BISHOP:
-                pseudo_legal_moves.extend(self._bishop_moves(square, piece))
-            elif piece_type_val == ROOK:
-                pseudo_legal_moves.extend(self._rook_moves(square, piece))
-            elif piece_type_val == QUEEN:
-                pseudo_legal_moves.extend(self._queen_moves(square, piece))
-            elif piece_type_val == KING:
-                pseudo_legal_moves.extend(self._king_moves(square, piece))
-
-        # Filter out moves that would leave the king in check
-        # Using a simplified approach that doesn't involve making/unmaking moves
-        legal_moves = []
-        king_square = self.board.king_square[self.board.move_colour_index]
-        king_piece = self.board.square[king_square]
-        
-        for move in pseudo_legal_moves:
-            # Special handling for king moves
-            if piece_type(self.board.square[move.start_square]) == KING:
-                # For king moves, we've already verified they don't move into check in _king_moves
-                legal_moves.append(move)
-                continue
-                
-            # For non-king moves, we need to check if they would expose the king to check
-            # Make a simplified test of the move without using make_move/unmake_move
-            is_legal = True
-            
-            # Save original board state we need to modify
-            original_square_start = self.board.square[move.start_square]
-            original_square_target = self.board.square[move.target_square]
-            
-            # Simulate the move
-            self.board.square[move.target_square] = original_square_start
-            self.board.square[move.start_square] = NONE
-            
-            # Check if king is under attack after the move
-            opponent_attacks = self._generate_opponent_attacks()
-            if king_square in opponent_attacks:
-                is_legal = False
-                
-            # Restore the board state
-            self.board.square[move.start_square] = original_square_start
-            self.board.square[move.target_square] = original_square_target
-            
-            if is_legal:
-                legal_moves.append(move)
-
-        return legal_moves
-
-    def _pawn_moves(self, square, piece):
+    def is_legal_move(self, move):
         """
-        Generate all legal moves for a pawn at position 'square'.
-        Includes straight movement, diagonal captures, promotion, and en passant captures.
+        Check whether the packed 'move' is legal in the current position
+        without generating the move list.
+
+        Meant for moves that come from outside the generator, such as the
+        transposition table move or killer moves, which may belong to a
+        different position. Castling, en passant and promotions are rare
+        there and are checked against the full move list instead.
         """
-        moves = []
-        direction = 8 if is_white(piece) else -8
-        start_rank = 1 if is_white(piece) else 6
-        promotion_rank = 6 if is_white(piece) else 1
-        row = square // 8
-        col = square % 8
-
-        # Move forward one square
-        target = square + direction
-        if 0 <= target < 64 and self.board.square[target] == NONE:
-            # Promotion
-            if row == promotion_rank:
-                promotion_flags = [
-                    Move.PROMOTE_TO_QUEEN_FLAG,
-                    Move.PROMOTE_TO_ROOK_FLAG,
-                    Move.PROMOTE_TO_BISHOP_FLAG,
-                    Move.PROMOTE_TO_KNIGHT_FLAG,
-                ]
-                for flag in promotion_flags:
-                    moves.append(Move(square, target, flag))
+        board = self.board
+        start_square = move & START_SQUARE_MASK
+        target_square = (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK
+        flag = move >> FLAG_SHIFT
+        piece = board.square[start_square]
+        white = board.is_white_to_move
+        us = board.move_colour_index
+        if piece == NONE or is_white(piece) != white or start_square == target_square:
+            return False
+
+        if flag != Move.NO_FLAG and flag != Move.PAWN_TWO_UP_FLAG:
+            return move in self.generate_moves()
+
+        target_bit = 1 << target_square
+        own = board.colour_bitboards[us]
+        opp = board.colour_bitboards[1 - us]
+        occupied = own | opp
+        if own & target_bit:
+            return False
+
+        moved_piece_type = piece_type(piece)
+        if moved_piece_type == PAWN:
+            push = 8 if white else -8
+            promotion_rank = RANK_8 if white else RANK_1
+            if flag == Move.PAWN_TWO_UP_FLAG:
+                valid = (
+                    (1 << start_square) & (RANK_2 if white else RANK_7)
+                    and target_square == start_square + 2 * push
+                    and not occupied & (target_bit | 1 << (start_square + push))
+                )
+            elif target_square == start_square + push:
+                valid = not occupied & target_bit and not target_bit & promotion_rank
             else:
-                moves.append(Move(square, target))
-
-                # Move forward two squares from starting position
-                if row == start_rank:
-                    target2 = square + 2 * direction
-                    if self.board.square[target2] == NONE:
-                        moves.append(Move(square, target2, Move.PAWN_TWO_UP_FLAG))
-
-        # Diagonal attacks
-        pawn_attacks = (
-            WHITE_PAWN_ATTACKS[square]
-            if is_white(piece)
-            else BLACK_PAWN_ATTACKS[square]
-        )
-        for attack_target in range(64):
-            if contains_square(pawn_attacks, attack_target):
-                target_piece = self.board.square[attack_target]
-                if target_piece != NONE and is_white(target_piece) != is_white(piece):
-                    # Promotion
-                    if row == promotion_rank:
-                        promotion_flags = [
-                            Move.PROMOTE_TO_QUEEN_FLAG,
-                            Move.PROMOTE_TO_ROOK_FLAG,
-                            Move.PROMOTE_TO_BISHOP_FLAG,
-                            Move.PROMOTE_TO_KNIGHT_FLAG,
-                        ]
-                        for flag in promotion_flags:
-                            moves.append(Move(square, attack_target, flag))
-                    else:
-                        moves.append(Move(square, attack_target))
-
-        # En passant capture
-        if (
-            hasattr(self.board.current_game_state, "en_passant_file")
-            and self.board.current_game_state.en_passant_file
-        ):
-            ep_file = self.board.current_game_state.en_passant_file - 1
-            ep_rank = 4 if is_white(piece) else 3
-            if row == ep_rank and abs(col - ep_file) == 1:
-                ep_target = (
-                    (ep_rank + 1) * 8 + ep_file
-                    if is_white(piece)
-                    else (ep_rank - 1) * 8 + ep_file
+                pawn_attacks = WHITE_PAWN_ATTACKS if white else BLACK_PAWN_ATTACKS
+                valid = (
+                    pawn_attacks[start_square] & opp & target_bit
+                    and not target_bit & promotion_rank
                 )
-                moves.append(Move(square, ep_target, Move.EN_PASSANT_CAPTURE_FLAG))
+        elif flag == Move.PAWN_TWO_UP_FLAG:
+            return False
+        elif moved_piece_type == KNIGHT:
+            valid = KNIGHT_ATTACKS[start_square] & target_bit
+        elif moved_piece_type == BISHOP:
+            valid = get_bishop_attacks(start_square, occupied) & target_bit
+        elif moved_piece_type == ROOK:
+            valid = get_rook_attacks(start_square, occupied) & target_bit
+        elif moved_piece_type == QUEEN:
+            valid = (
+                get_rook_attacks(start_square, occupied)
+                | get_bishop_attacks(start_square, occupied)
+            ) & target_bit
+        else:
+            valid = KING_MOVES[start_square] & target_bit
+        if not valid:
+            return False
+
+        # The move is possible; it is legal if our king is not attacked
+        # afterwards. A captured piece no longer attacks anything.
+        enemy = BLACK if white else WHITE
+        pieces = board.piece_bitboards
+        king_square = target_square if moved_piece_type == KING else board.king_square[us]
+        occupied = (occupied ^ (1 << start_square)) | target_bit
+        remaining = FULL_BOARD ^ target_bit
+        queens = pieces[QUEEN | enemy]
+        pawn_attacks = WHITE_PAWN_ATTACKS if white else BLACK_PAWN_ATTACKS
+        return not (
+            get_rook_attacks(king_square, occupied) & (pieces[ROOK | enemy] | queens)
+            | get_bishop_attacks(king_square, occupied) & (pieces[BISHOP | enemy] | queens)
+            | KNIGHT_ATTACKS[king_square] & pieces[KNIGHT | enemy]
+            | pawn_attacks[king_square] & pieces[PAWN | enemy]
+            | KING_MOVES[king_square] & pieces[KING | enemy]
+        ) & remaining
+
+    def _generate(self, append, captures_only, quiets_only=False):
+        """
+        Pass every legal move, packed, to 'append'.
 
-        return moves
+        Moves are built directly from the board bitboards and the magic attack
+        lookups. Checkers and pinned pieces are computed once per position and
+        used to mask the targets of every piece, so no move has to be tried on
+        the board to find out whether it is legal.
 
-    def _knight_moves(self, square, piece):
+        With captures_only=True only captures (including en passant) and
+        promotions are generated, for quiescence search. Quiet moves are
+        never created in that mode. quiets_only=True generates the rest.
         """
-        Generate all legal moves for a knight at position 'square'.
-        Uses pre-calculated KNIGHT_ATTACKS table.
-        """
-        moves = []
-        knight_attacks = KNIGHT_ATTACKS[square]
+        board = self.board
+        white = board.is_white_to_move
+        us = board.move_colour_index
+        them = 1 - us
+        colour = WHITE if white else BLACK
+        enemy = BLACK if white else WHITE
+        pieces = board.piece_bitboards
+
+        own = board.colour_bitboards[us]
+        opp = board.colour_bitboards[them]
+        occupied = own | opp
+        # Squares pieces may move to: any non-friendly square, enemy pieces
+        # only, or empty squares only
+        if captures_only:
+            not_own = opp
+        elif quiets_only:
+            not_own = FULL_BOARD ^ occupied
+        else:
+            not_own = FULL_BOARD ^ own
+        king_square = board.king_square[us]
+        king_bit = 1 << king_square
+
+        enemy_orthogonal = pieces[ROOK | enemy] | pieces[QUEEN | enemy]
+        enemy_diagonal = pieces[BISHOP | enemy] | pieces[QUEEN | enemy]
+        enemy_knights = pieces[KNIGHT | enemy]
+        enemy_pawns = pieces[PAWN | enemy]
+
+        # King moves: squares attacked by the opponent are computed with our
+        # king removed, so the king cannot step back along a checking ray
+        enemy_attacks = self._attack_map(enemy, occupied ^ king_bit)
+        targets = KING_MOVES[king_square] & not_own & ~enemy_attacks
+        while targets:
+            lsb = targets & -targets
+            targets ^= lsb
+            append(king_square | (lsb.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+
+        checkers = self._checkers(
+            white,
+            king_square,
+            occupied,
+            enemy_orthogonal,
+            enemy_diagonal,
+            enemy_knights,
+            enemy_pawns,
+        )
 
-        for target in range(64):
-            if contains_square(knight_attacks, target):
-                target_piece = self.board.square[target]
-                if target_piece == NONE or is_white(target_piece) != is_white(piece):
-                    moves.append(Move(square, target))
+        if checkers:
+            # Double check: only the king can move
+            if checkers & (checkers - 1):
+                return
+            checker_square = checkers.bit_length() - 1
+            target_mask = checkers | BETWEEN[king_square][checker_square]
+        else:
+            target_mask = FULL_BOARD
+            if not captures_only:
+                self._castling_moves(king_square, occupied, enemy_attacks, append)
+
+        # Pinned pieces: a pinned piece may only move along the line through
+        # its king and itself (LINE[king_square][square])
+        pinned = self._pinned_pieces(
+            king_square, own, opp, enemy_orthogonal, enemy_diagonal
+        )
+        pin_lines = LINE[king_square]
+
+        move_mask = not_own & target_mask
+
+        # Knights (a pinned knight can never move)
+        knights = pieces[KNIGHT | colour] & ~pinned
+        while knights:
+            lsb = knights & -knights
+            knights ^= lsb
+            square = lsb.bit_length() - 1
+            targets = KNIGHT_ATTACKS[square] & move_mask
+            while targets:
+                bit = targets & -targets
+                targets ^= bit
+                append(square | (bit.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+
+        # Sliders
+        queens = pieces[QUEEN | colour]
+        for sliders, attacks in (
+            (pieces[BISHOP | colour] | queens, get_bishop_attacks),
+            (pieces[ROOK | colour] | queens, get_rook_attacks),
+        ):
+            while sliders:
+                lsb = sliders & -sliders
+                sliders ^= lsb
+                square = lsb.bit_length() - 1
+                targets = attacks(square, occupied) & move_mask
+                if lsb & pinned:
+                    targets &= pin_lines[square]
+                while targets:
+                    bit = targets & -targets
+                    targets ^= bit
+                    append(square | (bit.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+
+        self._pawn_moves(
+            white,
+            pieces[PAWN | colour],
+            opp,
+            occupied,
+            target_mask,
+            pinned,
+            pin_lines,
+            append,
+            captures_only,
+            quiets_only,
+        )
 
-        return moves
+        if quiets_only:
+            return
+
+        self._en_passant_moves(
+            white,
+            pieces[PAWN | colour],
+            occupied,
+            king_square,
+            checkers,
+            enemy_orthogonal,
+            enemy_diagonal,
+            enemy_knights,
+            append,
+        )
 
-    def _bishop_moves(self, square, piece):
+    def _generate_pseudo_legal(self, append, captures_only, quiets_only):
         """
-        Generate all legal moves for a bishop at position 'square'.
+        Pass every pseudo-legal move, packed, to 'append': the moves of
+        _generate without the check, pin and king-safety filtering
         """
-        moves = []
-        row = square // 8
-        col = square % 8
-
-        # Check 4 diagonal directions
-        for dr, dc in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-            r, c = row, col
-            while True:
-                r += dr
-                c += dc
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-
-                target = r * 8 + c
-                target_piece = self.board.square[target]
-
-                if target_piece == NONE:
-                    moves.append(Move(square, target))
-                else:
-                    if is_white(target_piece) != is_white(piece):
-                        moves.append(Move(square, target))
-                    break
+        board = self.board
+        white = board.is_white_to_move
+        us = board.move_colour_index
+        colour = WHITE if white else BLACK
+        pieces = board.piece_bitboards
+
+        own = board.colour_bitboards[us]
+        opp = board.colour_bitboards[1 - us]
+        occupied = own | opp
+        if captures_only:
+            not_own = opp
+        elif quiets_only:
+            not_own = FULL_BOARD ^ occupied
+        else:
+            not_own = FULL_BOARD ^ own
+        king_square = board.king_square[us]
+
+        targets = KING_MOVES[king_square] & not_own
+        while targets:
+            lsb = targets & -targets
+            targets ^= lsb
+            append(king_square | (lsb.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+        if not captures_only:
+            self._pseudo_legal_castling_moves(king_square, occupied, append)
+
+        knights = pieces[KNIGHT | colour]
+        while knights:
+            lsb = knights & -knights
+            knights ^= lsb
+            square = lsb.bit_length() - 1
+            targets = KNIGHT_ATTACKS[square] & not_own
+            while targets:
+                bit = targets & -targets
+                targets ^= bit
+                append(square | (bit.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+
+        queens = pieces[QUEEN | colour]
+        for sliders, attacks in (
+            (pieces[BISHOP | colour] | queens, get_bishop_attacks),
+            (pieces[ROOK | colour] | queens, get_rook_attacks),
+        ):
+            while sliders:
+                lsb = sliders & -sliders
+                sliders ^= lsb
+                square = lsb.bit_length() - 1
+                targets = attacks(square, occupied) & not_own
+                while targets:
+                    bit = targets & -targets
+                    targets ^= bit
+                    append(square | (bit.bit_length() - 1) << TARGET_SQUARE_SHIFT)
+
+        # No pinned pieces, so the pin lines are never looked at
+        pawns = pieces[PAWN | colour]
+        self._pawn_moves(
+            white,
+            pawns,
+            opp,
+            occupied,
+            FULL_BOARD,
+            0,
+            None,
+            append,
+            captures_only,
+            quiets_only,
+        )
 
-        return moves
+        en_passant_file = board.en_passant_file
+        if en_passant_file and not quiets_only:
+            target = (40 if white else 16) + en_passant_file - 1
+            capturers = (BLACK_PAWN_ATTACKS if white else WHITE_PAWN_ATTACKS)[
+                target
+            ] & pawns
+            while capturers:
+                lsb = capturers & -capturers
+                capturers ^= lsb
+                append(
+                    (lsb.bit_length() - 1)
+                    | target << TARGET_SQUARE_SHIFT
+                    | PACKED_EN_PASSANT
+                )
 
-    def _rook_moves(self, square, piece):
+    def _pseudo_legal_castling_moves(self, king_square, occupied, append):
         """
-        Generate all legal moves for a rook at position 'square'.
+        Castling for pseudo-legal generation. Making the move only tests the
+        king's final square, so the start and crossed squares are checked
+        here with Board.is_square_attacked.
         """
-        moves = []
-        row = square // 8
-        col = square % 8
-
-        # Check 4 orthogonal directions
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            r, c = row, col
-            while True:
-                r += dr
-                c += dc
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-
-                target = r * 8 + c
-                target_piece = self.board.square[target]
-
-                if target_piece == NONE:
-                    moves.append(Move(square, target))
-                else:
-                    if is_white(target_piece) != is_white(piece):
-                        moves.append(Move(square, target))
-                    break
-
-        return moves
+        board = self.board
+        rights = board.castling_rights
+        white = board.is_white_to_move
+        base = 0 if white else 56
+        if not rights or king_square != base + 4:
+            return
+        kingside = rights & (1 if white else 4) and not occupied & (
+            (1 << (base + 5)) | (1 << (base + 6))
+        )
+        queenside = rights & (2 if white else 8) and not occupied & (
+            (1 << (base + 1)) | (1 << (base + 2)) | (1 << (base + 3))
+        )
+        if not (kingside or queenside):
+            return
+
+        enemy = BLACK if white else WHITE
+        if board.is_square_attacked(king_square, enemy):
+            return
+        if kingside and not board.is_square_attacked(base + 5, enemy):
+            append(king_square | (base + 6) << TARGET_SQUARE_SHIFT | PACKED_CASTLE)
+        if queenside and not board.is_square_attacked(base + 3, enemy):
+            append(king_square | (base + 2) << TARGET_SQUARE_SHIFT | PACKED_CASTLE)
+
+    @staticmethod
+    def _checkers(
+        white,
+        king_square,
+        occupied,
+        enemy_orthogonal,
+        enemy_diagonal,
+        enemy_knights,
+        enemy_pawns,
+    ):
+        """Bitboard of the enemy pieces giving check to the king on 'king_square'"""
+        return (
+            (KNIGHT_ATTACKS[king_square] & enemy_knights)
+            | (
+                (WHITE_PAWN_ATTACKS if white else BLACK_PAWN_ATTACKS)[king_square]
+                & enemy_pawns
+            )
+            | (get_rook_attacks(king_square, occupied) & enemy_orthogonal)
+            | (get_bishop_attacks(king_square, occupied) & enemy_diagonal)
+        )
 
-    def _queen_moves(self, square, piece):
+    @staticmethod
+    def _pinned_pieces(king_square, own, opp, enemy_orthogonal, enemy_diagonal):
         """
-        Generate all legal moves for a queen at position 'square'.
-        Combines the moves of rook and bishop.
+        Bitboard of our pieces that are the only blocker between an enemy
+        slider and our king
         """
-        return self._rook_moves(square, piece) + self._bishop_moves(square, piece)
-
-    def _king_moves(self, square, piece):
+        pinned = 0
+        between = BETWEEN[king_square]
+        snipers = (get_rook_attacks(king_square, opp) & enemy_orthogonal) | (
+            get_bishop_attacks(king_square, opp) & enemy_diagonal
+        )
+        while snipers:
+            lsb = snipers & -snipers
+            snipers ^= lsb
+            blockers = between[lsb.bit_length() - 1] & own
+            if blockers and not blockers & (blockers - 1):
+                pinned |= blockers
+        return pinned
+
+    def has_legal_move(self):
         """
-        Generate all legal moves for a king at position 'square'.
-        Includes regular moves and castling.
+        Check whether the active side has at least one legal move, stopping
+        at the first one found. Cheaper than generating the full move list
+        when only checkmate/stalemate detection is needed.
+
+        King moves are tried first (the only option in double check), then
+        the other pieces restricted to check evasions, with pawn moves and
+        en passant last. Castling is never needed: if castling is legal, so
+        is the king's one-square move towards the rook.
         """
+        board = self.board
+        white = board.is_white_to_move
+        us = board.move_colour_index
+        colour = WHITE if white else BLACK
+        enemy = BLACK if white else WHITE
+        pieces = board.piece_bitboards
+
+        own = board.colour_bitboards[us]
+        opp = board.colour_bitboards[1 - us]
+        occupied = own | opp
+        not_own = FULL_BOARD ^ own
+        king_square = board.king_square[us]
+
+        enemy_attacks = self._attack_map(enemy, occupied ^ (1 << king_square))
+        if KING_MOVES[king_square] & not_own & ~enemy_attacks:
+            return True
+
+        enemy_orthogonal = pieces[ROOK | enemy] | pieces[QUEEN | enemy]
+        enemy_diagonal = pieces[BISHOP | enemy] | pieces[QUEEN | enemy]
+        enemy_knights = pieces[KNIGHT | enemy]
+        checkers = self._checkers(
+            white,
+            king_square,
+            occupied,
+            enemy_orthogonal,
+            enemy_diagonal,
+            enemy_knights,
+            pieces[PAWN | enemy],
+        )
+        if checkers:
+            if checkers & (checkers - 1):
+                return False
+            target_mask = checkers | BETWEEN[king_square][checkers.bit_length() - 1]
+        else:
+            target_mask = FULL_BOARD
+
+        pinned = self._pinned_pieces(
+            king_square, own, opp, enemy_orthogonal, enemy_diagonal
+        )
+        pin_lines = LINE[king_square]
+        move_mask = not_own & target_mask
+
+        knights = pieces[KNIGHT | colour] & ~pinned
+        while knights:
+            lsb = knights & -knights
+            knights ^= lsb
+            if KNIGHT_ATTACKS[lsb.bit_length() - 1] & move_mask:
+                return True
+
+        queens = pieces[QUEEN | colour]
+        for sliders, attacks in (
+            (pieces[BISHOP | colour] | queens, get_bishop_attacks),
+            (pieces[ROOK | colour] | queens, get_rook_attacks),
+        ):
+            while sliders:
+                lsb = sliders & -sliders
+                sliders ^= lsb
+                square = lsb.bit_length() - 1
+                targets = attacks(square, occupied) & move_mask
+                if lsb & pinned:
+                    targets &= pin_lines[square]
+                if targets:
+                    return True
+
         moves = []
+        self._pawn_moves(
+            white,
+            pieces[PAWN | colour],
+            opp,
+            occupied,
+            target_mask,
+            pinned,
+            pin_lines,
+            moves.append,
+        )
+        if moves:
+            return True
+        self._en_passant_moves(
+            white,
+            pieces[PAWN | colour],
+            occupied,
+            king_square,
+            checkers,
+            enemy_orthogonal,
+            enemy_diagonal,
+            enemy_knights,
+            moves.append,
+        )
+        return len(moves) > 0
+
+    def _pawn_moves(
+        self,
+        white,
+        pawns,
+        opp,
+        occupied,
+        target_mask,
+        pinned,
+        pin_lines,
+        append,
+        captures_only=False,
+        quiets_only=False,
+    ):
+        """
+        Generate pawn pushes, double pushes, captures and promotions for all
+        pawns at once using bitboard shifts. In captures-only mode pushes are
+        limited to promotions; in quiets-only mode there are no captures or
+        promotions.
+        """
+        empty = FULL_BOARD ^ occupied
+        if white:
+            single = (pawns << 8) & empty
+            double = ((single & RANK_3) << 8) & empty
+            captures_left = (pawns << 7) & NOT_FILE_H & opp
+            captures_right = (pawns << 9) & NOT_FILE_A & opp
+            promotion_rank = RANK_8
+            push = 8
+        else:
+            single = (pawns >> 8) & empty
+            double = ((single & RANK_6) >> 8) & empty
+            captures_left = (pawns >> 9) & NOT_FILE_H & opp
+            captures_right = (pawns >> 7) & NOT_FILE_A & opp
+            promotion_rank = RANK_1
+            push = -8
+
+        if captures_only:
+            single &= promotion_rank
+            double = 0
+        elif quiets_only:
+            single &= ~promotion_rank
+            captures_left = captures_right = 0
+
+        for targets, offset, flag in (
+            (single & target_mask, push, 0),
+            (double & target_mask, 2 * push, PACKED_PAWN_TWO_UP),
+            (captures_left & target_mask, push - 1, 0),
+            (captures_right & target_mask, push + 1, 0),
+        ):
+            while targets:
+                lsb = targets & -targets
+                targets ^= lsb
+                target = lsb.bit_length() - 1
+                start = target - offset
+                if pinned >> start & 1 and not lsb & pin_lines[start]:
+                    continue
+                move = start | target << TARGET_SQUARE_SHIFT
+                if lsb & promotion_rank:
+                    for promotion_flag in PACKED_PROMOTION_FLAGS:
+                        append(move | promotion_flag)
+                else:
+                    append(move | flag)
+
+    def _en_passant_moves(
+        self,
+        white,
+        pawns,
+        occupied,
+        king_square,
+        checkers,
+        enemy_orthogonal,
+        enemy_diagonal,
+        enemy_knights,
+        append,
+    ):
+        """
+        Generate en passant captures. Because two pawns leave the same rank at
+        once, legality is verified by recomputing slider attacks on the king
+        with the resulting occupancy.
+        """
+        en_passant_file = self.board.en_passant_file
+        if not en_passant_file:
+            return
+
+        ep_file = en_passant_file - 1
+        if white:
+            target = 40 + ep_file
+            captured_square = target - 8
+            capturers = BLACK_PAWN_ATTACKS[target] & pawns
+        else:
+            target = 16 + ep_file
+            captured_square = target + 8
+            capturers = WHITE_PAWN_ATTACKS[target] & pawns
+
+        # A knight or pawn check can only be resolved by capturing the pawn
+        if checkers & enemy_knights:
+            return
+
+        while capturers:
+            lsb = capturers & -capturers
+            capturers ^= lsb
+            start = lsb.bit_length() - 1
+            after = (occupied ^ lsb ^ (1 << captured_square)) | (1 << target)
+            if get_rook_attacks(king_square, after) & enemy_orthogonal:
+                continue
+            if get_bishop_attacks(king_square, after) & enemy_diagonal:
+                continue
+            append(start | target << TARGET_SQUARE_SHIFT | PACKED_EN_PASSANT)
 
-        # Determine squares under attack by opponent
-        opponent_attacks = self._generate_opponent_attacks()
-        king_moves = KING_MOVES[square]
-
-        # Regular king moves (8 directions)
-        for target in range(64):
-            if contains_square(king_moves, target):
-                target_piece = self.board.square[target]
-                if (
-                    target_piece == NONE or is_white(target_piece) != is_white(piece)
-                ) and target not in opponent_attacks:
-                    moves.append(Move(square, target))
-
-        # Handle castling
-        if hasattr(self.board.current_game_state, "castling_rights"):
-            rights = self.board.current_game_state.castling_rights
-            is_white_king = is_white(piece)
-            king_row = 0 if is_white_king else 7
-
-            # Kingside castling (g-file)
-            kingside_mask = 1 if is_white_king else 4
-            if rights & kingside_mask:
-                if (
-                    self.board.square[king_row * 8 + 5] == NONE
-                    and self.board.square[king_row * 8 + 6] == NONE
-                    and (king_row * 8 + 4) not in opponent_attacks
-                    and (king_row * 8 + 5) not in opponent_attacks
-                    and (king_row * 8 + 6) not in opponent_attacks
-                ):
-                    moves.append(Move(square, king_row * 8 + 6, Move.CASTLE_FLAG))
-
-            # Queenside castling (c-file)
-            queenside_mask = 2 if is_white_king else 8
-            if rights & queenside_mask:
-                if (
-                    self.board.square[king_row * 8 + 1] == NONE
-                    and self.board.square[king_row * 8 + 2] == NONE
-                    and self.board.square[king_row * 8 + 3] == NONE
-                    and (king_row * 8 + 2) not in opponent_attacks
-                    and (king_row * 8 + 3) not in opponent_attacks
-                    and (king_row * 8 + 4) not in opponent_attacks
-                ):
-                    moves.append(Move(square, king_row * 8 + 2, Move.CASTLE_FLAG))
+    def _castling_moves(self, king_square, occupied, enemy_attacks, append):
+        """
+        Generate castling moves. Only called when the king is not in check.
+        """
+        rights = self.board.castling_rights
+        if not rights:
+            return
+
+        white = self.board.is_white_to_move
+        kingside_mask = 1 if white else 4
+        queenside_mask = 2 if white else 8
+        base = 0 if white else 56
+        if king_square != base + 4:
+            return
+
+        if rights & kingside_mask:
+            path = (1 << (base + 5)) | (1 << (base + 6))
+            if not (occupied & path) and not (enemy_attacks & path):
+                append(king_square | (base + 6) << TARGET_SQUARE_SHIFT | PACKED_CASTLE)
+
+        if rights & queenside_mask:
+            path = (1 << (base + 2)) | (1 << (base + 3))
+            if not (occupied & (path | (1 << (base + 1)))) and not (
+                enemy_attacks & path
+            ):
+                append(king_square | (base + 2) << TARGET_SQUARE_SHIFT | PACKED_CASTLE)
 
-        return moves
+    def _attack_map(self, colour, occupied):
+        """
+        Return a bitboard of every square attacked by the pieces of 'colour',
+        using 'occupied' as the blocker set for sliding pieces.
+        """
+        pieces = self.board.piece_bitboards
+
+        pawns = pieces[PAWN | colour]
+        if colour == WHITE:
+            attacks = ((pawns << 7) & NOT_FILE_H) | ((pawns << 9) & NOT_FILE_A)
+        else:
+            attacks = ((pawns >> 9) & NOT_FILE_H) | ((pawns >> 7) & NOT_FILE_A)
+
+        knights = pieces[KNIGHT | colour]
+        while knights:
+            lsb = knights & -knights
+            knights ^= lsb
+            attacks |= KNIGHT_ATTACKS[lsb.bit_length() - 1]
+
+        queens = pieces[QUEEN | colour]
+        diagonal = pieces[BISHOP | colour] | queens
+        while diagonal:
+            lsb = diagonal & -diagonal
+            diagonal ^= lsb
+            attacks |= get_bishop_attacks(lsb.bit_length() - 1, occupied)
+
+        orthogonal = pieces[ROOK | colour] | queens
+        while orthogonal:
+            lsb = orthogonal & -orthogonal
+            orthogonal ^= lsb
+            attacks |= get_rook_attacks(lsb.bit_length() - 1, occupied)
+
+        king = pieces[KING | colour]
+        if king:
+            attacks |= KING_MOVES[king.bit_length() - 1]
+
+        return attacks & FULL_BOARD
 
     def get_legal_moves_for_square(self, square):
         """
@@ -309,118 +753,8 @@ class MoveGenerator:
         ):
             return []
 
-        # Generate all pseudo-legal moves for this piece
-        pseudo_legal_moves = []
-        if piece_type(piece) == PAWN:
-            pseudo_legal_moves = self._pawn_moves(square, piece)
-        elif piece_type(piece) == KNIGHT:
-            pseudo_legal_moves = self._knight_moves(square, piece)
-        elif piece_type(piece) == BISHOP:
-            pseudo_legal_moves = self._bishop_moves(square, piece)
-        elif piece_type(piece) == ROOK:
-            pseudo_legal_moves = self._rook_moves(square, piece)
-        elif piece_type(piece) == QUEEN:
-            pseudo_legal_moves = self._queen_moves(square, piece)
-        elif piece_type(piece) == KING:
-            pseudo_legal_moves = self._king_moves(square, piece)
-
-        # Filter out moves that would leave the king in check
-        # Using a simplified approach that doesn't involve making/unmaking moves
-        legal_moves = []
-        king_square = self.board.king_square[self.board.move_colour_index]
-        
-        for move in pseudo_legal_moves:
-            # Special handling for king moves
-            if piece_type(self.board.square[move.start_square]) == KING:
-                # For king moves, we've already verified they don't move into check in _king_moves
-                legal_moves.append(move)
-                continue
-                
-            # For non-king moves, we need to check if they would expose the king to check
-            # Make a simplified test of the move without using make_move/unmake_move
-            is_legal = True
-            
-            # Save original board state we need to modify
-            original_square_start = self.board.square[move.start_square]
-            original_square_target = self.board.square[move.target_square]
-            
-            # Simulate the move
-            self.board.square[move.target_square] = original_square_start
-            self.board.square[move.start_square] = NONE
-            
-            # Check if king is under attack after the move
-            opponent_attacks = self._generate_opponent_attacks()
-            if king_square in opponent_attacks:
-                is_legal = False
-                
-            # Restore the board state
-            self.board.square[move.start_square] = original_square_start
-            self.board.square[move.target_square] = original_square_target
-            
-            if is_legal:
-                legal_moves.append(move)
-
-        return legal_moves
-
-    def _generate_opponent_attacks(self):
-        """
-        Generate a set of all squares controlled by opponent pieces.
-        """
-        attacks = set()
-        for sq in range(64):
-            piece = self.board.square[sq]
-            if piece == NONE or is_white(piece) == self.board.is_white_to_move:
-                continue  # only consider opponent pieces
-
-            piece_type_val = piece_type(piece)
-
-            if piece_type_val == PAWN:
-                # Use pre-calculated attack tables
-                pawn_attacks = (
-                    WHITE_PAWN_ATTACKS[sq]
-                    if is_white(piece)
-                    else BLACK_PAWN_ATTACKS[sq]
-                )
-                for i in range(64):
-                    if contains_square(pawn_attacks, i):
-                        attacks.add(i)
-
-            elif piece_type_val == KNIGHT:
-                # Use pre-calculated attack tables
-                knight_attacks = KNIGHT_ATTACKS[sq]
-                for i in range(64):
-                    if contains_square(knight_attacks, i):
-                        attacks.add(i)
-
-            elif piece_type_val in (BISHOP, ROOK, QUEEN):
-                row, col = divmod(sq, 8)
-                directions = []
-
-                if piece_type_val in (BISHOP, QUEEN):
-                    directions += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-
-                if piece_type_val in (ROOK, QUEEN):
-                    directions += [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-                for dr, dc in directions:
-                    r, c = row, col
-                    while True:
-                        r += dr
-                        c += dc
-                        if not (0 <= r < 8 and 0 <= c < 8):
-                            break
-
-                        idx = r * 8 + c
-                        attacks.add(idx)
-
-                        if self.board.square[idx] != NONE:
-                            break
-
-            elif piece_type_val == KING:
-                # Use pre-calculated attack tables
-                king_moves = KING_MOVES[sq]
-                for i in range(64):
-                    if contains_square(king_moves, i):
-                        attacks.add(i)
-
-        return attacks
+        return [
+            move
+            for move in self.generate_legal_moves()
+            if move.start_square == square
+        ]
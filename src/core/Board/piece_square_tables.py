@@ -0,0 +1,147 @@
+"""
+Piece values and piece-square tables shared by the board and the evaluator.
+
+The board keeps running material + piece-square scores per side, so the
+tables are also precomputed here as integer tables indexed by
+[piece][square], already mirrored for black.
+"""
+
+from src.core.Board.piece import *
+
+# Piece values in centipawns (1 pawn = 100 centipawns)
+PIECE_VALUES = {
+    PAWN: 10,
+    KNIGHT: 30,
+    BISHOP: 30,
+    ROOK: 50,
+    QUEEN: 90,
+    KING: 900,  # High value to ensure king's safety
+}
+
+# Piece-square tables for positional evaluation
+# Adapted from simplified chess programming theory
+# Each table is from white's perspective, will be flipped for black
+PAWN_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0,
+    1.0, 1.0, 2.0, 3.0, 3.0, 2.0, 1.0, 1.0,
+    0.5, 0.5, 1.0, 2.5, 2.5, 1.0, 0.5, 0.5,
+    0.0, 0.0, 0.0, 2.0, 2.0, 0.0, 0.0, 0.0,
+    0.5, -0.5, -1.0, 0.0, 0.0, -1.0, -0.5, 0.5,
+    0.5, 1.0, 1.0, -2.0, -2.0, 1.0, 1.0, 0.5,
+    0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+]
+
+KNIGHT_TABLE = [
+    -5.0, -4.0, -3.0, -3.0, -3.0, -3.0, -4.0, -5.0,
+    -4.0, -2.0, 0.0, 0.0, 0.0, 0.0, -2.0, -4.0,
+    -3.0, 0.0, 1.0, 1.5, 1.5, 1.0, 0.0, -3.0,
+    -3.0, 0.5, 1.5, 2.0, 2.0, 1.5, 0.5, -3.0,
+    -3.0, 0.0, 1.5, 2.0, 2.0, 1.5, 0.0, -3.0,
+    -3.0, 0.5, 1.0, 1.5, 1.5, 1.0, 0.5, -3.0,
+    -4.0, -2.0, 0.0, 0.5, 0.5, 0.0, -2.0, -4.0,
+    -5.0, -4.0, -3.0, -3.0, -3.0, -3.0, -4.0, -5.0
+]
+
+BISHOP_TABLE = [
+    -2.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -2.0,
+    -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0,
+    -1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 0.0, -1.0,
+    -1.0, 0.5, 0.5, 1.0, 1.0, 0.5, 0.5, -1.0,
+    -1.0, 0.0, 0.5, 1.0, 1.0, 0.5, 0.0, -1.0,
+    -1.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, -1.0,
+    -1.0, 0.0, 0.5, 0.0, 0.0, 0.5, 0.0, -1.0,
+    -2.0, -1.0, -1.0, -1.0, -1.0, -1.0, -1.0, -2.0
+]
+
+ROOK_TABLE = [
+    0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+    0.5, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5,
+    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
+    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
+    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
+    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
+    -0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.5,
+    0.0, 0.0, 0.0, 0.5, 0.5, 0.0, 0.0, 0.0
+]
+
+QUEEN_TABLE = [
+    -2.0, -1.0, -1.0, -0.5, -0.5, -1.0, -1.0, -2.0,
+    -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0,
+    -1.0, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -1.0,
+    -0.5, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -0.5,
+    0.0, 0.0, 0.5, 0.5, 0.5, 0.5, 0.0, -0.5,
+    -1.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.0, -1.0,
+    -1.0, 0.0, 0.5, 0.0, 0.0, 0.0, 0.0, -1.0,
+    -2.0, -1.0, -1.0, -0.5, -0.5, -1.0, -1.0, -2.0
+]
+
+KING_MIDDLE_GAME_TABLE = [
+    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
+    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
+    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
+    -3.0, -4.0, -4.0, -5.0, -5.0, -4.0, -4.0, -3.0,
+    -2.0, -3.0, -3.0, -4.0, -4.0, -3.0, -3.0, -2.0,
+    -1.0, -2.0, -2.0, -2.0, -2.0, -2.0, -2.0, -1.0,
+    2.0, 2.0, 0.0, 0.0, 0.0, 0.0, 2.0, 2.0,
+    2.0, 3.0, 1.0, 0.0, 0.0, 1.0, 3.0, 2.0
+]
+
+KING_END_GAME_TABLE = [
+    -5.0, -4.0, -3.0, -2.0, -2.0, -3.0, -4.0, -5.0,
+    -3.0, -2.0, -1.0, 0.0, 0.0, -1.0, -2.0, -3.0,
+    -3.0, -1.0, 2.0, 3.0, 3.0, 2.0, -1.0, -3.0,
+    -3.0, -1.0, 3.0, 4.0, 4.0, 3.0, -1.0, -3.0,
+    -3.0, -1.0, 3.0, 4.0, 4.0, 3.0, -1.0, -3.0,
+    -3.0, -1.0, 2.0, 3.0, 3.0, 2.0, -1.0, -3.0,
+    -3.0, -3.0, 0.0, 0.0, 0.0, 0.0, -3.0, -3.0,
+    -5.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -5.0
+]
+
+
+# Game phase: weight of each piece type (indexed by piece type). A full set
+# of pieces gives MAX_GAME_PHASE; bare kings and pawns give 0. The
+# evaluation interpolates between middlegame and endgame scores with it.
+PHASE_WEIGHTS = [0, 0, 1, 1, 2, 4, 0]  # NONE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+MAX_GAME_PHASE = 24
+
+# Integer tables hold scores in half units, since every table entry is a
+# multiple of 0.5. Divide accumulated scores by PSQT_SCALE.
+PSQT_SCALE = 2
+
+PIECE_TABLES = {
+    PAWN: PAWN_TABLE,
+    KNIGHT: KNIGHT_TABLE,
+    BISHOP: BISHOP_TABLE,
+    ROOK: ROOK_TABLE,
+    QUEEN: QUEEN_TABLE,
+}
+
+
+def mirror_square(square):
+    """Mirror a square vertically (a1 <-> a8)"""
+    return (7 - square // 8) * 8 + (square % 8)
+
+
+def _build_psqt(king_table):
+    """
+    Build an integer material + position table for every piece code.
+    White pieces index the position table by square and black pieces by
+    the mirrored square, matching the evaluator's per-square lookup.
+    """
+    tables = [[0] * 64 for _ in range(MAX_PIECE_INDEX + 1)]
+    for piece in PIECE_INDICES:
+        piece_type_val = piece_type(piece)
+        position_table = PIECE_TABLES.get(piece_type_val, king_table)
+        value = PIECE_VALUES[piece_type_val]
+        for square in range(64):
+            table_square = square if is_white(piece) else mirror_square(square)
+            tables[piece][square] = int(
+                round((value + position_table[table_square]) * PSQT_SCALE)
+            )
+    return tables
+
+
+# Material + piece-square scores with the middlegame and endgame king tables
+PSQT_MIDDLE_GAME = _build_psqt(KING_MIDDLE_GAME_TABLE)
+PSQT_END_GAME = _build_psqt(KING_END_GAME_TABLE)
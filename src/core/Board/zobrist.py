@@ -1,5 +1,5 @@
 import random
-from src.core.Board.piece import MAX_PIECE_INDEX, PIECE_INDICES, NONE, piece_type
+from src.core.Board.piece import MAX_PIECE_INDEX, PIECE_INDICES, NONE, PAWN, piece_type
 
 class Zobrist:
     pieces_array = [[0 for _ in range(64)] for _ in range(MAX_PIECE_INDEX + 1)]
@@ -30,15 +30,25 @@ class Zobrist:
             piece = board.squares[square_index // 8][square_index % 8] if hasattr(board, 'squares') else board.square[square_index]
             if piece_type(piece) != NONE:
                 zobrist_key ^= cls.pieces_array[piece][square_index]
-        en_passant_file = getattr(getattr(board, 'current_game_state', None), 'en_passant_file', None)
+        en_passant_file = getattr(board, 'en_passant_file', None)
         if en_passant_file is not None:
             zobrist_key ^= cls.en_passant_file[en_passant_file]
         move_colour = getattr(board, 'move_colour', None)
         if move_colour is not None and move_colour == 8:  # 8 = BLACK
             zobrist_key ^= cls.side_to_move
-        castling_rights = getattr(getattr(board, 'current_game_state', None), 'castling_rights', None)
+        castling_rights = getattr(board, 'castling_rights', None)
         if castling_rights is not None:
             zobrist_key ^= cls.castling_rights[castling_rights]
         return zobrist_key
 
+    @classmethod
+    def calculate_pawn_key(cls, board):
+        """Key of the pawn placement only (both colours)"""
+        pawn_key = 0
+        for square_index in range(64):
+            piece = board.square[square_index]
+            if piece_type(piece) == PAWN:
+                pawn_key ^= cls.pieces_array[piece][square_index]
+        return pawn_key
+
 Zobrist.initialize()
\ No newline at end of file
@@ -2,7 +2,7 @@
 # Converted from MoveUtility.cs
 from src.core.helper.board_helper import *
 from src.core.Board.piece import *
-# from src.core.Board.move import Move
+from src.core.Board.move import Move
 # from src.core.Board.board import Board
 
 def get_move_from_uci_name(move_name, board):
@@ -25,14 +25,19 @@ def get_move_from_uci_name(move_name, board):
     return (start_square, target_square, flag)  # Placeholder
 
 def get_move_name_uci(move):
-    # TODO: Implement Move class
-    # start_square_name = square_name_from_index(move.start_square)
-    # end_square_name = square_name_from_index(move.target_square)
-    # move_name = start_square_name + end_square_name
-    # if move.is_promotion:
-    #     ...
-    # return move_name
-    return ""  # Placeholder
+    if isinstance(move, int):
+        move = Move.from_value(move)
+    start_square_name = square_name_from_index(move.start_square)
+    end_square_name = square_name_from_index(move.target_square)
+    move_name = start_square_name + end_square_name
+    if move.is_promotion:
+        move_name += {
+            Move.PROMOTE_TO_QUEEN_FLAG: "q",
+            Move.PROMOTE_TO_ROOK_FLAG: "r",
+            Move.PROMOTE_TO_KNIGHT_FLAG: "n",
+            Move.PROMOTE_TO_BISHOP_FLAG: "b",
+        }.get(move.move_flag, "")
+    return move_name
 
 def get_move_name_san(move, board):
     # TODO: Implement full SAN logic
@@ -0,0 +1,93 @@
+"""
+Benchmark for the static evaluation.
+
+Times evaluate_board over a fixed, reproducible set of positions: the perft
+reference positions plus positions reached by seeded random playouts from
+the start position.
+
+Usage:
+    python -m src.tools.eval_bench
+    python -m src.tools.eval_bench --positions 500 --seconds 5
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from src.core.Board.board import Board
+from src.core.Board.move_generator import MoveGenerator
+from src.core.helper.fen_utility import current_fen
+from src.agent.evaluation import evaluate_board
+from src.agent.pawn_hash_table import PawnHashTable
+from src.tools.perft import REFERENCE_POSITIONS
+
+
+def benchmark_positions(count=200, seed=12345, max_plies=80):
+    """
+    Build a reproducible list of FENs: the reference positions followed by
+    positions sampled from random playouts
+    """
+    rng = random.Random(seed)
+    fens = [position.fen for position in REFERENCE_POSITIONS]
+
+    while len(fens) < count:
+        board = Board.create_board()
+        for _ in range(rng.randint(4, max_plies)):
+            moves = MoveGenerator(board).generate_legal_moves()
+            if not moves:
+                break
+            board.make_move(rng.choice(moves), in_search=True)
+        fens.append(current_fen(board))
+
+    return fens[:count]
+
+
+def run_benchmark(fens, seconds=2.0, out=sys.stdout):
+    """
+    Evaluate the positions repeatedly for about 'seconds', with a pawn hash
+    table of its own as in the search. Returns evaluations per second.
+    """
+    boards = [Board.create_board(fen) for fen in fens]
+    pawn_hash_table = PawnHashTable()
+
+    evaluations = 0
+    start_time = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds:
+        for board in boards:
+            evaluate_board(board, pawn_hash_table)
+        evaluations += len(boards)
+        elapsed = time.perf_counter() - start_time
+
+    rate = evaluations / elapsed
+    print(
+        f"Positions: {len(boards)}  Evaluations: {evaluations}  "
+        f"Time: {elapsed:.2f}s  {rate:,.0f} evals/s  "
+        f"{1e6 / rate:.1f} us/eval",
+        file=out,
+    )
+    return rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tools.eval_bench",
+        description="Static evaluation benchmark",
+    )
+    parser.add_argument(
+        "--positions", type=int, default=200, help="number of positions"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=2.0, help="minimum benchmark duration"
+    )
+    parser.add_argument("--seed", type=int, default=12345, help="playout seed")
+    args = parser.parse_args(argv)
+
+    fens = benchmark_positions(args.positions, args.seed)
+    run_benchmark(fens, args.seconds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
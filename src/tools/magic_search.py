@@ -0,0 +1,181 @@
+"""
+Magic number search for the fancy magic bitboard tables in magic.py.
+
+Each square needs a magic number that maps every blocker configuration of
+its mask to a table index without two different attack sets sharing an
+index. Fewer index bits means a smaller table for that square. The search
+starts from the current index size of each square and, within a time
+budget, looks for a magic with one bit fewer, repeating while it succeeds.
+
+Result so far: a seeded run (--seed 1, --seconds 3, rooks and bishops) found
+no square that fits in fewer bits than the current ROOK_INDEX_BITS and
+BISHOP_INDEX_BITS (102400 + 5248 entries), so the magics in magic.py are
+unchanged. Smaller tables need a much longer search than this tool's
+random trial budget.
+
+Usage:
+    python -m src.tools.magic_search                     # check the current magics
+    python -m src.tools.magic_search --search --seconds 1
+    python -m src.tools.magic_search --search --bishop --seconds 5 --seed 7
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from src.core.Board.magic import (
+    ROOK_MAGICS,
+    BISHOP_MAGICS,
+    ROOK_INDEX_BITS,
+    BISHOP_INDEX_BITS,
+    FULL_BOARD,
+    ATTACK_TABLE,
+    create_rook_mask,
+    create_bishop_mask,
+    compute_rook_attacks,
+    compute_bishop_attacks,
+    generate_blockers,
+)
+
+
+def square_occupancies(square, rook):
+    """Return (mask, blocker sets, matching attack sets) for a square"""
+    mask = create_rook_mask(square) if rook else create_bishop_mask(square)
+    compute_attacks = compute_rook_attacks if rook else compute_bishop_attacks
+    blockers = generate_blockers(mask)
+    return mask, blockers, [compute_attacks(square, b) for b in blockers]
+
+
+def is_valid_magic(magic, bits, blockers, attacks):
+    """Check that 'magic' indexes every blocker set without a destructive collision"""
+    shift = 64 - bits
+    table = {}
+    for blocker_set, attack_set in zip(blockers, attacks):
+        index = ((blocker_set * magic) & FULL_BOARD) >> shift
+        stored = table.setdefault(index, attack_set)
+        if stored != attack_set:
+            return False
+    return True
+
+
+def random_magic(rng):
+    """Random 64-bit number with few bits set (these make better magics)"""
+    return rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+
+
+def find_magic(mask, bits, blockers, attacks, rng, deadline):
+    """Search for a magic with 'bits' index bits until 'deadline'; None if not found"""
+    while time.perf_counter() < deadline:
+        magic = random_magic(rng)
+        # Quick reject: the mask must spread into the top bits of the product
+        if ((mask * magic) & 0xFF00000000000000).bit_count() < 6:
+            continue
+        if is_valid_magic(magic, bits, blockers, attacks):
+            return magic
+    return None
+
+
+def search(rook, rng, seconds_per_square, out=sys.stdout):
+    """
+    Try to shrink the table of every square.
+    Returns (magics, index bits) for all 64 squares.
+    """
+    magics = list(ROOK_MAGICS if rook else BISHOP_MAGICS)
+    index_bits = list(ROOK_INDEX_BITS if rook else BISHOP_INDEX_BITS)
+
+    for square in range(64):
+        mask, blockers, attacks = square_occupancies(square, rook)
+        deadline = time.perf_counter() + seconds_per_square
+        while index_bits[square] > 1:
+            magic = find_magic(
+                mask, index_bits[square] - 1, blockers, attacks, rng, deadline
+            )
+            if magic is None:
+                break
+            magics[square] = magic
+            index_bits[square] -= 1
+            print(
+                f"square {square:2}: {index_bits[square]} bits with {magic:#x}",
+                file=out,
+            )
+    return magics, index_bits
+
+
+def table_entries(index_bits):
+    return sum(1 << bits for bits in index_bits)
+
+
+def check_current_magics(out=sys.stdout):
+    """Verify the magics in magic.py and report the table size. Returns True if valid."""
+    all_valid = True
+    for rook, magics, index_bits in (
+        (True, ROOK_MAGICS, ROOK_INDEX_BITS),
+        (False, BISHOP_MAGICS, BISHOP_INDEX_BITS),
+    ):
+        for square in range(64):
+            _, blockers, attacks = square_occupancies(square, rook)
+            if not is_valid_magic(magics[square], index_bits[square], blockers, attacks):
+                all_valid = False
+                piece = "rook" if rook else "bishop"
+                print(f"{piece} magic for square {square} is invalid", file=out)
+
+    rook_entries = table_entries(ROOK_INDEX_BITS)
+    bishop_entries = table_entries(BISHOP_INDEX_BITS)
+    print(
+        f"Rook entries: {rook_entries}  Bishop entries: {bishop_entries}  "
+        f"Total: {rook_entries + bishop_entries} "
+        f"({(rook_entries + bishop_entries) * 8 / 1024:.0f} KiB as uint64)  "
+        f"Distinct attack sets: {len(set(ATTACK_TABLE))}",
+        file=out,
+    )
+    return all_valid
+
+
+def format_table(name, values, hex_values, per_line):
+    lines = [f"{name} = ["]
+    for start in range(0, 64, per_line):
+        chunk = values[start : start + per_line]
+        text = ", ".join(f"{v:#x}" if hex_values else str(v) for v in chunk)
+        lines.append(f"    {text},")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tools.magic_search",
+        description="Check magic numbers or search for smaller magic tables",
+    )
+    parser.add_argument(
+        "--search", action="store_true", help="search for magics with fewer index bits"
+    )
+    parser.add_argument(
+        "--bishop", action="store_true", help="search bishop magics instead of rook magics"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=1.0, help="search time per square"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args(argv)
+
+    if not check_current_magics():
+        return 1
+    if not args.search:
+        return 0
+
+    rook = not args.bishop
+    old_bits = ROOK_INDEX_BITS if rook else BISHOP_INDEX_BITS
+    magics, index_bits = search(rook, random.Random(args.seed), args.seconds)
+    print(
+        f"Table entries: {table_entries(old_bits)} -> {table_entries(index_bits)}"
+    )
+    if index_bits != list(old_bits):
+        prefix = "ROOK" if rook else "BISHOP"
+        print(format_table(f"{prefix}_MAGICS", magics, True, 4))
+        print(format_table(f"{prefix}_INDEX_BITS", index_bits, False, 8))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Perft harness for the move generator.
+
+Counts the leaf nodes of the legal move tree to a fixed depth using
+Board.make_move/unmake_move and MoveGenerator. It serves two purposes:
+- Correctness gate: node counts are compared against the published values
+  for a suite of standard reference positions.
+- Throughput benchmark: every run reports nodes per second.
+
+Usage:
+    python -m src.tools.perft                          # verify the suite at depth 3
+    python -m src.tools.perft --depth 4                # deeper verification
+    python -m src.tools.perft --position kiwipete --depth 3 --divide
+    python -m src.tools.perft --fen "<fen>" --depth 4 --divide
+    python -m src.tools.perft --depth 3 --debug-zobrist  # also verify hash keys
+    python -m src.tools.perft --depth 3 --debug-psqt     # also verify piece-square scores
+    python -m src.tools.perft --depth 4 --pseudo-legal   # legality tested after making moves
+"""
+
+import argparse
+import sys
+import time
+from array import array
+
+from src.core.Board.board import Board
+from src.core.Board.move_generator import MoveGenerator
+from src.core.helper.fen_utility import START_POSITION_FEN
+from src.core.helper.move_utility import get_move_name_uci
+
+
+class PerftPosition:
+    """
+    A reference position with its known node counts (index 0 is depth 1)
+    """
+
+    def __init__(self, name, fen, node_counts):
+        self.name = name
+        self.fen = fen
+        self.node_counts = node_counts
+
+    def expected_nodes(self, depth):
+        """Known node count at 'depth', or None if it is not recorded"""
+        if 1 <= depth <= len(self.node_counts):
+            return self.node_counts[depth - 1]
+        return None
+
+
+# Standard perft positions (https://www.chessprogramming.org/Perft_Results)
+REFERENCE_POSITIONS = [
+    PerftPosition(
+        "startpos",
+        START_POSITION_FEN,
+        [20, 400, 8902, 197281, 4865609, 119060324],
+    ),
+    PerftPosition(
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        [48, 2039, 97862, 4085603, 193690690],
+    ),
+    PerftPosition(
+        "position3",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        [14, 191, 2812, 43238, 674624, 11030083],
+    ),
+    PerftPosition(
+        "position4",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        [6, 264, 9467, 422333, 15833292],
+    ),
+    PerftPosition(
+        "position4_mirrored",
+        "r2q1rk1/pP1p2pp/Q4n2/bbp1p3/Np6/1B3NBn/pPPP1PPP/R3K2R b KQ - 0 1",
+        [6, 264, 9467, 422333, 15833292],
+    ),
+    PerftPosition(
+        "position5",
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        [44, 1486, 62379, 2103487, 89941194],
+    ),
+    PerftPosition(
+        "position6",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        [46, 2079, 89890, 3894594, 164075551],
+    ),
+]
+
+
+def perft(board, depth, pseudo_legal=False):
+    """
+    Count leaf nodes of the legal move tree to 'depth'.
+
+    By default legal moves are generated and bulk counting is used: at
+    depth 1 the number of legal moves is returned without making them.
+    With pseudo_legal=True pseudo-legal moves are generated and every move
+    is made and tested with Board.is_mover_in_check, as the search does
+    in that mode.
+    """
+    if depth < 1:
+        return 1
+    # One reusable packed move buffer per remaining depth
+    buffers = [array("H") for _ in range(depth + 1)]
+    if pseudo_legal:
+        return _perft_pseudo_legal(MoveGenerator(board), board, depth, buffers)
+    return _perft(MoveGenerator(board), board, depth, buffers)
+
+
+def _perft(move_generator, board, depth, buffers):
+    moves = move_generator.generate_moves(buffers[depth])
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        board.make_move(move, in_search=True)
+        nodes += _perft(move_generator, board, depth - 1, buffers)
+        board.unmake_move(move, in_search=True)
+    return nodes
+
+
+def _perft_pseudo_legal(move_generator, board, depth, buffers):
+    nodes = 0
+    for move in move_generator.generate_moves(buffers[depth], pseudo_legal=True):
+        board.make_move(move, in_search=True)
+        if not board.is_mover_in_check():
+            if depth == 1:
+                nodes += 1
+            else:
+                nodes += _perft_pseudo_legal(move_generator, board, depth - 1, buffers)
+        board.unmake_move(move, in_search=True)
+    return nodes
+
+
+def perft_divide(board, depth, pseudo_legal=False):
+    """
+    Run perft below each root move.
+    Returns a list of (uci move name, node count) pairs.
+    """
+    results = []
+    for move in MoveGenerator(board).generate_moves():
+        board.make_move(move, in_search=True)
+        nodes = perft(board, depth - 1, pseudo_legal)
+        board.unmake_move(move, in_search=True)
+        results.append((get_move_name_uci(move), nodes))
+    return results
+
+
+def run_perft(
+    fen,
+    depth,
+    divide=False,
+    debug_zobrist=False,
+    debug_psqt=False,
+    pseudo_legal=False,
+    out=sys.stdout,
+):
+    """
+    Run perft on 'fen' and print the result with nodes/sec.
+    Returns (nodes, seconds).
+    """
+    board = Board.create_board(fen)
+    board.debug_zobrist = debug_zobrist
+    board.debug_psqt = debug_psqt
+    start_time = time.perf_counter()
+    if divide:
+        results = perft_divide(board, depth, pseudo_legal)
+        for move_name, move_nodes in sorted(results):
+            print(f"{move_name}: {move_nodes}", file=out)
+        nodes = sum(move_nodes for _, move_nodes in results)
+    else:
+        nodes = perft(board, depth, pseudo_legal)
+    elapsed = time.perf_counter() - start_time
+
+    nps = nodes / elapsed if elapsed > 0 else 0
+    print(f"Nodes: {nodes}  Time: {elapsed:.3f}s  NPS: {nps:,.0f}", file=out)
+    return nodes, elapsed
+
+
+def run_suite(
+    depth,
+    positions=None,
+    debug_zobrist=False,
+    debug_psqt=False,
+    pseudo_legal=False,
+    out=sys.stdout,
+):
+    """
+    Verify each reference position at 'depth' (capped at the deepest known
+    count for that position) and report throughput.
+    Returns True if every node count matches.
+    """
+    positions = positions or REFERENCE_POSITIONS
+    all_passed = True
+    total_nodes = 0
+    total_time = 0.0
+
+    for position in positions:
+        position_depth = min(depth, len(position.node_counts))
+        expected = position.expected_nodes(position_depth)
+        board = Board.create_board(position.fen)
+        board.debug_zobrist = debug_zobrist
+        board.debug_psqt = debug_psqt
+
+        start_time = time.perf_counter()
+        nodes = perft(board, position_depth, pseudo_legal)
+        elapsed = time.perf_counter() - start_time
+
+        total_nodes += nodes
+        total_time += elapsed
+        passed = nodes == expected
+        all_passed = all_passed and passed
+        nps = nodes / elapsed if elapsed > 0 else 0
+        status = "OK" if passed else f"FAIL (expected {expected})"
+        print(
+            f"{position.name:<20} depth {position_depth}  nodes {nodes:>10}  "
+            f"{elapsed:7.2f}s  {nps:>10,.0f} nps  {status}",
+            file=out,
+        )
+
+    total_nps = total_nodes / total_time if total_time > 0 else 0
+    print(
+        f"{'total':<20}          nodes {total_nodes:>10}  "
+        f"{total_time:7.2f}s  {total_nps:>10,.0f} nps",
+        file=out,
+    )
+    return all_passed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tools.perft",
+        description="Perft correctness check and move generation benchmark",
+    )
+    parser.add_argument("--depth", type=int, default=3, help="search depth")
+    parser.add_argument("--fen", help="run perft on a custom FEN")
+    parser.add_argument(
+        "--position",
+        choices=[position.name for position in REFERENCE_POSITIONS],
+        help="run a single reference position",
+    )
+    parser.add_argument(
+        "--divide",
+        action="store_true",
+        help="print the node count below each root move",
+    )
+    parser.add_argument(
+        "--debug-zobrist",
+        action="store_true",
+        help="verify the incremental Zobrist key after every move (slow)",
+    )
+    parser.add_argument(
+        "--debug-psqt",
+        action="store_true",
+        help="verify the running piece-square scores and game phase after every move (slow)",
+    )
+    parser.add_argument(
+        "--pseudo-legal",
+        action="store_true",
+        help="generate pseudo-legal moves and test legality after making them",
+    )
+    args = parser.parse_args(argv)
+
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+
+    if args.fen:
+        run_perft(
+            args.fen,
+            args.depth,
+            args.divide,
+            args.debug_zobrist,
+            args.debug_psqt,
+            args.pseudo_legal,
+        )
+        return 0
+
+    if args.position:
+        position = next(p for p in REFERENCE_POSITIONS if p.name == args.position)
+        nodes, _ = run_perft(
+            position.fen,
+            args.depth,
+            args.divide,
+            args.debug_zobrist,
+            args.debug_psqt,
+            args.pseudo_legal,
+        )
+        expected = position.expected_nodes(args.depth)
+        if expected is None:
+            return 0
+        if nodes != expected:
+            print(f"FAIL: expected {expected}")
+            return 1
+        print("OK")
+        return 0
+
+    if args.divide:
+        parser.error("--divide requires --fen or --position")
+
+    passed = run_suite(
+        args.depth,
+        debug_zobrist=args.debug_zobrist,
+        debug_psqt=args.debug_psqt,
+        pseudo_legal=args.pseudo_legal,
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Benchmark for the alpha-beta search.
+
+Searches a fixed set of positions to a fixed depth with a deterministic
+agent (no random tie-breaking, fresh tables per position) and reports the
+number of nodes evaluated by the time each iterative-deepening depth
+completed (cumulative, so the last column is the whole search). Static
+evaluations made at interior nodes for futility pruning are not nodes;
+they are reported separately in the 'static' column.
+Search features can be switched off to measure what they save.
+
+Usage:
+    python -m src.tools.search_bench
+    python -m src.tools.search_bench --depth 5
+    python -m src.tools.search_bench --depth 5 --no-pvs --no-aspiration
+    python -m src.tools.search_bench --depth 6 --no-null-move
+    python -m src.tools.search_bench --depth 6 --no-lmr --no-futility --no-reverse-futility
+"""
+
+import argparse
+import sys
+import time
+
+from src.core.Board.board import Board
+from src.core.helper.move_utility import get_move_name_uci
+from src.agent.alpha_beta import AlphaBetaAgent, NULL_MOVE_VERIFICATION_DEPTH
+from src.tools.perft import REFERENCE_POSITIONS
+
+# The perft reference positions plus quieter opening and endgame positions
+BENCHMARK_POSITIONS = [(position.name, position.fen) for position in REFERENCE_POSITIONS] + [
+    ("italian", "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3"),
+    ("queens_gambit", "rnbqkb1r/ppp2ppp/4pn2/3p4/2PP4/2N5/PP2PPPP/R1BQKBNR w KQkq - 2 4"),
+    ("rook_endgame", "8/5pk1/6p1/8/3R4/6P1/r4PK1/8 w - - 0 40"),
+    ("pawn_endgame", "8/8/3k4/2pP4/2P5/3K4/8/8 w - - 0 50"),
+]
+
+
+def run_benchmark(depth, agent_options=None, positions=None, out=sys.stdout):
+    """
+    Search every position to 'depth' and print nodes per completed depth.
+    Returns the total nodes per depth, summed over the positions.
+    """
+    agent_options = agent_options or {}
+    positions = positions or BENCHMARK_POSITIONS
+    totals = [0] * depth
+    total_time = 0.0
+    total_static_evals = 0
+
+    for name, fen in positions:
+        board = Board.create_board(fen)
+        agent = AlphaBetaAgent(max_depth=depth, random_tie_break=False, **agent_options)
+
+        start_time = time.perf_counter()
+        move = agent.choose_move(board)
+        elapsed = time.perf_counter() - start_time
+        total_time += elapsed
+
+        for index, nodes in enumerate(agent.iteration_nodes):
+            totals[index] += nodes
+        total_static_evals += agent.static_evals
+        node_counts = " ".join(f"{nodes:>8}" for nodes in agent.iteration_nodes)
+        move_name = get_move_name_uci(move) if move else "-"
+        print(
+            f"{name:<20} {move_name:<6} {elapsed:7.2f}s  {node_counts}"
+            f"  {agent.static_evals:>8}",
+            file=out,
+        )
+
+    node_counts = " ".join(f"{nodes:>8}" for nodes in totals)
+    print(
+        f"{'total':<20} {'':<6} {total_time:7.2f}s  {node_counts}  {total_static_evals:>8}",
+        file=out,
+    )
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tools.search_bench",
+        description="Search benchmark: nodes evaluated per iterative-deepening depth",
+    )
+    parser.add_argument("--depth", type=int, default=4, help="search depth")
+    parser.add_argument(
+        "--no-pvs", action="store_true", help="search every move with the full window"
+    )
+    parser.add_argument(
+        "--no-aspiration",
+        action="store_true",
+        help="search every root iteration with the full window",
+    )
+    parser.add_argument(
+        "--no-null-move", action="store_true", help="disable null-move pruning"
+    )
+    parser.add_argument(
+        "--null-move-verification-depth",
+        type=int,
+        default=NULL_MOVE_VERIFICATION_DEPTH,
+        help="depth from which null-move cutoffs are verified (0 to never verify)",
+    )
+    parser.add_argument(
+        "--no-lmr", action="store_true", help="disable late move reductions"
+    )
+    parser.add_argument(
+        "--no-futility", action="store_true", help="disable futility pruning"
+    )
+    parser.add_argument(
+        "--no-reverse-futility",
+        action="store_true",
+        help="disable reverse futility pruning",
+    )
+    parser.add_argument(
+        "--no-see",
+        action="store_true",
+        help="order captures by MVV-LVA only and keep losing captures in quiescence",
+    )
+    args = parser.parse_args(argv)
+
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+
+    header = " ".join(f"{f'depth {d}':>8}" for d in range(1, args.depth + 1))
+    print(f"{'position':<20} {'move':<6} {'time':>8}  {header}  {'static':>8}")
+    run_benchmark(
+        args.depth,
+        {
+            "use_pvs": not args.no_pvs,
+            "use_aspiration": not args.no_aspiration,
+            "use_null_move": not args.no_null_move,
+            "null_move_verification_depth": args.null_move_verification_depth or None,
+            "use_lmr": not args.no_lmr,
+            "use_futility": not args.no_futility,
+            "use_reverse_futility": not args.no_reverse_futility,
+            "use_see": not args.no_see,
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
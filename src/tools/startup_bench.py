@@ -0,0 +1,73 @@
+"""
+Startup benchmark for the engine modules.
+
+Times a fresh interpreter importing the board and move generator, once
+with an empty magic table cache (the tables are built and the cache file
+written) and once with the cache in place.
+
+Usage:
+    python -m src.tools.startup_bench
+    python -m src.tools.startup_bench --runs 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.core.Board.magic import MAGIC_CACHE_DIR_ENV
+
+IMPORT_STATEMENT = "import src.core.Board.move_generator"
+
+
+def time_import(cache_dir):
+    """Run the import in a new interpreter and return its wall time in seconds"""
+    env = dict(os.environ, **{MAGIC_CACHE_DIR_ENV: cache_dir})
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-c", IMPORT_STATEMENT], env=env, check=True)
+    return time.perf_counter() - start_time
+
+
+def time_import_baseline():
+    """Wall time of a new interpreter that imports nothing"""
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(runs=5, out=sys.stdout):
+    """
+    Measure cold (no cache file) and warm (cached) startup.
+    Returns (best cold seconds, best warm seconds).
+    """
+    cold_times = []
+    warm_times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold_times.append(time_import(cache_dir))
+            warm_times.append(time_import(cache_dir))
+
+    baseline = time_import_baseline()
+    cold = min(cold_times)
+    warm = min(warm_times)
+    print(f"Interpreter only:     {baseline * 1000:7.0f} ms", file=out)
+    print(f"Import, no cache:     {cold * 1000:7.0f} ms", file=out)
+    print(f"Import, cached:       {warm * 1000:7.0f} ms", file=out)
+    return cold, warm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tools.startup_bench",
+        description="Import time with and without the magic table cache",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args(argv)
+    run_benchmark(args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,11 @@ import threading
 import time
 from src.core.Board.board import Board
 from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.game_result import IN_PROGRESS, CHECKMATE, DRAW_REASONS
 from src.core.Board.piece import NONE
 from src.agent.player import ChessAI
 from src.agent.basic_agent import BasicAI
+from src.agent.time_manager import GameClock
 from src.agent.skill_assessment import SkillAssessor
 from src.agent.skill_level import get_skill_level_description
 from src.ui.human_vs_human_gui import ChessGUI
@@ -28,6 +30,7 @@ class AgentvsAgentGUI(ChessGUI):
         self.game_speed = 1.0  # Seconds between moves
         self.thinking_thread = None
         self.pause_requested = False
+        self.game_clock = None  # GameClock of the running game, None for untimed games
 
         # Reorganize the main frame to include agent settings
         self.main_frame.pack_forget()
@@ -176,6 +179,40 @@ class AgentvsAgentGUI(ChessGUI):
         )
         speed_spinner.pack(side=tk.LEFT, padx=5)
 
+        # Game clock: Alpha-Beta agents allocate their thinking time from it
+        clock_frame = tk.Frame(self.agent_control_frame)
+        clock_frame.pack(anchor="w", fill=tk.X, pady=5)
+
+        tk.Label(clock_frame, text="Clock (minutes):", font=("Arial", 11)).pack(
+            side=tk.LEFT, padx=5
+        )
+        self.clock_minutes_var = tk.DoubleVar(value=0)  # 0 means no clock
+        clock_spinner = ttk.Spinbox(
+            clock_frame,
+            from_=0,
+            to=60,
+            increment=0.5,
+            textvariable=self.clock_minutes_var,
+            width=5,
+        )
+        clock_spinner.pack(side=tk.LEFT, padx=5)
+        tk.Label(clock_frame, text="Increment (s):", font=("Arial", 11)).pack(
+            side=tk.LEFT, padx=5
+        )
+        self.clock_increment_var = tk.DoubleVar(value=0)
+        increment_spinner = ttk.Spinbox(
+            clock_frame,
+            from_=0,
+            to=30,
+            increment=0.5,
+            textvariable=self.clock_increment_var,
+            width=5,
+        )
+        increment_spinner.pack(side=tk.LEFT, padx=5)
+        tk.Label(clock_frame, text="(0 = no clock)", font=("Arial", 9)).pack(
+            side=tk.LEFT, padx=5
+        )
+
         button_frame = tk.Frame(self.agent_control_frame)
         button_frame.pack(fill=tk.X, pady=10)
 
@@ -390,6 +427,16 @@ class AgentvsAgentGUI(ChessGUI):
         if self.board.ply_count > 0:
             self.reset_game(start_new=False)
 
+        clock_minutes = self.clock_minutes_var.get()
+        if clock_minutes > 0:
+            increment = self.clock_increment_var.get()
+            self.game_clock = GameClock(clock_minutes * 60, increment)
+            self.add_to_game_log(
+                f"Clock: {clock_minutes:g} min + {increment:g} s per move"
+            )
+        else:
+            self.game_clock = None
+
         # Update UI
         self.game_running = True
         self.pause_requested = False
@@ -427,6 +474,11 @@ class AgentvsAgentGUI(ChessGUI):
         self.board.load_start_position()
         self.move_generator = MoveGenerator(self.board)
 
+        # Agents kept from the previous game must not reuse its search tables
+        for agent in (self.white_agent, self.black_agent):
+            if agent is not None:
+                agent.new_game()
+
         # Reset UI
         self.start_button_var.set("Start")
         self.start_button.config(bg="#00FF00")  # Reset to green
@@ -514,6 +566,12 @@ class AgentvsAgentGUI(ChessGUI):
                 status_text = f"Agent {side_name} is thinking..."
                 self.master.after(0, lambda t=status_text: self.status_var.set(t))
 
+                # Give the agent its remaining time on the game clock
+                white = self.board.is_white_to_move
+                clock = self.game_clock
+                if clock and hasattr(current_agent, "set_clock"):
+                    current_agent.set_clock(clock.time_left(white), clock.increment)
+
                 # Get agent's move
                 start_time = time.time()
                 move = current_agent.choose_move(self.board)
@@ -523,6 +581,10 @@ class AgentvsAgentGUI(ChessGUI):
                 if not self.game_running:
                     break
 
+                if clock and not clock.record_move(white, elapsed):
+                    self.master.after(0, lambda s=side_name: self.game_over_time(s))
+                    break
+
                 # Check for game end
                 if move is None:
                     self.master.after(0, lambda s=side_name: self.game_over_no_moves(s))
@@ -533,6 +595,8 @@ class AgentvsAgentGUI(ChessGUI):
 
                 # Add thinking time to log
                 log_text = f"Agent {side_name} selected move {move_str} (thinking time: {elapsed:.2f}s)"
+                if clock:
+                    log_text += f", {clock.time_left(white):.1f}s left"
                 self.master.after(0, lambda t=log_text: self.add_to_game_log(t))
 
                 # Make a copy of the move for highlighting (to avoid lambda issues)
@@ -730,58 +794,28 @@ class AgentvsAgentGUI(ChessGUI):
 
     def check_for_game_end(self):
         """Check if the game has ended (checkmate, stalemate, etc.)"""
-        move_gen = MoveGenerator(self.board)
-        legal_moves = move_gen.generate_legal_moves()
+        result = self.board.game_result()
+        if result == IN_PROGRESS:
+            return False
 
         # Save the original state of game_running
         was_running = self.game_running
+        self.game_running = False
 
-        if not legal_moves:
-            if self.board.is_in_check():
-                winner = "White" if not self.board.is_white_to_move else "Black"
-                self.game_running = False
-                self.status_var.set(f"Checkmate! Agent {winner} wins.")
-                self.add_to_game_log(f"Checkmate! Agent {winner} wins the game.")
-                if was_running:
-                    messagebox.showinfo(
-                        "Game Over", f"Checkmate! Agent {winner} wins the game."
-                    )
-                    self.reset_game()
-            else:
-                self.game_running = False
-                self.status_var.set("Stalemate! The game is a draw.")
-                self.add_to_game_log("Stalemate! The game is a draw.")
-                if was_running:
-                    messagebox.showinfo("Game Over", "Stalemate! The game is a draw.")
-                    self.reset_game()
-            return True
-        elif self.board.fifty_move_counter >= 100:
-            self.game_running = False
-            self.status_var.set("Fifty-move rule! The game is a draw.")
-            self.add_to_game_log("Fifty-move rule! The game is a draw.")
-            if was_running:
-                messagebox.showinfo("Game Over", "Fifty-move rule! The game is a draw.")
-                self.reset_game()
-            return True
-
-        # Check for repetition
-        rep_count = 0
-        for zobrist in self.board.repetition_position_history:
-            if zobrist == self.board.current_game_state.zobrist_key:
-                rep_count += 1
-
-        if rep_count >= 50:
-            self.game_running = False
-            self.status_var.set("Position repeated 50 times! The game is a draw.")
-            self.add_to_game_log("Position repeated 50 times! The game is a draw.")
-            if was_running:
-                messagebox.showinfo(
-                    "Game Over", "Position repeated 50 times! The game is a draw."
-                )
-                self.reset_game()
-            return True
+        if result == CHECKMATE:
+            winner = "White" if not self.board.is_white_to_move else "Black"
+            self.status_var.set(f"Checkmate! Agent {winner} wins.")
+            self.add_to_game_log(f"Checkmate! Agent {winner} wins the game.")
+            message = f"Checkmate! Agent {winner} wins the game."
+        else:
+            message = f"{DRAW_REASONS[result].capitalize()}! The game is a draw."
+            self.status_var.set(message)
+            self.add_to_game_log(message)
 
-        return False
+        if was_running:
+            messagebox.showinfo("Game Over", message)
+            self.reset_game()
+        return True
 
     def game_over_no_moves(self, side):
         """Handle game over when a side has no legal moves"""
@@ -848,6 +882,16 @@ class AgentvsAgentGUI(ChessGUI):
         self.add_to_game_log("Game over due to move limit.")
         messagebox.showinfo("Game Over", "Game over due to move limit.")
 
+    def game_over_time(self, side):
+        """Handle game over because 'side' ran out of time"""
+        winner = "Black" if side == "White" else "White"
+        self.game_running = False
+        self.start_button_var.set("Start")
+        self.pause_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Game over - {side} lost on time.")
+        self.add_to_game_log(f"Game over - {side} ran out of time. {winner} wins!")
+        messagebox.showinfo("Game Over", f"{side} lost on time. {winner} wins!")
+
     def announce_checkmate(self, winner):
         """Display checkmate announcement"""
         self.start_button_var.set("Start")
@@ -4,7 +4,14 @@ import threading
 import time
 import datetime
 from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.game_result import (
+    IN_PROGRESS,
+    CHECKMATE,
+    STALEMATE,
+    DRAW_REASONS,
+)
 from src.agent.player import ChessAI
+from src.agent.time_manager import GameClock
 from src.ui.human_vs_human_gui import ChessGUI
 
 
@@ -24,6 +31,9 @@ class AIVisualizerGUI(ChessGUI):
         self.thinking_thread = None
         self.ai_move_queue = []
         self.ai_analysis_steps = []
+        # Clock of the game, created at the AI's first move when a clock is set.
+        # Only the AI's time is charged; the human plays untimed.
+        self.game_clock = None
 
         # Reorganize the main frame to include AI visualization
         self.main_frame.pack_forget()
@@ -114,6 +124,35 @@ class AIVisualizerGUI(ChessGUI):
             side=tk.LEFT, padx=5
         )
 
+        # AI game clock: replaces the time limit when set
+        clock_frame = tk.Frame(self.ai_control_frame)
+        clock_frame.pack(anchor="w", fill=tk.X, pady=5)
+
+        tk.Label(clock_frame, text="AI clock (minutes):", font=("Arial", 11)).pack(
+            side=tk.LEFT, padx=5
+        )
+        self.ai_clock_var = tk.DoubleVar(value=0)  # 0 means no clock
+        ttk.Spinbox(
+            clock_frame,
+            from_=0,
+            to=60,
+            increment=0.5,
+            textvariable=self.ai_clock_var,
+            width=5,
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Label(clock_frame, text="Increment (s):", font=("Arial", 11)).pack(
+            side=tk.LEFT, padx=5
+        )
+        self.ai_increment_var = tk.DoubleVar(value=0)
+        ttk.Spinbox(
+            clock_frame,
+            from_=0,
+            to=30,
+            increment=0.5,
+            textvariable=self.ai_increment_var,
+            width=5,
+        ).pack(side=tk.LEFT, padx=5)
+
         # Enable/Disable AI button
         button_frame = tk.Frame(self.ai_control_frame)
         button_frame.pack(anchor="w", fill=tk.X, pady=5)
@@ -413,13 +452,29 @@ class AIVisualizerGUI(ChessGUI):
             update_callback=self.update_thinking_visualization,
         )
 
+        # With a clock the AI allocates its time from what is left on it
+        clock_minutes = self.ai_clock_var.get()
+        if self.game_clock is None and clock_minutes > 0:
+            self.game_clock = GameClock(clock_minutes * 60, self.ai_increment_var.get())
+        clock = self.game_clock
+        white = self.board.is_white_to_move
+        if clock:
+            custom_ai.set_clock(clock.time_left(white), clock.increment)
+
         start_time = time.time()
 
         # Get AI's move
         move = custom_ai.choose_move(self.board)
 
-        # Ensure we display for at least a short time
         elapsed = time.time() - start_time
+        if clock:
+            if not clock.record_move(white, elapsed):
+                self.master.after(0, self.show_ai_lost_on_time)
+                return
+            left = clock.time_left(white)
+            self.master.after(0, lambda: self.add_to_thinking_log(f"AI clock: {left:.1f}s left"))
+
+        # Ensure we display for at least a short time
         if elapsed < 0.5:
             time.sleep(0.5 - elapsed)
 
@@ -507,17 +562,15 @@ class AIVisualizerGUI(ChessGUI):
 
     def check_for_game_end(self):
         """Check if the game has ended (checkmate, stalemate, etc.)"""
-        move_gen = MoveGenerator(self.board)
-        legal_moves = move_gen.generate_legal_moves()
-
-        if not legal_moves:
-            if self.board.is_in_check():
-                winner = "White" if not self.board.is_white_to_move else "Black"
-                self.show_winner(winner, "checkmate")
-            else:
-                self.show_stalemate()
-        elif self.board.fifty_move_counter >= 100:
-            self.show_draw("fifty-move rule")
+        result = self.board.game_result()
+
+        if result == CHECKMATE:
+            winner = "White" if not self.board.is_white_to_move else "Black"
+            self.show_winner(winner, "checkmate")
+        elif result == STALEMATE:
+            self.show_stalemate()
+        elif result != IN_PROGRESS:
+            self.show_draw(DRAW_REASONS[result])
         else:
             # Continue game - check if it's AI's turn again
             self.check_ai_turn()
@@ -528,6 +581,14 @@ class AIVisualizerGUI(ChessGUI):
         self.status_var.set(f"Game over - {winner} {reason}")
         self.add_to_thinking_log(f"Game over - {winner} {reason}")
 
+    def show_ai_lost_on_time(self):
+        """The AI ran out of time on its clock"""
+        self.ai_thinking = False
+        messagebox.showinfo("Game Over", "The AI ran out of time. You win!")
+        self.status_var.set("Game over - AI lost on time")
+        self.add_to_thinking_log("Game over - AI lost on time")
+        self.disable_board()
+
     def show_stalemate(self):
         """Show stalemate dialog"""
         messagebox.showinfo("Game Over", "Draw by stalemate!")
@@ -560,6 +621,12 @@ class AIVisualizerGUI(ChessGUI):
 
         return f"{from_name}->{to_name}"
 
+    def restart_game(self):
+        """Restart the game and clear the AI's search tables"""
+        super().restart_game()
+        self.ai.new_game()
+        self.game_clock = None
+
     def exit_to_main_menu(self):
         """Exit to main menu"""
         self.ai_enabled = False
@@ -578,129 +645,40 @@ class AIVisualizerGUI(ChessGUI):
 
 class VisualizationAlphaBetaAgent:
     """
-    Modified Alpha-Beta agent that provides visualization updates
+    Alpha-Beta agent that reports every completed iterative-deepening depth
+    to a visualization callback. The search itself is AlphaBetaAgent's
+    choose_move, with its time management and per-search setup.
     """
 
     def __init__(self, max_depth=4, time_limit=None, update_callback=None):
         from src.agent.alpha_beta import AlphaBetaAgent
 
-        self.agent = AlphaBetaAgent(max_depth=max_depth, time_limit=time_limit)
+        self.agent = AlphaBetaAgent(
+            max_depth=max_depth,
+            time_limit=time_limit,
+            progress_callback=self._on_iteration_completed,
+        )
         self.update_callback = update_callback
         self.nodes_evaluated = 0
         self.current_best_move = None
         self.current_score = 0
-        self.start_time = 0
+
+    def _on_iteration_completed(self, depth, move, score, nodes, elapsed):
+        """Record the result of a completed depth and pass it to the GUI"""
+        self.nodes_evaluated = nodes
+        self.current_best_move = move
+        self.current_score = score
+        if self.update_callback:
+            self.update_callback(self.agent.max_depth, depth, move, score, nodes, elapsed)
+
+    def set_clock(self, remaining, increment=0, moves_to_go=None):
+        """Allocate the time of the next move from the game clock (seconds)"""
+        self.agent.set_clock(remaining, increment, moves_to_go)
 
     def choose_move(self, board):
         """Choose the best move with visualization updates"""
-        self.start_time = time.time()
         self.nodes_evaluated = 0
-
-        # Override the alpha_beta method to include visualization
-        original_alpha_beta = self.agent._alpha_beta
-
-        def alpha_beta_with_visualization(board, depth, alpha, beta, color_factor):
-            """Wrapped alpha-beta method with visualization updates"""
-            result = original_alpha_beta(board, depth, alpha, beta, color_factor)
-            self.nodes_evaluated = self.agent.nodes_evaluated
-            return result
-
-        # Replace the method temporarily
-        self.agent._alpha_beta = alpha_beta_with_visualization
-
-        # Override the choose_move method to capture intermediate results
-        original_choose_move = self.agent.choose_move
-
-        def choose_move_with_visualization(board):
-            """Wrapped choose_move method with visualization updates"""
-            # Get all legal moves
-            from src.core.Board.move_generator import MoveGenerator
-
-            move_generator = MoveGenerator(board)
-            legal_moves = move_generator.generate_legal_moves()
-
-            if not legal_moves:
-                return None
-
-            import random
-
-            random.shuffle(legal_moves)
-
-            # Best move found and its score
-            best_move = None
-            best_score = -float("inf")
-
-            # Alpha-beta bounds
-            alpha = -float("inf")
-            beta = float("inf")
-
-            # Color factor (1 for white, -1 for black)
-            color_factor = 1 if board.is_white_to_move else -1
-
-            # Iterative deepening
-            for current_depth in range(1, self.agent.max_depth + 1):
-                # Search each move
-                for move in legal_moves:
-                    # Try to make the move - if it returns False, skip it
-                    move_result = board.make_move(move, in_search=True)
-                    if move_result is False:
-                        # This move was rejected (likely a king capture) - skip it
-                        continue
-
-                    # Search from this position
-                    score = -self.agent._alpha_beta(
-                        board, current_depth - 1, -beta, -alpha, -color_factor
-                    )
-
-                    board.unmake_move(move, in_search=True)
-
-                    # Update best move if found a better one
-                    if score > best_score:
-                        best_score = score
-                        best_move = move
-                        self.current_best_move = move
-                        self.current_score = score
-
-                        # Call the visualization callback
-                        if self.update_callback:
-                            elapsed = time.time() - self.start_time
-                            self.update_callback(
-                                self.agent.max_depth,
-                                current_depth,
-                                move,
-                                score,
-                                self.nodes_evaluated,
-                                elapsed,
-                            )
-
-                    # Update alpha
-                    alpha = max(alpha, score)
-
-                # Update visualization after each depth is completed
-                if self.update_callback:
-                    elapsed = time.time() - self.start_time
-                    self.update_callback(
-                        self.agent.max_depth,
-                        current_depth,
-                        best_move,
-                        best_score,
-                        self.nodes_evaluated,
-                        elapsed,
-                    )
-
-            return best_move
-
-        # Replace the method temporarily
-        self.agent.choose_move = choose_move_with_visualization
-
-        # Call the modified choose_move
-        result = self.agent.choose_move(board)
-
-        # Restore the original methods
-        self.agent._alpha_beta = original_alpha_beta
-        self.agent.choose_move = original_choose_move
-
-        return result
+        return self.agent.choose_move(board)
 
 
 def run_ai_visualizer():
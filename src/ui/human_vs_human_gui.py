@@ -533,9 +533,8 @@ class ChessGUI:
         
         # Check for checkmate or stalemate
         move_gen = MoveGenerator(self.board)
-        legal_moves = move_gen.generate_legal_moves()
-        
-        if not legal_moves:
+
+        if not move_gen.has_legal_move():
             if self.board.is_in_check():
                 # If no legal moves and in check, it's checkmate
                 winner = "White" if not self.board.is_white_to_move else "Black"
@@ -0,0 +1,62 @@
+import pytest
+
+from src.agent.alpha_beta import AlphaBetaAgent, NULL_WINDOW
+from src.core.Board.board import Board
+from src.tools.search_bench import BENCHMARK_POSITIONS
+
+
+def _record_node_types(agent):
+    """
+    Wrap agent._alpha_beta to record, for every node, whether it was
+    searched as a PV node and whether its parent was one
+    """
+    original_alpha_beta = agent._alpha_beta
+    parent_types = [True]
+    nodes = []
+
+    def recording_alpha_beta(board, depth, alpha, beta, color_factor, pv_node=True):
+        nodes.append((parent_types[-1], pv_node, alpha, beta))
+        parent_types.append(pv_node)
+        try:
+            return original_alpha_beta(board, depth, alpha, beta, color_factor, pv_node)
+        finally:
+            parent_types.pop()
+
+    agent._alpha_beta = recording_alpha_beta
+    return nodes
+
+
+@pytest.mark.parametrize("name", ["kiwipete", "position6", "italian"])
+def test_null_window_children_are_not_pv_nodes(name):
+    fen = dict(BENCHMARK_POSITIONS)[name]
+    agent = AlphaBetaAgent(max_depth=4, random_tie_break=False)
+    nodes = _record_node_types(agent)
+
+    agent.choose_move(Board.create_board(fen))
+
+    null_window_nodes = [node for node in nodes if not node[1]]
+    assert null_window_nodes
+    for parent_is_pv, is_pv, alpha, beta in nodes:
+        # Nothing below a null-window search is searched as a PV node
+        if not parent_is_pv:
+            assert not is_pv
+        # A search opened with a null window is never a PV node, even when
+        # float rounding makes the window look wider than NULL_WINDOW
+        if is_pv:
+            assert abs((beta - alpha) - NULL_WINDOW) > 1e-6
+
+
+def test_search_statistics_are_printed_only_when_verbose(capsys):
+    board = Board.create_board()
+    agent = AlphaBetaAgent(max_depth=2, random_tie_break=False)
+    agent.choose_move(board)
+    assert capsys.readouterr().out == ""
+    assert agent.stats["depth"] == 2
+    assert agent.stats["nodes_evaluated"] == agent.nodes_evaluated > 0
+    assert 0.0 <= agent.stats["tt_hit_rate"] <= 1.0
+
+    verbose_agent = AlphaBetaAgent(max_depth=2, random_tie_break=False, verbose=True)
+    verbose_agent.choose_move(board)
+    output = capsys.readouterr().out
+    assert "Depth 2 completed" in output
+    assert f"Nodes evaluated: {verbose_agent.nodes_evaluated}" in output
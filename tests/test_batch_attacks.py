@@ -0,0 +1,66 @@
+import numpy as np
+
+from src.core.Board import batch_attacks
+from src.core.Board.bitboard_utility import KNIGHT_ATTACKS
+from src.core.Board.board import Board
+from src.core.Board.magic import get_bishop_attacks, get_rook_attacks
+from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.piece import *
+from src.tools.eval_bench import benchmark_positions
+
+BOARDS = [Board.create_board(fen) for fen in benchmark_positions(count=150, seed=2024)]
+
+
+def _squares(bitboard):
+    while bitboard:
+        lsb = bitboard & -bitboard
+        bitboard ^= lsb
+        yield lsb.bit_length() - 1
+
+
+def _reference_mobility(board, colour):
+    pieces = board.piece_bitboards
+    occupied = board.all_pieces_bitboard
+    not_own = ~board.colour_bitboards[colour >> 3]
+    total = 0
+    for square in _squares(pieces[KNIGHT | colour]):
+        total += bin(KNIGHT_ATTACKS[square] & not_own).count("1")
+    for square in _squares(pieces[BISHOP | colour] | pieces[QUEEN | colour]):
+        total += bin(get_bishop_attacks(square, occupied) & not_own).count("1")
+    for square in _squares(pieces[ROOK | colour] | pieces[QUEEN | colour]):
+        total += bin(get_rook_attacks(square, occupied) & not_own).count("1")
+    return total
+
+
+def test_batch_from_boards_and_fens_agree():
+    fens = benchmark_positions(count=20, seed=2024)
+    np.testing.assert_array_equal(
+        batch_attacks.positions_to_bitboards(fens),
+        batch_attacks.positions_to_bitboards(BOARDS[:20]),
+    )
+
+
+def test_attack_maps_match_move_generator():
+    attacks = batch_attacks.attack_maps(batch_attacks.positions_to_bitboards(BOARDS))
+    for row, board in zip(attacks, BOARDS):
+        generator = MoveGenerator(board)
+        occupied = board.all_pieces_bitboard
+        assert int(row[0]) == generator._attack_map(WHITE, occupied)
+        assert int(row[1]) == generator._attack_map(BLACK, occupied)
+
+
+def test_in_check_matches_board():
+    checks = batch_attacks.in_check(batch_attacks.positions_to_bitboards(BOARDS))
+    assert checks.any()
+    for row, board in zip(checks, BOARDS):
+        white_king = board.piece_bitboards[KING | WHITE].bit_length() - 1
+        black_king = board.piece_bitboards[KING | BLACK].bit_length() - 1
+        assert bool(row[0]) == board.is_square_attacked(white_king, BLACK)
+        assert bool(row[1]) == board.is_square_attacked(black_king, WHITE)
+
+
+def test_mobility_matches_magic_lookups():
+    counts = batch_attacks.mobility(batch_attacks.positions_to_bitboards(BOARDS))
+    for row, board in zip(counts, BOARDS):
+        assert int(row[0]) == _reference_mobility(board, WHITE)
+        assert int(row[1]) == _reference_mobility(board, BLACK)
@@ -0,0 +1,112 @@
+import pytest
+
+from src.core.Board.bitboard_utility import BETWEEN, LINE
+from src.core.Board.board import Board
+from src.core.Board.piece import *
+from src.tools.eval_bench import benchmark_positions
+
+A1, H1, A8, H8 = 0, 7, 56, 63
+C3, E4, D5 = 18, 28, 35
+
+KNIGHT_DELTAS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+KING_DELTAS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+ORTHOGONAL_DELTAS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAGONAL_DELTAS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _bitboard(*squares):
+    bitboard = 0
+    for square in squares:
+        bitboard |= 1 << square
+    return bitboard
+
+
+def _on_board(file, rank):
+    return 0 <= file < 8 and 0 <= rank < 8
+
+
+def _brute_force_attacks(board, by_colour):
+    """Attack map of 'by_colour' built square by square from file/rank steps"""
+    attacked = 0
+    for square, piece in enumerate(board.square):
+        if piece == NONE or piece_colour(piece) != by_colour:
+            continue
+        file, rank = square % 8, square // 8
+        kind = piece_type(piece)
+
+        if kind == PAWN:
+            forward = 1 if by_colour == WHITE else -1
+            steps = [(-1, forward), (1, forward)]
+        elif kind == KNIGHT:
+            steps = KNIGHT_DELTAS
+        elif kind == KING:
+            steps = KING_DELTAS
+        else:
+            steps = ()
+        for file_step, rank_step in steps:
+            if _on_board(file + file_step, rank + rank_step):
+                attacked |= 1 << ((rank + rank_step) * 8 + file + file_step)
+
+        slides = ()
+        if kind in (ROOK, QUEEN):
+            slides += ORTHOGONAL_DELTAS
+        if kind in (BISHOP, QUEEN):
+            slides += DIAGONAL_DELTAS
+        for file_step, rank_step in slides:
+            target_file, target_rank = file + file_step, rank + rank_step
+            while _on_board(target_file, target_rank):
+                target = target_rank * 8 + target_file
+                attacked |= 1 << target
+                if board.square[target] != NONE:
+                    break
+                target_file += file_step
+                target_rank += rank_step
+    return attacked
+
+
+def test_between_long_diagonal():
+    assert BETWEEN[A1][H8] == _bitboard(9, 18, 27, 36, 45, 54)
+    assert BETWEEN[H8][A1] == BETWEEN[A1][H8]
+
+
+def test_between_rank_file_and_adjacent_squares():
+    assert BETWEEN[A1][H1] == _bitboard(1, 2, 3, 4, 5, 6)
+    assert BETWEEN[A1][A8] == _bitboard(8, 16, 24, 32, 40, 48)
+    assert BETWEEN[E4][E4 + 1] == 0
+    assert BETWEEN[E4][D5] == 0
+
+
+def test_unaligned_squares_have_no_line():
+    # c3 and e4 are a knight's move apart
+    assert BETWEEN[C3][E4] == 0
+    assert LINE[C3][E4] == 0
+    assert LINE[A1][A1] == 0
+
+
+def test_line_contains_both_squares_and_is_symmetric():
+    for a in range(64):
+        for b in range(64):
+            assert LINE[a][b] == LINE[b][a]
+            assert BETWEEN[a][b] == BETWEEN[b][a]
+            if LINE[a][b]:
+                assert LINE[a][b] & _bitboard(a, b) == _bitboard(a, b)
+                # The squares between lie on the line, not on the end points
+                assert BETWEEN[a][b] & ~LINE[a][b] == 0
+                assert BETWEEN[a][b] & _bitboard(a, b) == 0
+            else:
+                assert BETWEEN[a][b] == 0
+
+
+def test_line_of_long_diagonal_and_rank():
+    assert LINE[C3][E4 + 1] == 0
+    assert LINE[A1][H8] == _bitboard(0, 9, 18, 27, 36, 45, 54, 63)
+    assert LINE[C3][C3 + 3] == _bitboard(*range(16, 24))
+
+
+@pytest.mark.parametrize("fen", benchmark_positions(count=60))
+def test_is_square_attacked_matches_brute_force(fen):
+    board = Board.create_board(fen)
+    for by_colour in (WHITE, BLACK):
+        attacked = _brute_force_attacks(board, by_colour)
+        for square in range(64):
+            assert board.is_square_attacked(square, by_colour) == bool(attacked >> square & 1)
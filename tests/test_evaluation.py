@@ -0,0 +1,25 @@
+from src.agent.evaluation import evaluate_board
+from src.agent.pawn_hash_table import PawnHashTable
+from src.core.Board.board import Board
+from src.tools.eval_bench import benchmark_positions
+
+
+def test_pawn_hash_table_does_not_change_the_score():
+    pawn_hash_table = PawnHashTable()
+    for fen in benchmark_positions(count=40):
+        board = Board.create_board(fen)
+        uncached = evaluate_board(board)
+        assert evaluate_board(board, pawn_hash_table) == uncached
+        # Second lookup is served from the table
+        assert evaluate_board(board, pawn_hash_table) == uncached
+    assert pawn_hash_table.hits > 0
+
+
+def test_evaluation_without_a_table_keeps_no_cache():
+    pawn_hash_table = PawnHashTable()
+    board = Board.create_board()
+    evaluate_board(board, pawn_hash_table)
+    evaluate_board(board)
+    evaluate_board(board)
+    # Only the caller's table is touched, and only by its own calls
+    assert pawn_hash_table.probes == 1
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from src.core.Board.board import Board
+from src.core.Board.game_result import (
+    CHECKMATE,
+    FIFTY_MOVE_RULE,
+    IN_PROGRESS,
+    INSUFFICIENT_MATERIAL,
+    STALEMATE,
+    THREEFOLD_REPETITION,
+    is_draw,
+)
+from src.core.Board.move import START_SQUARE_MASK, TARGET_SQUARE_SHIFT
+from src.core.Board.move_generator import MoveGenerator
+from src.core.helper.board_helper import square_index_from_name
+
+
+def _play(board, *names):
+    """Make the legal moves given by start and target square names ("g1f3")"""
+    for name in names:
+        start_square = square_index_from_name(name[:2])
+        target_square = square_index_from_name(name[2:4])
+        move = next(
+            move
+            for move in MoveGenerator(board).generate_moves()
+            if move & START_SQUARE_MASK == start_square
+            and (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK == target_square
+        )
+        board.make_move(move)
+
+
+def test_start_position_is_in_progress():
+    assert Board.create_board().game_result() == IN_PROGRESS
+
+
+def test_checkmate():
+    board = Board.create_board()
+    _play(board, "f2f3", "e7e5", "g2g4", "d8h4")
+    assert board.game_result() == CHECKMATE
+    assert not is_draw(CHECKMATE)
+
+
+def test_stalemate():
+    board = Board.create_board("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    assert board.game_result() == STALEMATE
+
+
+def test_fifty_move_rule():
+    board = Board.create_board("4k3/8/8/8/8/8/3R4/4K3 w - - 99 80")
+    assert board.game_result() == IN_PROGRESS
+    _play(board, "d2d3")
+    assert board.game_result() == FIFTY_MOVE_RULE
+
+
+def test_checkmate_takes_precedence_over_fifty_move_rule():
+    board = Board.create_board("7k/6Q1/6K1/8/8/8/8/8 b - - 100 80")
+    assert board.game_result() == CHECKMATE
+
+
+def test_threefold_repetition():
+    board = Board.create_board()
+    knight_dance = ("g1f3", "g8f6", "f3g1", "f6g8")
+    _play(board, *knight_dance)
+    assert board.game_result() == IN_PROGRESS
+    _play(board, *knight_dance)
+    assert board.game_result() == THREEFOLD_REPETITION
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/4k3/8/8/3K4/8/8 w - - 0 1",
+        "8/8/4k3/8/8/3K4/5N2/8 w - - 0 1",
+        "8/8/4k3/8/8/3KB3/8/8 b - - 0 1",
+        # Bishops of both sides on dark squares (e7 and e3)
+        "8/4b3/4k3/8/8/3KB3/8/8 w - - 0 1",
+    ],
+)
+def test_insufficient_material(fen):
+    assert Board.create_board(fen).game_result() == INSUFFICIENT_MATERIAL
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/4k3/8/8/3K4/4P3/8 w - - 0 1",
+        # Bishops on squares of both colours (d7 and e3)
+        "8/3b4/4k3/8/8/3KB3/8/8 w - - 0 1",
+        "8/8/4k3/8/8/3KN3/5N2/8 w - - 0 1",
+    ],
+)
+def test_sufficient_material(fen):
+    assert Board.create_board(fen).game_result() == IN_PROGRESS
+
+
+def test_has_legal_move_matches_generated_moves_in_random_playouts():
+    rng = random.Random(7)
+    terminal_positions = 0
+    for _ in range(30):
+        board = Board.create_board()
+        for _ in range(200):
+            generator = MoveGenerator(board)
+            moves = generator.generate_legal_moves()
+            assert generator.has_legal_move() == bool(moves)
+            if not moves:
+                terminal_positions += 1
+                assert board.game_result() in (CHECKMATE, STALEMATE)
+                break
+            board.make_move(rng.choice(moves), in_search=True)
+    assert terminal_positions > 0
@@ -0,0 +1,54 @@
+from src.core.Board import magic
+
+
+def test_attack_table_cache_round_trip(tmp_path):
+    path = str(tmp_path / "attacks.bin")
+    table_size = len(magic.ATTACK_TABLE)
+    magic.save_attack_table(path, magic.ATTACK_TABLE)
+
+    loaded = magic.load_attack_table(path, table_size)
+    assert loaded == magic.ATTACK_TABLE
+    assert all(type(value) is int for value in loaded[:64])
+
+
+def test_invalid_attack_table_cache_is_ignored(tmp_path):
+    path = tmp_path / "attacks.bin"
+    table_size = len(magic.ATTACK_TABLE)
+    assert magic.load_attack_table(str(path), table_size) is None
+
+    path.write_bytes(b"\0" * (table_size * 8 - 1))
+    assert magic.load_attack_table(str(path), table_size) is None
+
+
+def _assert_no_destructive_collisions(masks, magics, index_bits, compute_attacks):
+    for square in range(64):
+        shift = 64 - index_bits[square]
+        seen = {}
+        for blockers in magic.generate_blockers(masks[square]):
+            index = magic.magic_index(blockers, magics[square], shift)
+            attacks = compute_attacks(square, blockers)
+            # Two blocker sets may share an index only if they have the same attacks
+            assert seen.setdefault(index, attacks) == attacks, f"square {square}"
+
+
+def test_rook_magics_map_every_blocker_set():
+    _assert_no_destructive_collisions(
+        magic.ROOK_MASKS, magic.ROOK_MAGICS, magic.ROOK_INDEX_BITS, magic.compute_rook_attacks
+    )
+
+
+def test_bishop_magics_map_every_blocker_set():
+    _assert_no_destructive_collisions(
+        magic.BISHOP_MASKS,
+        magic.BISHOP_MAGICS,
+        magic.BISHOP_INDEX_BITS,
+        magic.compute_bishop_attacks,
+    )
+
+
+def test_lookups_match_ray_walks():
+    for square in range(64):
+        for blockers in magic.generate_blockers(magic.ROOK_MASKS[square])[::37]:
+            assert magic.get_rook_attacks(square, blockers) == magic.compute_rook_attacks(square, blockers)
+        for blockers in magic.generate_blockers(magic.BISHOP_MASKS[square])[::7]:
+            assert magic.get_bishop_attacks(square, blockers) == magic.compute_bishop_attacks(square, blockers)
@@ -0,0 +1,58 @@
+import pytest
+
+from src.core.Board.board import Board
+from src.core.Board.move_generator import MoveGenerator
+from src.tools.perft import REFERENCE_POSITIONS
+
+
+def _positions_and_children(fen):
+    """The position and every position one legal move away from it"""
+    board = Board.create_board(fen)
+    boards = [board]
+    for move in MoveGenerator(board).generate_moves():
+        child = Board.create_board(fen)
+        child.make_move(move, in_search=True)
+        boards.append(child)
+    return boards
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_captures_and_quiets_split_the_legal_moves(position):
+    for board in _positions_and_children(position.fen):
+        generator = MoveGenerator(board)
+        legal = list(generator.generate_moves())
+        captures = list(generator.generate_moves(captures_only=True))
+        quiets = list(generator.generate_moves(quiets_only=True))
+
+        assert len(set(legal)) == len(legal)
+        assert not set(captures) & set(quiets)
+        assert sorted(captures + quiets) == sorted(legal)
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_pseudo_legal_split_covers_the_pseudo_legal_moves(position):
+    for board in _positions_and_children(position.fen):
+        generator = MoveGenerator(board)
+        pseudo_legal = list(generator.generate_moves(pseudo_legal=True))
+        captures = list(generator.generate_moves(captures_only=True, pseudo_legal=True))
+        quiets = list(generator.generate_moves(quiets_only=True, pseudo_legal=True))
+
+        assert sorted(captures + quiets) == sorted(pseudo_legal)
+        assert set(generator.generate_moves()) <= set(pseudo_legal)
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_is_legal_move_agrees_with_the_generator(position):
+    boards = _positions_and_children(position.fen)
+    # Moves of neighbouring positions stand in for TT and killer moves that
+    # belong to another position
+    foreign_moves = set()
+    for board in boards[:8]:
+        foreign_moves.update(MoveGenerator(board).generate_moves(pseudo_legal=True))
+
+    for board in boards:
+        generator = MoveGenerator(board)
+        legal = set(generator.generate_moves())
+        candidates = set(generator.generate_moves(pseudo_legal=True)) | foreign_moves
+        for move in candidates:
+            assert generator.is_legal_move(move) == (move in legal), move
@@ -0,0 +1,54 @@
+from array import array
+
+import pytest
+
+from src.agent.move_ordering import MoveOrderer
+from src.core.Board.board import Board
+from src.core.Board.move import NULL_MOVE_VALUE
+from src.core.Board.move_generator import MoveGenerator
+from src.tools.perft import REFERENCE_POSITIONS
+
+
+def _staged(board, orderer, tt_move=NULL_MOVE_VALUE, pseudo_legal=False):
+    """Moves yielded by staged_moves, keeping only legal ones"""
+    moves = []
+    for move in orderer.staged_moves(
+        board, MoveGenerator(board), array("H"), tt_move, ply=0, pseudo_legal=pseudo_legal
+    ):
+        board.make_move(move, in_search=True)
+        illegal = board.is_mover_in_check()
+        board.unmake_move(move, in_search=True)
+        if not illegal:
+            moves.append(move)
+        else:
+            assert pseudo_legal
+    return moves
+
+
+@pytest.mark.parametrize("pseudo_legal", [False, True])
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_staged_moves_yield_every_legal_move_once(position, pseudo_legal):
+    board = Board.create_board(position.fen)
+    generator = MoveGenerator(board)
+    legal = list(generator.generate_moves())
+    quiets = list(generator.generate_moves(quiets_only=True))
+
+    orderer = MoveOrderer()
+    # Killers: a quiet move of this position and one that is not legal here
+    if quiets:
+        orderer.record_cutoff(board, quiets[-1], depth=3, ply=0)
+    orderer.killers[0][1] = 12 | 63 << 6
+
+    for tt_move in (NULL_MOVE_VALUE, legal[-1], legal[0]):
+        moves = _staged(board, orderer, tt_move, pseudo_legal)
+        assert sorted(moves) == sorted(legal)
+        if tt_move != NULL_MOVE_VALUE:
+            assert moves[0] == tt_move
+
+
+def test_illegal_tt_move_is_skipped():
+    board = Board.create_board(REFERENCE_POSITIONS[0].fen)
+    legal = list(MoveGenerator(board).generate_moves())
+    # e2e5 is not a move in the start position
+    moves = _staged(board, MoveOrderer(), 12 | 36 << 6)
+    assert sorted(moves) == sorted(legal)
@@ -0,0 +1,40 @@
+import pytest
+
+from src.core.Board.board import Board
+from src.core.Board.move_generator import MoveGenerator
+from src.tools.perft import REFERENCE_POSITIONS, perft
+
+
+def _debug_board(fen):
+    board = Board.create_board(fen)
+    board.debug_zobrist = True
+    board.debug_psqt = True
+    return board
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_perft_with_incremental_state_checks(position):
+    # Every make/unmake verifies the Zobrist and pawn keys, the piece-square
+    # scores, the game phase and the piece count against a recomputation
+    board = _debug_board(position.fen)
+    assert perft(board, 3) == position.expected_nodes(3)
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS[:2], ids=lambda position: position.name)
+def test_pseudo_legal_perft_with_incremental_state_checks(position):
+    board = _debug_board(position.fen)
+    assert perft(board, 2, pseudo_legal=True) == position.expected_nodes(2)
+
+
+def test_corrupted_incremental_state_is_detected():
+    board = _debug_board(REFERENCE_POSITIONS[1].fen)
+    move = MoveGenerator(board).generate_moves()[0]
+
+    board.zobrist_key ^= 1
+    with pytest.raises(AssertionError, match="Zobrist key mismatch"):
+        board.make_move(move, in_search=True)
+
+    board = _debug_board(REFERENCE_POSITIONS[1].fen)
+    board.psqt_middle_game[0] += 1
+    with pytest.raises(AssertionError, match="Piece-square score mismatch"):
+        board.make_move(move, in_search=True)
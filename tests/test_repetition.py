@@ -0,0 +1,140 @@
+import random
+
+from src.agent.alpha_beta import AlphaBetaAgent
+from src.core.Board.board import Board
+from src.core.Board.move import START_SQUARE_MASK, TARGET_SQUARE_SHIFT
+from src.core.Board.move_generator import MoveGenerator
+from src.core.helper.board_helper import square_index_from_name
+
+# White is a queen up; the knight and the black king can shuffle
+SHUFFLE_FEN = "4k3/8/8/8/8/8/8/QN2K3 w - - 0 1"
+KNIGHT_DANCE = ("b1c3", "e8d8", "c3b1", "d8e8")
+INFINITY = float("inf")
+
+
+def _play(board, *names, in_search=False):
+    """Make the legal moves given by start and target square names ("b1c3")"""
+    for name in names:
+        start_square = square_index_from_name(name[:2])
+        target_square = square_index_from_name(name[2:4])
+        move = next(
+            move
+            for move in MoveGenerator(board).generate_moves()
+            if move & START_SQUARE_MASK == start_square
+            and (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK == target_square
+        )
+        board.make_move(move, in_search=in_search)
+
+
+def _agent_at_root(board):
+    """An agent set up as choose_move sets it up before searching 'board'"""
+    agent = AlphaBetaAgent(max_depth=1, random_tie_break=False)
+    agent.root_ply = board.ply_count
+    agent.game_repetition_counts = dict(board.repetition_counts)
+    return agent
+
+
+def _snapshot(board):
+    return (
+        board.zobrist_key,
+        dict(board.repetition_counts),
+        [dict(counts) for counts in board.repetition_counts_stack],
+    )
+
+
+def test_make_and_unmake_keep_repetition_counts_symmetric():
+    rng = random.Random(3)
+    board = Board.create_board()
+    for _ in range(20):
+        before = _snapshot(board)
+        made = []
+        for _ in range(rng.randint(1, 12)):
+            moves = MoveGenerator(board).generate_moves()
+            if not moves:
+                break
+            if rng.random() < 0.15 and not board.is_in_check():
+                board.make_null_move()
+                made.append(None)
+            else:
+                move = rng.choice(moves)
+                board.make_move(move, in_search=True)
+                made.append(move)
+        for move in reversed(made):
+            if move is None:
+                board.unmake_null_move()
+            else:
+                board.unmake_move(move, in_search=True)
+        assert _snapshot(board) == before
+
+        # Advance the game by one move
+        moves = MoveGenerator(board).generate_moves()
+        if not moves:
+            break
+        board.make_move(rng.choice(moves))
+
+
+def test_irreversible_move_starts_a_new_span():
+    board = Board.create_board()
+    _play(board, "g1f3", "g8f6", "f3g1", "f6g8")
+    assert board.repetition_count() == 2
+    _play(board, "e2e4")
+    assert board.repetition_counts == {board.zobrist_key: 1}
+
+    board.unmake_move(board.all_game_moves[-1])
+    assert board.repetition_count() == 2
+
+
+def test_positions_before_a_null_move_do_not_repeat_across_it():
+    board = Board.create_board(SHUFFLE_FEN)
+    board.make_null_move()
+    # Black triangulates, so the start position returns with white to move
+    _play(board, "e8d8", "b1c3", "d8d7", "c3b1", "d7e8", in_search=True)
+    assert board.repetition_count() == 1
+
+
+def test_twofold_repetition_in_the_game_is_not_a_draw():
+    board = Board.create_board(SHUFFLE_FEN)
+    _play(board, *KNIGHT_DANCE)
+    assert board.repetition_count() == 2
+
+    agent = _agent_at_root(board)
+    assert agent._alpha_beta(board, 1, -INFINITY, INFINITY, 1) > 0
+
+
+def test_threefold_repetition_in_the_game_is_a_draw():
+    board = Board.create_board(SHUFFLE_FEN)
+    _play(board, *KNIGHT_DANCE, *KNIGHT_DANCE)
+    assert board.repetition_count() == 3
+
+    agent = _agent_at_root(board)
+    assert agent._alpha_beta(board, 1, -INFINITY, INFINITY, 1) == 0
+
+
+def test_repetition_on_the_search_path_is_a_draw():
+    board = Board.create_board(SHUFFLE_FEN)
+    agent = _agent_at_root(board)
+
+    # Back at the root position: repeating the root alone is not a draw
+    _play(board, *KNIGHT_DANCE, in_search=True)
+    assert agent._alpha_beta(board, 1, -INFINITY, INFINITY, 1) > 0
+
+    # The position after b1c3 now occurs twice after the root
+    _play(board, "b1c3", in_search=True)
+    assert agent._alpha_beta(board, 1, -INFINITY, INFINITY, -1) == 0
+
+
+def test_scores_depending_on_a_repetition_are_not_stored():
+    board = Board.create_board(SHUFFLE_FEN)
+    agent = _agent_at_root(board)
+    _play(board, *KNIGHT_DANCE, in_search=True)
+
+    # One of the moves here (b1c3) repeats a position of the search path
+    agent._alpha_beta(board, 1, -INFINITY, INFINITY, 1)
+    assert agent.repetition_draws > 0
+    assert agent.transposition_table.probe(board.zobrist_key) is None
+
+    # Without the repetition on the path the same position is stored
+    fresh_agent = _agent_at_root(board)
+    fresh_agent._alpha_beta(board, 1, -INFINITY, INFINITY, 1)
+    assert fresh_agent.repetition_draws == 0
+    assert fresh_agent.transposition_table.probe(board.zobrist_key) is not None
@@ -0,0 +1,115 @@
+import pytest
+
+from src.agent.move_ordering import MoveOrderer
+from src.agent.see import see
+from src.core.Board.board import Board
+from src.core.Board.move import FLAG_SHIFT, START_SQUARE_MASK, TARGET_SQUARE_SHIFT, Move
+from src.core.Board.move_generator import MoveGenerator
+from src.core.Board.piece import BISHOP, KNIGHT, PAWN, QUEEN, ROOK, piece_type
+from src.core.Board.piece_square_tables import PIECE_VALUES
+from src.core.helper.board_helper import square_index_from_name
+from src.tools.perft import REFERENCE_POSITIONS
+
+P, N, B, R, Q = (PIECE_VALUES[kind] for kind in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN))
+
+
+def _find_move(board, name, flag=None):
+    """The legal move given by start and target square names ("d2d5")"""
+    start_square = square_index_from_name(name[:2])
+    target_square = square_index_from_name(name[2:4])
+    for move in MoveGenerator(board).generate_moves():
+        if (
+            move & START_SQUARE_MASK == start_square
+            and (move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK == target_square
+            and (flag is None or move >> FLAG_SHIFT == flag)
+        ):
+            return move
+    raise AssertionError(f"{name} is not a legal move")
+
+
+def _see(fen, name, flag=None):
+    board = Board.create_board(fen)
+    return see(board, _find_move(board, name, flag))
+
+
+def test_undefended_capture_wins_the_piece():
+    assert _see("4k3/8/8/3n4/4P3/8/8/4K3 w - - 0 1", "e4d5") == N
+
+
+def test_defended_pawn_taken_by_rook_loses_material():
+    assert _see("4k3/2p5/3p4/8/8/8/8/3RK3 w - - 0 1", "d1d6") == P - R
+
+
+def test_rook_behind_rook_joins_the_exchange():
+    # Rd2xd5 Rxd5 Rd1xd5: the rook on d1 is only an attacker once d2 is empty
+    fen = "3r2k1/8/8/3p4/8/8/3R4/3RK3 w - - 0 1"
+    assert _see(fen, "d2d5") == P
+    # Without the rook behind the capture loses the exchange
+    assert _see("3r2k1/8/8/3p4/8/8/3R4/4K3 w - - 0 1", "d2d5") == P - R
+
+
+def test_queen_behind_bishop_joins_the_exchange():
+    # Bxe5 dxe5 Qxe5
+    assert _see("4k3/8/3p4/4n3/8/8/1B6/Q3K3 w - - 0 1", "b2e5") == N - B + P
+    assert _see("4k3/8/3p4/4n3/8/8/1B6/4K3 w - - 0 1", "b2e5") == N - B
+
+
+def test_king_does_not_recapture_on_a_defended_square():
+    # Kxd5 would walk into the pawn on e4
+    assert _see("8/8/3k4/3p4/4P3/8/8/3RK3 w - - 0 1", "d1d5") == P
+
+
+def test_king_recaptures_on_an_undefended_square():
+    assert _see("8/8/3k4/3p4/8/8/8/3RK3 w - - 0 1", "d1d5") == P - R
+
+
+def test_en_passant_capture():
+    assert _see("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2", "e5d6") == P
+    # Recaptured by the c7 pawn
+    assert _see("4k3/2p5/8/3pP3/8/8/8/4K3 w - d6 0 2", "e5d6") == 0
+
+
+def test_en_passant_capture_uncovers_the_file():
+    # exd6 empties d5, so the rook on d1 defends d6 against Rxd6
+    assert _see("3rk3/8/8/3pP3/8/8/8/3RK3 w - d6 0 2", "e5d6") == P
+
+
+def test_promotion_capture():
+    fen = "r3k3/1P6/8/8/8/8/8/4K3 w - - 0 1"
+    assert _see(fen, "b7a8", Move.PROMOTE_TO_QUEEN_FLAG) == R + Q - P
+    assert _see(fen, "b7a8", Move.PROMOTE_TO_KNIGHT_FLAG) == R + N - P
+
+
+def test_defended_promotion_capture():
+    # The knight on c7 takes the new queen
+    fen = "r3k3/1Pn5/8/8/8/8/8/4K3 w - - 0 1"
+    assert _see(fen, "b7a8", Move.PROMOTE_TO_QUEEN_FLAG) == R - P
+
+
+def test_order_captures_splits_off_losing_captures():
+    # Qxd5 loses the queen to the c6 pawn; exd5 wins a knight for a pawn
+    board = Board.create_board("4k3/8/2p5/3n4/4P3/8/8/3QK3 w - - 0 1")
+    captures = MoveGenerator(board).generate_moves(captures_only=True)
+    good, losing = MoveOrderer().order_captures(board, captures)
+    assert good == [_find_move(board, "e4d5")]
+    assert losing == [_find_move(board, "d1d5")]
+
+    # Without SEE nothing is split off
+    good, losing = MoveOrderer(use_see=False).order_captures(board, captures)
+    assert sorted(good) == sorted(captures)
+    assert losing == []
+
+
+@pytest.mark.parametrize("position", REFERENCE_POSITIONS, ids=lambda position: position.name)
+def test_losing_captures_are_exactly_those_with_negative_see(position):
+    board = Board.create_board(position.fen)
+    captures = MoveGenerator(board).generate_moves(captures_only=True)
+    good, losing = MoveOrderer().order_captures(board, captures)
+    assert sorted(good + losing) == sorted(captures)
+    for move in good:
+        attacker = piece_type(board.square[move & START_SQUARE_MASK])
+        victim = board.square[(move >> TARGET_SQUARE_SHIFT) & START_SQUARE_MASK]
+        victim_value = PIECE_VALUES[piece_type(victim)] if victim else P
+        assert PIECE_VALUES[attacker] <= victim_value or see(board, move) >= 0
+    for move in losing:
+        assert see(board, move) < 0
@@ -0,0 +1,146 @@
+import pytest
+
+from src.agent import time_manager
+from src.agent.alpha_beta import AlphaBetaAgent
+from src.agent.time_manager import GameClock, TimeManager
+from src.core.Board.board import Board
+from src.tools.search_bench import BENCHMARK_POSITIONS
+
+CHECK_INTERVAL = 16
+
+
+class FakeClock:
+    """Stands in for the time module; time only moves when a test moves it"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time_manager, "time", fake_clock)
+    return fake_clock
+
+
+def _agent(max_depth, time_limit=None, **options):
+    agent = AlphaBetaAgent(
+        max_depth=max_depth, time_limit=time_limit, random_tie_break=False, **options
+    )
+    agent.time_manager.check_interval = CHECK_INTERVAL
+    return agent
+
+
+def _kiwipete():
+    return Board.create_board(dict(BENCHMARK_POSITIONS)["kiwipete"])
+
+
+def test_hard_limit_stops_at_the_first_poll_after_the_deadline(clock):
+    manager = TimeManager(check_interval=CHECK_INTERVAL)
+    manager.set_move_time(1.0)
+    manager.start()
+
+    for _ in range(CHECK_INTERVAL + 3):
+        assert not manager.tick()
+    clock.now = 1.5
+    # The clock is not read again until the next poll
+    for _ in range(CHECK_INTERVAL - 4):
+        assert not manager.tick()
+    assert manager.tick()
+    assert manager.stopped
+
+
+def test_search_aborts_at_the_first_poll_after_the_deadline(clock):
+    agent = _agent(max_depth=8, time_limit=1.0)
+    manager = agent.time_manager
+    original_tick = manager.tick
+    deadline_tick = 50 * CHECK_INTERVAL + 5
+    ticks = []
+
+    def tick():
+        ticks.append(len(ticks) + 1)
+        if len(ticks) == deadline_tick:
+            clock.now = 2.0
+        stopped = original_tick()
+        if len(ticks) < deadline_tick + CHECK_INTERVAL - 5:
+            assert not stopped
+        else:
+            # Stopped at the first poll, and every node after it returns at once
+            assert stopped
+        return stopped
+
+    iterations = []
+    manager.tick = tick
+    agent.progress_callback = lambda depth, move, *_: iterations.append((depth, move))
+
+    move = agent.choose_move(_kiwipete())
+    assert manager.stopped
+    assert len(ticks) >= deadline_tick + CHECK_INTERVAL - 5
+    # The aborted iteration is discarded
+    assert iterations and iterations[-1][0] < 8
+    assert move == iterations[-1][1]
+
+
+def test_soft_limit_stops_before_the_next_iteration(clock):
+    agent = _agent(max_depth=6, time_limit=10.0)
+    searched_depths = []
+    original_search_root = agent._search_root
+
+    def search_root(board, moves, depth, *args):
+        searched_depths.append(depth)
+        return original_search_root(board, moves, depth, *args)
+
+    def on_iteration(depth, *_):
+        # Past the soft limit (half the move time, scaled by at most 1.25)
+        # but well before the hard limit
+        if depth == 2:
+            clock.now = 9.0
+
+    agent._search_root = search_root
+    agent.progress_callback = on_iteration
+
+    agent.choose_move(_kiwipete())
+    assert not agent.time_manager.stopped
+    assert agent.stats["depth"] == 2
+    assert max(searched_depths) == 2
+
+
+def test_no_time_limit_searches_every_depth(clock):
+    agent = _agent(max_depth=3)
+    original_tick = agent.time_manager.tick
+
+    def tick():
+        # However long the search takes, it is never stopped
+        clock.now += 100.0
+        return original_tick()
+
+    agent.time_manager.tick = tick
+    agent.choose_move(_kiwipete())
+    assert agent.time_manager.hard_limit is None
+    assert not agent.time_manager.stopped
+    assert agent.stats["depth"] == 3
+
+
+def test_clock_budgets_stay_within_the_remaining_time(clock):
+    manager = TimeManager()
+    manager.set_clock(60.0, increment=1.0)
+    manager.start()
+    assert 0 < manager.soft_limit < manager.hard_limit <= 60.0 * time_manager.MAX_REMAINING_SHARE
+
+    manager.set_clock(0.5)
+    manager.start()
+    assert manager.hard_limit <= 0.5
+
+
+def test_game_clock_charges_moves_and_adds_the_increment():
+    game_clock = GameClock(10.0, increment=2.0)
+    assert game_clock.record_move(True, 3.0)
+    assert game_clock.time_left(True) == 9.0
+    assert game_clock.time_left(False) == 10.0
+
+    # Running out during a move loses, without the increment
+    assert not game_clock.record_move(False, 10.5)
+    assert game_clock.time_left(False) == 0
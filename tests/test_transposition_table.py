@@ -0,0 +1,108 @@
+import pytest
+
+from src.agent.alpha_beta import AlphaBetaAgent, MATE_SCORE, MATE_THRESHOLD
+from src.agent.transposition_table import TranspositionTable
+
+EXACT = TranspositionTable.EXACT
+LOWER_BOUND = TranspositionTable.LOWER_BOUND
+UPPER_BOUND = TranspositionTable.UPPER_BOUND
+
+KEY = 0x123456789ABCDEF0
+
+
+@pytest.fixture
+def table():
+    return TranspositionTable(size_mb=0.01)
+
+
+def test_probe_returns_what_was_stored(table):
+    assert table.probe(KEY) is None
+    table.store(KEY, 4, LOWER_BOUND, 12.5, 0x1234)
+    assert table.probe(KEY) == (4, LOWER_BOUND, 12.5, 0x1234)
+    assert table.get_move(KEY) == 0x1234
+
+
+def test_probe_rejects_a_different_key_in_the_same_slot(table):
+    table.store(KEY, 4, EXACT, 1.0, 0x1234)
+    other_key = KEY + table.num_entries
+    assert other_key & table.index_mask == KEY & table.index_mask
+    assert table.probe(other_key) is None
+    assert table.get_move(other_key) == TranspositionTable.NO_MOVE
+
+
+@pytest.mark.parametrize("bound", [EXACT, LOWER_BOUND, UPPER_BOUND])
+def test_bound_types_round_trip(table, bound):
+    table.store(KEY, 3, bound, -7.0)
+    assert table.probe(KEY)[1] == bound
+
+
+def test_shallower_result_does_not_replace_deeper_entry_of_the_same_search(table):
+    table.store(KEY, 6, LOWER_BOUND, 5.0, 0x1111)
+    table.store(KEY, 2, UPPER_BOUND, -3.0, 0x2222)
+    assert table.probe(KEY) == (6, LOWER_BOUND, 5.0, 0x1111)
+
+
+def test_shallower_exact_score_replaces_a_deeper_bound(table):
+    table.store(KEY, 6, LOWER_BOUND, 5.0, 0x1111)
+    table.store(KEY, 2, EXACT, 4.0, 0x2222)
+    assert table.probe(KEY) == (2, EXACT, 4.0, 0x2222)
+
+
+def test_deeper_result_replaces_entry(table):
+    table.store(KEY, 2, EXACT, 1.0, 0x1111)
+    table.store(KEY, 5, UPPER_BOUND, -1.0, 0x2222)
+    assert table.probe(KEY) == (5, UPPER_BOUND, -1.0, 0x2222)
+
+
+def test_entries_of_an_earlier_search_are_replaced(table):
+    table.store(KEY, 8, EXACT, 1.0, 0x1111)
+    other_key = KEY + table.num_entries
+    table.store(other_key, 1, EXACT, 2.0, 0x2222)
+    assert table.probe(KEY) is not None  # deeper entry of the same search kept
+
+    table.new_search()
+    table.store(other_key, 1, EXACT, 2.0, 0x2222)
+    assert table.probe(KEY) is None
+    assert table.probe(other_key) == (1, EXACT, 2.0, 0x2222)
+
+
+def test_best_move_is_kept_when_none_is_stored(table):
+    table.store(KEY, 2, EXACT, 1.0, 0x1111)
+    table.store(KEY, 3, UPPER_BOUND, -1.0)
+    assert table.probe(KEY) == (3, UPPER_BOUND, -1.0, 0x1111)
+
+
+def test_clear_empties_the_table(table):
+    table.store(KEY, 2, EXACT, 1.0, 0x1111)
+    table.new_search()
+    table.clear()
+    assert table.probe(KEY) is None
+    assert table.age == 0
+
+
+@pytest.mark.parametrize("ply", [0, 1, 7])
+def test_mate_scores_are_stored_relative_to_the_node(ply):
+    # Mate in 'distance' plies from the root, found at a node 'ply' deep
+    distance = ply + 3
+    for score in (MATE_SCORE - distance, -MATE_SCORE + distance):
+        stored = AlphaBetaAgent._score_to_tt(score, ply)
+        # Relative to the node, the mate is (distance - ply) plies away
+        assert abs(stored) == MATE_SCORE - (distance - ply)
+        assert AlphaBetaAgent._score_from_tt(stored, ply) == score
+        # Read back at another ply, the distance from that root changes
+        assert abs(AlphaBetaAgent._score_from_tt(stored, ply + 2)) == abs(score) - 2
+
+
+def test_normal_scores_are_not_adjusted():
+    for score in (0, 12.5, -MATE_THRESHOLD + 1):
+        assert AlphaBetaAgent._score_to_tt(score, 5) == score
+        assert AlphaBetaAgent._score_from_tt(score, 5) == score
+
+
+def test_new_game_clears_the_agent_tables():
+    agent = AlphaBetaAgent()
+    agent.transposition_table.store(KEY, 2, EXACT, 1.0, 0x1111)
+    agent.move_orderer.history[1][10] = 50
+    agent.new_game()
+    assert agent.transposition_table.probe(KEY) is None
+    assert agent.move_orderer.history[1][10] == 0
@@ -0,0 +1,56 @@
+import time
+
+from src.agent.alpha_beta import AlphaBetaAgent
+from src.core.Board.board import Board
+from src.tools.search_bench import BENCHMARK_POSITIONS
+from src.ui.agent_vs_human_gui import VisualizationAlphaBetaAgent
+
+
+def _choose_move(agent, fen):
+    board = Board.create_board(fen)
+    move = agent.choose_move(board)
+    return board, move
+
+
+def test_time_limit_is_respected():
+    fen = dict(BENCHMARK_POSITIONS)["position6"]
+    updates = []
+    agent = VisualizationAlphaBetaAgent(
+        max_depth=5,
+        time_limit=0.2,
+        update_callback=lambda *update: updates.append(update),
+    )
+
+    start_time = time.perf_counter()
+    _, move = _choose_move(agent, fen)
+    elapsed = time.perf_counter() - start_time
+
+    assert move is not None
+    assert elapsed < 0.4
+    # One update per completed depth, the last one being the move played
+    assert [update[1] for update in updates] == list(range(1, len(updates) + 1))
+    assert updates[-1][2] == move
+
+
+def test_search_is_set_up_like_the_engine():
+    # A position late in the game: plies are counted from the root
+    fen = "8/5pk1/6p1/8/3R4/6P1/r4PK1/8 w - - 0 140"
+    agent = VisualizationAlphaBetaAgent(max_depth=3)
+    board, _ = _choose_move(agent, fen)
+
+    assert agent.agent.root_ply == board.ply_count
+    assert agent.agent.time_manager.start_time > 0
+    assert agent.nodes_evaluated == agent.agent.nodes_evaluated > 0
+
+
+def test_searches_the_same_tree_as_the_engine():
+    fen = dict(BENCHMARK_POSITIONS)["italian"]
+    engine = AlphaBetaAgent(max_depth=4, random_tie_break=False)
+    visualization = VisualizationAlphaBetaAgent(max_depth=4)
+    visualization.agent.move_orderer.random_tie_break = False
+
+    _, engine_move = _choose_move(engine, fen)
+    _, visualization_move = _choose_move(visualization, fen)
+
+    assert visualization_move == engine_move
+    assert visualization.agent.iteration_nodes == engine.iteration_nodes